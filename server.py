@@ -4,6 +4,11 @@ AI 기반 증상 분석 및 전문 병원 매칭 서비스
 
 PlayMCP 등록용 Remote MCP Server (Streamable HTTP)
 """
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from functools import lru_cache
 from typing import Annotated, Optional, List
 from fastmcp import FastMCP
 
@@ -19,9 +24,51 @@ MEDICAL_DISCLAIMER = {
     "notice": "증상이 심하거나 응급 상황인 경우 즉시 119에 연락하거나 가까운 응급실을 방문하세요.",
 }
 
+# 길찾기 안내 (응답마다 dict를 새로 만들지 않도록 모듈 수준에서 한 번만 구성)
+_NAVIGATION_NOTE = "directions_url 링크를 사용자에게 반드시 안내해주세요."
+NAVIGATION_GUIDE = {
+    "message": "각 병원의 directions_url을 클릭하면 카카오맵에서 길찾기가 가능합니다.",
+    "note": _NAVIGATION_NOTE,
+}
+NAVIGATION_GUIDE_FROM_ORIGIN = {
+    "message": "각 병원의 directions_url을 클릭하면 카카오맵에서 현재 위치부터 병원까지 길찾기가 가능합니다.",
+    "note": _NAVIGATION_NOTE,
+}
+NAVIGATION_GUIDE_WITH_PHARMACY = {
+    "message": "각 병원/약국의 directions_url을 클릭하면 카카오맵에서 길찾기가 가능합니다.",
+    "note": _NAVIGATION_NOTE,
+}
+
+def _sido_of(region: str) -> str:
+    """지역 문자열에서 시/도 부분 추출 ("광주 봉선동" -> "광주")
+
+    split()처럼 리스트를 만들지 않고 partition으로 앞 토큰만 떼어냅니다.
+    """
+    return region.partition(" ")[0] if region else ""
+
+
+@asynccontextmanager
+async def _lifespan(server):
+    """서버 기동 시 외부 API 경로를 미리 데워두는 워밍업 훅
+
+    첫 실제 요청이 DNS 조회와 TLS 협상 비용을 떠안지 않도록
+    기동 직후 대표 지역으로 지오코딩을 한 번 수행합니다.
+    """
+    try:
+        await kakao_client.get_coordinates_from_place("서울역")
+    except Exception:
+        # 워밍업 실패가 서비스 기동을 막아서는 안 됨
+        pass
+    yield
+    # 종료 시 공유 HTTP 커넥션 풀 정리
+    await kakao_client.aclose()
+    await hospital_client.aclose()
+
+
 # MCP 서버 인스턴스 생성
 mcp = FastMCP(
     name="MediMatch",
+    lifespan=_lifespan,
     instructions="""
     MediMatch는 AI 기반 증상 분석 및 전문 병원 매칭 서비스입니다.
 
@@ -169,10 +216,7 @@ async def search_hospitals(
             "current_page": page,
             "hospitals": result["hospitals"],
             "tip": "병원 상세 정보나 경로 안내가 필요하시면 카카오맵 MCP를 활용해보세요.",
-            "navigation_guide": {
-                "message": "각 병원의 directions_url을 클릭하면 카카오맵에서 길찾기가 가능합니다.",
-                "note": "directions_url 링크를 사용자에게 반드시 안내해주세요.",
-            },
+            "navigation_guide": NAVIGATION_GUIDE,
         }
     else:
         return result
@@ -289,21 +333,18 @@ async def find_specialist_hospital(
                     hospitals = kakao_result.get("hospitals", [])
 
             # 길찾기 URL 추가
+            make_directions = kakao_client.make_directions_builder(x, y)
             for hospital in hospitals:
                 coords = hospital.get("coordinates", {})
                 if coords.get("x") and coords.get("y"):
-                    hospital["directions_url"] = kakao_client.generate_directions_url(
-                        dest_name=hospital.get("name", ""),
-                        dest_x=coords["x"],
-                        dest_y=coords["y"],
-                        origin_x=x,
-                        origin_y=y,
+                    hospital["directions_url"] = make_directions(
+                        hospital.get("name", ""), coords["x"], coords["y"]
                     )
 
             # 카카오맵에서 결과가 없으면 공공데이터 API도 시도
             if not hospitals:
                 # 시도 이름 추출 (광주 봉선동 -> 광주)
-                sido_name = region.split()[0] if " " in region else region
+                sido_name = _sido_of(region)
                 if sido_name in SIDO_CODES:
                     public_result = await hospital_client.search_hospitals(
                         department=primary_department,
@@ -315,7 +356,7 @@ async def find_specialist_hospital(
                         hospitals = public_result.get("hospitals", [])
         else:
             # 지역 좌표 변환 실패 시 시도 코드로 검색
-            sido_name = region.split()[0] if " " in region else region
+            sido_name = _sido_of(region)
             if sido_name in SIDO_CODES:
                 public_result = await hospital_client.search_hospitals(
                     department=primary_department,
@@ -338,7 +379,9 @@ async def find_specialist_hospital(
 
     # 4. 전문 분야 기준으로 병원 우선순위 재정렬 (새로운 기능!)
     if specialty_info["has_specialty"] and hospitals:
-        hospitals = symptom_analyzer.rank_hospitals_by_specialty(hospitals, specialty_info)
+        hospitals = symptom_analyzer.rank_hospitals_by_specialty(
+            hospitals, specialty_info, top_k=limit
+        )
 
     # 결과 수 제한
     hospitals = hospitals[:limit]
@@ -412,10 +455,7 @@ async def find_specialist_hospital(
     }
 
     # 길찾기 안내 추가
-    response["navigation_guide"] = {
-        "message": "각 병원의 directions_url을 클릭하면 카카오맵에서 현재 위치부터 병원까지 길찾기가 가능합니다.",
-        "note": "directions_url 링크를 사용자에게 반드시 안내해주세요.",
-    }
+    response["navigation_guide"] = NAVIGATION_GUIDE_FROM_ORIGIN
 
     # 의료 면책 조항 추가
     response["disclaimer"] = MEDICAL_DISCLAIMER
@@ -423,13 +463,11 @@ async def find_specialist_hospital(
     return response
 
 
-@mcp.tool
-async def get_available_departments() -> dict:
-    """
-    검색 가능한 모든 진료과목 목록을 반환합니다.
-    """
+# 진료과목/지역 카탈로그 (정적 정보라 import 시 한 번만 구성)
+_DEPARTMENT_CATALOG = {
+    "total_departments": len(DEPARTMENT_CODES),
     # 카테고리별로 그룹화
-    categories = {
+    "categories": {
         "일반 진료과": ["내과", "외과", "가정의학과", "응급의학과"],
         "전문 진료과": [
             "신경과", "정신건강의학과", "정형외과", "신경외과",
@@ -449,13 +487,22 @@ async def get_available_departments() -> dict:
             "한방내과", "한방부인과", "한방소아과",
             "침구과", "한방재활의학과"
         ],
-    }
+    },
+    "all_departments": list(DEPARTMENT_CODES.keys()),
+}
 
-    return {
-        "total_departments": len(DEPARTMENT_CODES),
-        "categories": categories,
-        "all_departments": list(DEPARTMENT_CODES.keys()),
-    }
+_REGION_CATALOG = {
+    "regions": list(SIDO_CODES.keys()),
+    "total": len(SIDO_CODES),
+}
+
+
+@mcp.tool
+async def get_available_departments() -> dict:
+    """
+    검색 가능한 모든 진료과목 목록을 반환합니다.
+    """
+    return _DEPARTMENT_CATALOG
 
 
 @mcp.tool
@@ -463,10 +510,7 @@ async def get_available_regions() -> dict:
     """
     검색 가능한 지역(시/도) 목록을 반환합니다.
     """
-    return {
-        "regions": list(SIDO_CODES.keys()),
-        "total": len(SIDO_CODES),
-    }
+    return _REGION_CATALOG
 
 
 @mcp.tool
@@ -495,15 +539,12 @@ async def search_nearby_hospitals(
         hospitals = result.get("hospitals", [])
 
         # 길찾기 URL 추가
+        make_directions = kakao_client.make_directions_builder(x, y)
         for hospital in hospitals:
             coords = hospital.get("coordinates", {})
             if coords.get("x") and coords.get("y"):
-                hospital["directions_url"] = kakao_client.generate_directions_url(
-                    dest_name=hospital.get("name", ""),
-                    dest_x=coords["x"],
-                    dest_y=coords["y"],
-                    origin_x=x,
-                    origin_y=y,
+                hospital["directions_url"] = make_directions(
+                    hospital.get("name", ""), coords["x"], coords["y"]
                 )
 
         return {
@@ -514,10 +555,7 @@ async def search_nearby_hospitals(
             "total_count": len(hospitals),
             "hospitals": hospitals,
             "tip": "카카오맵 URL을 클릭하면 병원 상세 정보와 리뷰를 확인할 수 있습니다.",
-            "navigation_guide": {
-                "message": "각 병원의 directions_url을 클릭하면 카카오맵에서 길찾기가 가능합니다.",
-                "note": "directions_url 링크를 사용자에게 반드시 안내해주세요.",
-            },
+            "navigation_guide": NAVIGATION_GUIDE,
         }
 
     return result
@@ -575,15 +613,12 @@ async def search_hospitals_near_place(
                 radius = 10000
 
         # 길찾기 URL 추가
+        make_directions = kakao_client.make_directions_builder(x, y)
         for hospital in hospitals:
             coords = hospital.get("coordinates", {})
             if coords.get("x") and coords.get("y"):
-                hospital["directions_url"] = kakao_client.generate_directions_url(
-                    dest_name=hospital.get("name", ""),
-                    dest_x=coords["x"],
-                    dest_y=coords["y"],
-                    origin_x=x,
-                    origin_y=y,
+                hospital["directions_url"] = make_directions(
+                    hospital.get("name", ""), coords["x"], coords["y"]
                 )
 
         return {
@@ -599,10 +634,7 @@ async def search_hospitals_near_place(
             "total_count": len(hospitals),
             "hospitals": hospitals,
             "tip": "카카오맵 URL을 클릭하면 병원 상세 정보와 리뷰를 확인할 수 있습니다.",
-            "navigation_guide": {
-                "message": "각 병원의 directions_url을 클릭하면 카카오맵에서 길찾기가 가능합니다.",
-                "note": "directions_url 링크를 사용자에게 반드시 안내해주세요.",
-            },
+            "navigation_guide": NAVIGATION_GUIDE,
         }
 
     return result
@@ -620,70 +652,60 @@ async def search_nearby_with_pharmacy_by_place(
     전국 어디든 장소명을 입력하면 주변 병원과 약국을 함께 찾아드립니다.
     예시: "홍대 근처 병원이랑 약국", "광주 첨단 피부과랑 약국"
     """
-    # 장소명 → 좌표 변환
-    location = await kakao_client.get_coordinates_from_place(place)
-
-    if not location["success"]:
-        return {
-            "success": False,
-            "error": location.get("error", f"'{place}'의 위치를 찾을 수 없습니다."),
-            "tried_queries": location.get("tried_queries", []),
-            "suggestion": location.get("suggestion", "더 구체적인 장소명을 입력해주세요."),
-            "examples": ["홍대입구역", "강남역", "광주 첨단", "부산 서면"],
-        }
-
-    x, y = location["x"], location["y"]
     radius = min(radius, 20000)
 
-    result = await hospital_client.search_nearby_with_pharmacy(
-        x=x,
-        y=y,
-        radius=radius,
+    # 지오코딩 후 병원/약국 검색을 동시에 실행하는 통합 경로
+    result = await kakao_client.find_medical_nearby(
+        place_name=place,
+        radius_hospital=radius,
+        radius_pharmacy=min(radius, 2000),  # 약국은 더 가까운 반경
         department=department,
     )
 
-    if result["success"]:
-        hospitals = result.get("hospitals", [])
-        pharmacies = result.get("pharmacies", [])
-
-        # 길찾기 URL 추가
-        for item in hospitals + pharmacies:
-            coords = item.get("coordinates", {})
-            if coords.get("x") and coords.get("y"):
-                item["directions_url"] = kakao_client.generate_directions_url(
-                    dest_name=item.get("name", ""),
-                    dest_x=coords["x"],
-                    dest_y=coords["y"],
-                    origin_x=x,
-                    origin_y=y,
-                )
-
+    if not result["success"]:
         return {
-            "success": True,
-            "search_location": {
-                "query": place,
-                "resolved_name": location.get("place_name", place),
-                "address": location.get("address", ""),
-                "coordinates": {"x": x, "y": y},
-            },
-            "radius": radius,
-            "department": department,
-            "hospitals": {
-                "count": len(hospitals),
-                "list": hospitals,
-            },
-            "pharmacies": {
-                "count": len(pharmacies),
-                "list": pharmacies,
-            },
-            "tip": "진료 후 가까운 약국에서 처방전을 받으세요.",
-            "navigation_guide": {
-                "message": "각 병원/약국의 directions_url을 클릭하면 카카오맵에서 길찾기가 가능합니다.",
-                "note": "directions_url 링크를 사용자에게 반드시 안내해주세요.",
-            },
+            "success": False,
+            "error": result.get("error", f"'{place}'의 위치를 찾을 수 없습니다."),
+            "tried_queries": result.get("tried_queries", []),
+            "suggestion": result.get("suggestion") or "더 구체적인 장소명을 입력해주세요.",
+            "examples": ["홍대입구역", "강남역", "광주 첨단", "부산 서면"],
         }
 
-    return result
+    x = result["location"]["x"]
+    y = result["location"]["y"]
+    hospitals = result.get("hospitals", [])
+    pharmacies = result.get("pharmacies", [])
+
+    # 길찾기 URL 추가
+    make_directions = kakao_client.make_directions_builder(x, y)
+    for item in hospitals + pharmacies:
+        coords = item.get("coordinates", {})
+        if coords.get("x") and coords.get("y"):
+            item["directions_url"] = make_directions(
+                item.get("name", ""), coords["x"], coords["y"]
+            )
+
+    return {
+        "success": True,
+        "search_location": {
+            "query": place,
+            "resolved_name": result.get("place_name", place),
+            "address": result.get("address", ""),
+            "coordinates": {"x": x, "y": y},
+        },
+        "radius": radius,
+        "department": department,
+        "hospitals": {
+            "count": len(hospitals),
+            "list": hospitals,
+        },
+        "pharmacies": {
+            "count": len(pharmacies),
+            "list": pharmacies,
+        },
+        "tip": "진료 후 가까운 약국에서 처방전을 받으세요.",
+        "navigation_guide": NAVIGATION_GUIDE_WITH_PHARMACY,
+    }
 
 
 @mcp.tool
@@ -710,15 +732,12 @@ async def search_nearby_with_pharmacy(
         pharmacies = result.get("pharmacies", [])
 
         # 길찾기 URL 추가
+        make_directions = kakao_client.make_directions_builder(x, y)
         for place in hospitals + pharmacies:
             coords = place.get("coordinates", {})
             if coords.get("x") and coords.get("y"):
-                place["directions_url"] = kakao_client.generate_directions_url(
-                    dest_name=place.get("name", ""),
-                    dest_x=coords["x"],
-                    dest_y=coords["y"],
-                    origin_x=x,
-                    origin_y=y,
+                place["directions_url"] = make_directions(
+                    place.get("name", ""), coords["x"], coords["y"]
                 )
 
         return {
@@ -735,10 +754,7 @@ async def search_nearby_with_pharmacy(
                 "list": pharmacies,
             },
             "tip": "진료 후 가까운 약국에서 처방전을 받으세요.",
-            "navigation_guide": {
-                "message": "각 병원/약국의 directions_url을 클릭하면 카카오맵에서 길찾기가 가능합니다.",
-                "note": "directions_url 링크를 사용자에게 반드시 안내해주세요.",
-            },
+            "navigation_guide": NAVIGATION_GUIDE_WITH_PHARMACY,
         }
 
     return result
@@ -782,33 +798,288 @@ async def search_specialist_with_kakao(
     return result
 
 
+# batch 도구로 호출할 수 있는 도구 테이블
+BATCH_TOOL_REGISTRY = {
+    "analyze_symptoms": analyze_symptoms,
+    "search_hospitals": search_hospitals,
+    "find_specialist_hospital": find_specialist_hospital,
+    "get_available_departments": get_available_departments,
+    "get_available_regions": get_available_regions,
+    "search_nearby_hospitals": search_nearby_hospitals,
+    "search_hospitals_near_place": search_hospitals_near_place,
+    "search_nearby_with_pharmacy_by_place": search_nearby_with_pharmacy_by_place,
+    "search_nearby_with_pharmacy": search_nearby_with_pharmacy,
+    "search_specialist_with_kakao": search_specialist_with_kakao,
+}
+
+# 한 번의 batch 호출로 실행 가능한 최대 요청 수 / 요청별 제한 시간
+BATCH_MAX_REQUESTS = 10
+BATCH_ITEM_TIMEOUT_SECONDS = 5.0
+
+
+@mcp.tool
+async def batch(
+    requests: Annotated[List[dict], '실행할 요청 목록. 각 항목은 {"tool": 도구명, "args": 인자 dict} 형식 (최대 10개)']
+) -> dict:
+    """
+    여러 검색/분석 요청을 한 번의 호출로 동시에 실행합니다.
+
+    증상 분석 + 병원 검색 + 약국 검색처럼 독립적인 요청들을
+    왕복 한 번으로 처리하고 싶을 때 사용하세요.
+
+    예: [{"tool": "analyze_symptoms", "args": {"symptoms": "허리가 아파요"}},
+         {"tool": "search_hospitals", "args": {"department": "정형외과", "region": "서울"}}]
+    """
+    if not requests:
+        return {"success": False, "error": "요청 목록이 비어 있습니다."}
+
+    if len(requests) > BATCH_MAX_REQUESTS:
+        return {
+            "success": False,
+            "error": f"요청은 한 번에 최대 {BATCH_MAX_REQUESTS}개까지 가능합니다.",
+        }
+
+    async def run_one(req: dict) -> dict:
+        tool_name = req.get("tool")
+        tool = BATCH_TOOL_REGISTRY.get(tool_name)
+        if tool is None:
+            return {
+                "success": False,
+                "error": f"'{tool_name}'은(는) 알 수 없는 도구입니다.",
+                "available_tools": list(BATCH_TOOL_REGISTRY),
+            }
+        try:
+            return await asyncio.wait_for(
+                tool(**req.get("args", {})),
+                timeout=BATCH_ITEM_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            return {"success": False, "error": f"'{tool_name}' 요청이 시간 초과되었습니다."}
+        except TypeError as e:
+            return {"success": False, "error": f"'{tool_name}' 인자 오류: {str(e)}"}
+
+    results = await asyncio.gather(*(run_one(r) for r in requests))
+
+    return {
+        "success": True,
+        "count": len(results),
+        "results": results,
+    }
+
+
 # 헬스체크 엔드포인트 추가 (UptimeRobot 모니터링용)
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSONResponse
+
+    한글 텍스트가 많은 응답에서 stdlib json보다 수 배 빠르고,
+    유니코드를 불필요하게 이스케이프하지 않아 페이로드도 작습니다.
+    orjson이 없으면 stdlib 직렬화로 동작합니다.
+    """
+
+    # 비문자열 키 허용: 응답 조립 중 섞일 수 있는 숫자 키에도 안전하다
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+    def render(self, content) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=self._ORJSON_OPTS)
+        return super().render(content)
+
 
 # ============================================
 # 카카오 i 오픈빌더 스킬 서버 엔드포인트
 # ============================================
 
 # 세션별 검색 결과 캐시 (다른 병원 추천 기능용)
-# key: user_id, value: {"region": str, "department": str, "shown_ids": set, "location": dict, "last_recommendation": dict}
-from collections import defaultdict
+# key: user_id, value: SessionState
+import heapq
+import os
 import time
+from dataclasses import dataclass, field
 
-search_session_cache = defaultdict(lambda: {
-    "region": None,
-    "department": None,
-    "shown_ids": set(),
-    "location": None,
-    "last_updated": 0,
-    "last_recommendation": None,  # 마지막 추천 정보 (이유 설명용)
-})
+search_session_cache: dict = {}
 
 # 캐시 만료 시간 (30분)
 CACHE_EXPIRY_SECONDS = 1800
 
+# 세션 캐시 최대 항목 수: 트래픽이 몰려도 메모리 상한을 보장한다.
+SESSION_CACHE_MAX = int(os.getenv("SESSION_CACHE_MAX", "10000"))
+
+# 만료 정리용 최소 힙: (접근 시각, user_id)
+# 같은 사용자가 다시 접근하면 _session_last_seen이 갱신되어
+# 힙에 남은 옛 항목은 정리 시 무시됩니다 (lazy invalidation).
+_session_heap: list = []
+_session_last_seen: dict = {}
+
+
+# 병원 ID 문자열 → 작은 정수 인터닝 테이블
+# shown_ids를 문자열 집합 대신 정수 집합으로 유지해 세션당 메모리와
+# 해시 비용을 줄입니다 (같은 병원이 여러 사용자 세션에 반복 등장).
+_HOSPITAL_ID_REGISTRY: dict = {}
+
+
+def _intern_hospital_id(hospital_id: str) -> int:
+    """병원 ID를 레지스트리의 정수 핸들로 변환 (없으면 등록)"""
+    hid = _HOSPITAL_ID_REGISTRY.get(hospital_id)
+    if hid is None:
+        hid = _HOSPITAL_ID_REGISTRY[hospital_id] = len(_HOSPITAL_ID_REGISTRY)
+    return hid
+
+
+# 세션당 노출 병원 ID 기억 상한: 아주 긴 세션에서도 메모리가
+# 무한정 자라지 않도록 하고, 상한 이후에는 중복 노출을 허용한다.
+SHOWN_IDS_MAX = 512
+
+
+def _remember_shown(session: "SessionState", hospital_id: str) -> None:
+    """노출한 병원 ID를 세션에 기록 (상한 도달 시 추가 중단)"""
+    if len(session.shown_ids) < SHOWN_IDS_MAX:
+        session.shown_ids.add(_intern_hospital_id(hospital_id))
+
+
+@dataclass(slots=True)
+class SessionState:
+    """사용자별 검색 세션 상태"""
+    region: Optional[str] = None
+    department: Optional[str] = None
+    shown_ids: set = field(default_factory=set)
+    location: Optional[dict] = None
+    last_updated: float = 0.0
+    last_recommendation: Optional[dict] = None  # 마지막 추천 정보 (이유 설명용)
+
+    def reset(self) -> None:
+        """만료된 세션을 새 객체 할당 없이 제자리에서 초기화"""
+        self.region = None
+        self.department = None
+        self.shown_ids.clear()
+        self.location = None
+        self.last_updated = 0.0
+        self.last_recommendation = None
+
+
+def get_session(user_id: str) -> SessionState:
+    """사용자 세션 조회 (없으면 생성)"""
+    session = search_session_cache.get(user_id)
+    if session is None:
+        session = search_session_cache[user_id] = SessionState()
+    return session
+
+
+def _touch_session(user_id: str, current_time: float) -> None:
+    """세션 접근 시각을 기록하고 만료된 세션을 힙 순서대로 정리
+
+    defaultdict 전체를 훑지 않고 가장 오래된 항목부터 O(log N)으로
+    제거하므로 장시간 운영 시 캐시가 무한정 자라지 않습니다.
+    """
+    heapq.heappush(_session_heap, (current_time, user_id))
+    _session_last_seen[user_id] = current_time
+
+    while _session_heap:
+        seen, uid = _session_heap[0]
+        # 만료 전이라도 캐시가 상한을 넘으면 가장 오래된 세션부터 밀어낸다
+        if (current_time - seen <= CACHE_EXPIRY_SECONDS
+                and len(search_session_cache) <= SESSION_CACHE_MAX):
+            break
+        heapq.heappop(_session_heap)
+        # 더 최근 접근 기록이 있으면 아직 살아있는 세션
+        if _session_last_seen.get(uid) == seen:
+            search_session_cache.pop(uid, None)
+            del _session_last_seen[uid]
+
+
+# 지역명 → 좌표 TTL 캐시
+# 지역 발화는 소수 인기 지역에 몰리므로 매 요청 지오코딩 왕복을 생략한다.
+_GEO_CACHE_TTL = 3600
+_GEO_CACHE_MAX = 1024
+_geo_cache: dict = {}      # region -> (저장 시각, 좌표 결과)
+_geo_inflight: dict = {}   # region -> Future (동시 미스 합치기용)
+
+
+async def _geocode_region(region: str) -> dict:
+    """지역명 좌표 조회 (TTL 캐시 + 동시 미스 single-flight)
+
+    같은 지역에 대한 동시 캐시 미스는 한 번의 API 호출로 합치고,
+    실패 응답은 캐시하지 않아 일시적 오류가 오래 남지 않습니다.
+    """
+    now = time.time()
+    entry = _geo_cache.get(region)
+    if entry and now - entry[0] < _GEO_CACHE_TTL:
+        return entry[1]
+
+    future = _geo_inflight.get(region)
+    if future is not None:
+        return await future
+
+    future = asyncio.get_running_loop().create_future()
+    _geo_inflight[region] = future
+    try:
+        location = await kakao_client.get_coordinates_from_place(region)
+        if location.get("success"):
+            if len(_geo_cache) >= _GEO_CACHE_MAX:
+                # 상한 도달 시 가장 오래된 항목 제거 (드물게 실행)
+                oldest = min(_geo_cache, key=lambda k: _geo_cache[k][0])
+                del _geo_cache[oldest]
+            _geo_cache[region] = (now, location)
+        future.set_result(location)
+        return location
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        del _geo_inflight[region]
+
+
+# 주변 병원 검색 결과 단기 캐시: 인기 지역에 요청이 몰릴 때
+# 같은 (좌표, 진료과) 조합의 동시/연속 호출을 업스트림 한 번으로 줄인다.
+_NEARBY_CACHE_TTL = 30
+_NEARBY_CACHE_MAX = 256
+_nearby_cache: dict = {}     # key -> (저장 시각, 결과)
+_nearby_inflight: dict = {}  # key -> Future (동시 미스 합치기용)
+
+
+async def _nearby_hospitals_shared(x, y, radius: int, department, size: int) -> dict:
+    """주변 병원 검색 (30초 결과 캐시 + single-flight)
+
+    반환된 결과 dict는 여러 요청이 공유하므로 호출부는 읽기만 해야 합니다.
+    """
+    key = (x, y, radius, department, size)
+    now = time.time()
+    entry = _nearby_cache.get(key)
+    if entry and now - entry[0] < _NEARBY_CACHE_TTL:
+        return entry[1]
+
+    future = _nearby_inflight.get(key)
+    if future is not None:
+        return await future
+
+    future = asyncio.get_running_loop().create_future()
+    _nearby_inflight[key] = future
+    try:
+        result = await kakao_client.get_nearby_hospitals(
+            x=x, y=y, radius=radius, department=department, size=size,
+        )
+        if result.get("success"):
+            if len(_nearby_cache) >= _NEARBY_CACHE_MAX:
+                oldest = min(_nearby_cache, key=lambda k: _nearby_cache[k][0])
+                del _nearby_cache[oldest]
+            _nearby_cache[key] = (now, result)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        del _nearby_inflight[key]
+
 
 # ============================================
 # 진료과목별 추천 이유 데이터베이스
@@ -882,6 +1153,36 @@ DEPARTMENT_REASONS = {
     },
 }
 
+# (증상 부위, 진료과) -> 추천 이유 평탄화 테이블 (정확 매칭용 단일 조회)
+_REASON_LOOKUP = {
+    (area, dept): reason
+    for area, reasons in DEPARTMENT_REASONS.items()
+    for dept, reason in reasons.items()
+}
+
+# 진료과별 기본 설명 (부위 매칭이 없을 때의 폴백)
+# 직렬화되지 않고 조회만 하므로 읽기 전용 뷰로 고정한다.
+_DEFAULT_REASONS = MappingProxyType({
+    "내과": "내장 기관 관련 질환 진료",
+    "외과": "수술적 치료가 필요한 질환",
+    "정형외과": "뼈, 관절, 근육, 인대 질환",
+    "신경과": "신경계 질환 진료",
+    "피부과": "피부 질환 전문 진료",
+    "이비인후과": "귀, 코, 목 질환 진료",
+    "안과": "눈 관련 질환 진료",
+    "산부인과": "여성 질환 및 임신 관련",
+    "비뇨의학과": "비뇨기 및 남성 질환",
+    "정신건강의학과": "정신건강 및 심리 질환",
+    "재활의학과": "재활 치료 및 만성 통증",
+})
+
+# 부위/진료과 문자열 인터닝: 정규식 매치가 만들어내는 새 문자열을
+# 테이블 키와 같은 객체로 만들면 dict 조회가 동일성 비교로 끝난다.
+for _area, _reasons in DEPARTMENT_REASONS.items():
+    sys.intern(_area)
+    for _dept in _reasons:
+        sys.intern(_dept)
+
 # 증상-진료과목 연결 설명
 SYMPTOM_DEPARTMENT_EXPLANATIONS = {
     ("배", "정형외과"): "배 통증이 항상 소화기 문제만은 아니에요. 허리 디스크나 척추 문제가 있으면 신경이 눌려서 복부로 통증이 전달될 수 있어요. 특히 자세를 바꿀 때 통증이 변하면 척추 문제일 가능성이 있어요.",
@@ -1089,13 +1390,16 @@ DISEASE_INFO_DATABASE = {
 }
 
 
+@lru_cache(maxsize=256)
 def get_department_reason(symptom_area: str, department: str) -> str:
-    """특정 증상에 대해 해당 진료과목을 추천하는 이유 반환"""
-    # 정확한 매칭 시도
-    if symptom_area in DEPARTMENT_REASONS:
-        reasons = DEPARTMENT_REASONS[symptom_area]
-        if department in reasons:
-            return reasons[department]
+    """특정 증상에 대해 해당 진료과목을 추천하는 이유 반환
+
+    (symptom_area, department) 조합이 한정돼 있어 결과를 캐시한다.
+    """
+    # 정확한 매칭 시도 (평탄화 테이블 단일 조회)
+    hit = _REASON_LOOKUP.get((symptom_area, department))
+    if hit:
+        return hit
 
     # 부분 매칭 시도
     for area, reasons in DEPARTMENT_REASONS.items():
@@ -1104,27 +1408,15 @@ def get_department_reason(symptom_area: str, department: str) -> str:
                 return reasons[department]
 
     # 기본 설명
-    default_reasons = {
-        "내과": "내장 기관 관련 질환 진료",
-        "외과": "수술적 치료가 필요한 질환",
-        "정형외과": "뼈, 관절, 근육, 인대 질환",
-        "신경과": "신경계 질환 진료",
-        "피부과": "피부 질환 전문 진료",
-        "이비인후과": "귀, 코, 목 질환 진료",
-        "안과": "눈 관련 질환 진료",
-        "산부인과": "여성 질환 및 임신 관련",
-        "비뇨의학과": "비뇨기 및 남성 질환",
-        "정신건강의학과": "정신건강 및 심리 질환",
-        "재활의학과": "재활 치료 및 만성 통증",
-    }
-    return default_reasons.get(department, f"{department} 전문 진료")
+    return _DEFAULT_REASONS.get(department, f"{department} 전문 진료")
 
 
+@lru_cache(maxsize=256)
 def get_why_explanation(symptom_area: str, department: str) -> str:
     """'왜 OO과?' 질문에 대한 상세 설명 반환"""
-    key = (symptom_area, department)
-    if key in SYMPTOM_DEPARTMENT_EXPLANATIONS:
-        return SYMPTOM_DEPARTMENT_EXPLANATIONS[key]
+    explanation = SYMPTOM_DEPARTMENT_EXPLANATIONS.get((symptom_area, department))
+    if explanation:
+        return explanation
 
     reason = get_department_reason(symptom_area, department)
     return f"{department}를 추천드린 이유는 {reason} 때문이에요."
@@ -1137,13 +1429,144 @@ def get_user_id_from_request(body: dict) -> str:
     return user.get("id", "anonymous")
 
 
+# 응답 텍스트 잘림 표시 (재사용 상수)
+_ELLIPSIS = "..."
+
+# 정적 응답에서 반복 사용하는 quickReplies (이미 최종 형태, tuple이면
+# 응답 빌더가 변환 없이 그대로 붙인다)
+_QR_SYMPTOM_OR_HELP = (
+    {"label": "증상 말하기", "action": "message", "messageText": "배가 아파요"},
+    {"label": "도움말", "action": "message", "messageText": "도움말"},
+)
+_QR_MORE_HOSPITALS = (
+    {"label": "다른 병원 더 보기", "action": "message", "messageText": "다른 병원 추천해줘"},
+)
+
+# 자주 쓰는 응답 템플릿 (지역명 등만 바뀌는 고정 문구)
+_MSG_REGION_NOT_FOUND = (
+    "'{region}'의 위치를 찾을 수 없어요.\n"
+    "더 구체적인 지역명을 입력해주세요.\n\n"
+    "예: 강남역, 홍대입구, 부산 서면"
+)
+_MSG_NO_PHARMACY = "{region} 주변에서 약국을 찾지 못했어요."
+_MSG_NO_HOSPITAL = (
+    "{region} 주변에서 {department}를 찾지 못했어요.\n"
+    "검색 범위를 넓혀서 다시 찾아볼까요?"
+)
+
+# 병원 카드 공용 썸네일 (내용이 항상 같아 카드마다 새로 만들지 않는다)
+_CARD_THUMBNAIL = {
+    "imageUrl": "https://t1.kakaocdn.net/openbuilder/sample/img_005.jpg"
+}
+
+# 카드 버튼 공통 골격 (루프 안에서는 webLinkUrl만 덧붙인다)
+_MAP_BTN = {"label": "카카오맵 보기", "action": "webLink"}
+_DIR_BTN = {"label": "길찾기", "action": "webLink"}
+
+
+def _build_hospital_card(
+    h: dict,
+    origin_x,
+    origin_y,
+    *,
+    addr_prefix: str = "주소: ",
+    phone_prefix: str = "전화: ",
+    include_thumbnail: bool = True,
+) -> dict:
+    """병원 dict 하나를 카카오 캐러셀 카드로 변환
+
+    증상 분석/병원 검색/다른 병원 추천 세 경로가 같은 카드를 만들던
+    중복 루프를 합친 공용 빌더입니다. 경로별 차이(설명 접두어,
+    썸네일 유무)는 키워드 인자로 유지합니다.
+    """
+    name = h.get("name", "")
+    title = name if name else "병원 정보"
+
+    address = h.get("road_address") or h.get("address") or ""
+    phone = h.get("phone") or ""
+    description_parts = []
+    if address:
+        description_parts.append(f"{addr_prefix}{address}")
+    if phone:
+        description_parts.append(f"{phone_prefix}{phone}")
+    description = "\n".join(description_parts) if description_parts else "상세정보 없음"
+
+    coords = h.get("coordinates") or {}
+    x = coords.get("x")
+    y = coords.get("y")
+    has_xy = bool(name and x and y)
+
+    map_url = h.get("kakao_map_url")
+    if not map_url and has_xy:
+        map_url = kakao_client.generate_map_url(name, x, y)
+
+    directions_url = None
+    if has_xy:
+        directions_url = kakao_client.generate_directions_url(
+            dest_name=name,
+            dest_x=x,
+            dest_y=y,
+            origin_x=origin_x,
+            origin_y=origin_y,
+        )
+
+    card = {"title": title, "description": description}
+    if include_thumbnail:
+        card["thumbnail"] = _CARD_THUMBNAIL
+
+    buttons = []
+    if map_url:
+        buttons.append({**_MAP_BTN, "webLinkUrl": map_url})
+    if directions_url:
+        buttons.append({**_DIR_BTN, "webLinkUrl": directions_url})
+    if buttons:
+        card["buttons"] = buttons
+
+    return card
+
+
+def _build_cards(
+    hospitals: list,
+    limit: int,
+    origin_x,
+    origin_y,
+    cache: "SessionState",
+    *,
+    addr_prefix: str = "주소: ",
+    phone_prefix: str = "전화: ",
+    include_thumbnail: bool = True,
+    skip_nameless: bool = False,
+) -> list:
+    """병원 목록을 카드 목록으로 변환 (노출 ID 기록 포함)
+
+    카드 하나 만드는 일은 _build_hospital_card가, 목록 순회와 세션
+    shown_ids 기록은 이 함수가 맡아 핸들러별 중복 루프를 없앱니다.
+    """
+    cards = []
+    for h in hospitals[:limit]:
+        hospital_id = h.get("id")
+        if hospital_id:
+            _remember_shown(cache, hospital_id)
+        if skip_nameless and not h.get("name"):
+            continue
+        cards.append(_build_hospital_card(
+            h,
+            origin_x,
+            origin_y,
+            addr_prefix=addr_prefix,
+            phone_prefix=phone_prefix,
+            include_thumbnail=include_thumbnail,
+        ))
+    return cards
+
+
 def create_kakao_response(text: str, buttons: list = None, quick_replies: list = None) -> dict:
     """카카오 오픈빌더 응답 형식 생성"""
     outputs = []
 
     # 텍스트 응답 (최대 1000자)
     if len(text) > 1000:
-        text = text[:997] + "..."
+        text = text[:997] + _ELLIPSIS
 
     simple_text = {"simpleText": {"text": text}}
     outputs.append(simple_text)
@@ -1174,6 +1597,10 @@ def create_kakao_response(text: str, buttons: list = None, quick_replies: list =
 
     # 빠른 응답 추가
     if quick_replies:
+        if isinstance(quick_replies, tuple):
+            # 모듈 상수로 미리 최종 형태까지 변환해 둔 목록은 그대로 사용
+            response["template"]["quickReplies"] = quick_replies
+            return response
         response["template"]["quickReplies"] = [
             {
                 "label": qr.get("label", ""),
@@ -1204,6 +1631,10 @@ def create_kakao_cards_response(cards: list, quick_replies: list = None) -> dict
     }
 
     if quick_replies:
+        if isinstance(quick_replies, tuple):
+            # 모듈 상수로 미리 최종 형태까지 변환해 둔 목록은 그대로 사용
+            response["template"]["quickReplies"] = quick_replies
+            return response
         response["template"]["quickReplies"] = [
             {
                 "label": qr.get("label", ""),
@@ -1224,7 +1655,7 @@ def create_symptom_analysis_with_cards_response(
 
     # 1. 증상 분석 텍스트
     if len(text) > 1000:
-        text = text[:997] + "..."
+        text = text[:997] + _ELLIPSIS
     outputs.append({"simpleText": {"text": text}})
 
     # 2. 병원 카드 캐러셀
@@ -1245,6 +1676,10 @@ def create_symptom_analysis_with_cards_response(
     }
 
     if quick_replies:
+        if isinstance(quick_replies, tuple):
+            # 모듈 상수로 미리 최종 형태까지 변환해 둔 목록은 그대로 사용
+            response["template"]["quickReplies"] = quick_replies
+            return response
         response["template"]["quickReplies"] = [
             {
                 "label": qr.get("label", ""),
@@ -1257,136 +1692,477 @@ def create_symptom_analysis_with_cards_response(
     return response
 
 
+# ============================================
+# extract_intent용 정규식 (모듈 로드 시 1회 컴파일)
+# ============================================
+
+def _keywords_re(keywords) -> re.Pattern:
+    """키워드 목록을 '하나라도 포함되는지' 검사용 교대 패턴으로 컴파일"""
+    return re.compile(
+        "|".join(sorted(map(re.escape, keywords), key=len, reverse=True))
+    )
+
+
+# 지역 패턴
+_REGION_NAMES = (
+    "서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종", "경기", "강원",
+    "충북", "충남", "전북", "전남", "경북", "경남", "제주", "강남", "홍대", "신촌",
+    "서면", "해운대", "동성로", "판교", "분당", "첨단", "잠실", "여의도", "명동",
+    "종로", "신림", "사당", "왕십리", "건대", "혜화", "이태원", "영등포", "동대문",
+    "용산", "수원", "일산", "부천", "안양", "의정부", "평택", "송도", "부평",
+    "둔산", "유성", "수성구", "남포동", "센텀시티", "광안리", "상무", "충장로", "금남로",
+)
+REGION_RE = re.compile("({})".format("|".join(_REGION_NAMES)))
+# 지역명 첫 글자 집합: 메시지에 하나도 없으면 정규식 검색을 생략
+_REGION_FIRST_CHARS = frozenset(name[0] for name in _REGION_NAMES)
+
+# 진료과목 패턴 (확장)
+DEPT_RE = re.compile(r'(내과|외과|피부과|정형외과|이비인후과|안과|치과|산부인과|소아과|소아청소년과|신경과|신경외과|정신과|정신건강의학과|비뇨기과|비뇨의학과|재활의학과|가정의학과|흉부외과|성형외과|마취통증의학과|영상의학과|진단검사의학과|병리과|응급의학과|핵의학과|직업환경의학과|예방의학과|결핵과|한의원|한방|통증의학과)')
+
+# 추천 이유 질문 패턴 ("왜 정형외과?", "정형외과는 왜?" 등)
+WHY_PATTERNS = tuple(re.compile(p) for p in [
+    # "왜 정형외과?" 패턴
+    r'왜\s*(내과|외과|피부과|정형외과|이비인후과|안과|치과|산부인과|소아과|신경과|신경외과|정신과|비뇨기과|재활의학과|가정의학과|흉부외과)',
+    # "정형외과는 왜?" 패턴
+    r'(내과|외과|피부과|정형외과|이비인후과|안과|치과|산부인과|소아과|신경과|신경외과|정신과|비뇨기과|재활의학과|가정의학과|흉부외과).{0,5}(왜|이유|뭐)',
+    # "정형외과 왜 가?" 패턴
+    r'(내과|외과|피부과|정형외과|이비인후과|안과|치과|산부인과|소아과|신경과|신경외과|정신과|비뇨기과|재활의학과|가정의학과|흉부외과).{0,10}(왜|이유)',
+])
+
+# 질병명 패턴 (DISEASE_INFO_DATABASE의 키와 추가 질병명)
+DISEASE_NAMES_FOR_QUESTION = [
+    # 비뇨기계
+    "방광염", "요로감염", "신장결석", "요로결석", "전립선염", "전립선비대",
+    # 소화기계
+    "위염", "장염", "역류성식도염", "과민성대장증후군", "위궤양", "십이지장궤양",
+    "담석", "담낭염", "췌장염", "간염", "지방간", "변비", "치질",
+    # 여성 질환
+    "골반염", "난소낭종", "자궁내막증", "질염", "자궁근종", "생리통",
+    # 피부 질환
+    "아토피", "두드러기", "대상포진", "습진", "건선", "여드름", "무좀",
+    # 근골격계
+    "허리디스크", "목디스크", "관절염", "류마티스", "오십견", "척추관협착증", "통풍",
+    # 호흡기
+    "비염", "축농증", "천식", "기관지염", "폐렴",
+    # 이비인후과
+    "이명", "어지럼증", "이석증", "메니에르", "중이염", "편도염",
+    # 신경/정신
+    "편두통", "두통", "불면증", "우울증", "공황장애", "불안장애",
+    # 순환기
+    "고혈압", "저혈압", "부정맥",
+    # 대사
+    "당뇨", "당뇨병", "갑상선", "고지혈증",
+    # 기타
+    "감기", "독감", "알레르기", "탈장", "맹장염", "결막염",
+]
+
+_DISEASE_NAMES_ALT = "|".join(DISEASE_NAMES_FOR_QUESTION)
+
+# 질병명이 하나라도 있는지 먼저 걸러내는 게이트 패턴
+# (대부분의 메시지는 질병명이 없어 아래 목록 순회를 통째로 건너뛴다)
+DISEASE_NAME_RE = _keywords_re(DISEASE_NAMES_FOR_QUESTION)
+
+# 질병 확인 질문 패턴
+# "방광염은 아니야?", "혹시 방광염?", "방광염일수도?", "방광염 아닌가?", "그럼 방광염은?"
+DISEASE_QUESTION_PATTERNS = tuple(re.compile(p) for p in [
+    # "~은/는 아니야/아닌가?" 패턴
+    r'({})[\s은는이가]*(아니|아닐|아닌가|아냐|아녀|아뇨)'.format(_DISEASE_NAMES_ALT),
+    # "혹시 ~?" 패턴
+    r'혹시\s*({})'.format(_DISEASE_NAMES_ALT),
+    # "~일수도/일까/인가?" 패턴
+    r'({})[\s]*(일수도|일까|인가|인거|인건|일까요|일수|일지도|아닐까)'.format(_DISEASE_NAMES_ALT),
+    # "그럼/그러면 ~은/는?" 패턴
+    r'(그럼|그러면|그래서)\s*({})'.format(_DISEASE_NAMES_ALT),
+    # "~ 아니야?/아닌가요?" (공백 포함)
+    r'({})[\s]+(아니야|아닌가요|아닌가|아냐|아녀)'.format(_DISEASE_NAMES_ALT),
+])
+
+# 인사 키워드
+GREETING_KEYWORDS = [
+    "안녕", "하이", "반가", "시작", "헬로", "hello", "hi",
+    "처음", "왔어", "뭐야", "뭐해", "누구"
+]
+GREETING_RE = _keywords_re(GREETING_KEYWORDS)
+GREETING_SET = frozenset(GREETING_KEYWORDS)
+
+# "왜?" 질문 키워드
+WHY_KEYWORDS_RE = _keywords_re([
+    "왜 ", "이유가", "이유는", "이유 ", "무슨 상관", "상관이", "관련이",
+    "이해가 안", "이해안", "왜요", "왜죠", "왜지", "왜야", "웬", "의아",
+    "뭔 상관", "무슨상관", "어떤 관계", "무슨 관계",
+])
+
+# "왜" 키워드만 있는 경우 (진료과목 없이)
+SIMPLE_WHY_RE = _keywords_re(
+    ["왜요", "왜죠", "왜지", "왜야", "이유가 뭐", "왜 그래", "이해가 안 돼", "이해안돼"]
+)
+
+# 도움말 키워드
+HELP_RE = _keywords_re([
+    "도움", "사용법", "뭐 할 수", "기능", "어떻게 써", "사용 방법",
+    "뭘 할 수 있", "알려줘 기능", "메뉴", "명령어"
+])
+
+# 질병 확인 질문의 질문/확인 맥락 표현
+QUESTION_INDICATOR_RE = _keywords_re([
+    "아니", "아냐", "아녀", "인가", "일까", "혹시", "그럼", "그러면",
+    "?", "맞아", "맞나", "맞는", "같아", "같은데", "수도", "일지도",
+    "은?", "는?", "이야?", "예요?", "인가요", "일까요", "아닌가",
+    "아닐까", "일수", "아닐", "인거야", "인건가", "일 수도"
+])
+
+# 다른 진료과 추천 요청 키워드
+OTHER_DEPT_RE = _keywords_re([
+    "다른 과", "다른과", "다른 진료과", "다른진료과",
+    "다른 데 가", "딴 데", "딴데", "다른 병원과",
+    "다른 선택", "다른 옵션", "대안", "차선책",
+])
+
+# 다른 병원 추천 요청 키워드
+MORE_HOSPITAL_RE = _keywords_re([
+    # 다른 병원 요청
+    "다른 병원", "다른곳", "다른 곳", "다른 데", "다른데",
+    "또 다른", "또다른", "다른거", "다른 거",
+    # 더 보기/찾기 요청
+    "더 보여", "더 찾아", "더 알려", "더 검색", "더 추천",
+    "더 없어", "더 있어", "더 없나", "더 있나",
+    # 새로운 추천 요청
+    "새로운", "다른 추천", "다시 찾아", "다시 검색", "다시 추천",
+    # 질문형
+    "없어?", "없나요", "없어요", "없을까", "또 없어", "또 있어",
+    # 추가 요청
+    "말고", "외에", "빼고",
+])
+MORE_HOSPITAL_PATTERNS = ("다른", "또", "더")
+
+# 병원 검색 키워드
+HOSPITAL_RE = _keywords_re([
+    "병원", "의원", "클리닉", "찾아", "검색", "추천", "알려",
+    "어디", "어딜", "가까운", "근처", "주변"
+])
+
+# 통증/불편감 표현 (구어체 포함)
+PAIN_KEYWORDS = [
+    # 기본 통증
+    "아파", "아프", "아픔", "아팠", "아플", "아픈", "통증", "쑤시", "쑤셔", "쑤심",
+    # 찌르는/날카로운 통증
+    "찌릿", "찌르", "콕콕", "쿡쿡", "뻐근", "뻣뻣", "뻑뻑",
+    # 저림/무감각
+    "저리", "저림", "저려", "마비", "감각이 없", "먹먹",
+    # 당김/뻗침
+    "당기", "당김", "뻗치", "뻗어", "땡기", "땡김",
+    # 욱신/울림
+    "욱신", "지끈", "지근", "울리", "울림",
+    # 화끈/열감
+    "화끈", "뜨거", "뜨겁", "열감", "후끈", "달아올",
+    # 시림/차가움
+    "시리", "시림", "시려", "차가", "차갑", "썰렁",
+    # 묵직/무거움
+    "묵직", "무거", "무겁", "눌리", "짓눌",
+    # 결림
+    "결리", "결림", "담", "뭉치", "뭉침", "뭉쳐",
+]
+
+# 신체 부위별 표현
+BODY_PART_KEYWORDS = [
+    # 머리
+    "머리", "두통", "관자놀이", "뒷통수", "이마", "정수리", "편두통",
+    # 눈
+    "눈", "눈알", "안구", "시력", "눈물", "충혈", "눈꺼풀",
+    # 코
+    "코", "콧물", "코막힘", "재채기", "비염", "축농증",
+    # 귀
+    "귀", "이명", "귀울림", "청력", "중이염",
+    # 입/목
+    "입", "혀", "입술", "목", "목구멍", "인후", "편도", "성대", "기도",
+    # 치아
+    "이", "이빨", "치아", "잇몸", "사랑니", "충치",
+    # 목/어깨
+    "목덜미", "어깨", "승모근", "견갑골",
+    # 가슴/흉부
+    "가슴", "흉부", "심장", "폐", "갈비뼈", "명치",
+    # 배/복부
+    "배", "복부", "위", "장", "소장", "대장", "맹장", "간", "췌장", "신장", "콩팥",
+    # 등/허리
+    "등", "허리", "척추", "요추", "디스크", "꼬리뼈",
+    # 팔/손
+    "팔", "팔꿈치", "손목", "손", "손가락", "손바닥", "손등",
+    # 다리/발
+    "다리", "허벅지", "종아리", "무릎", "발목", "발", "발가락", "발바닥", "발등", "아킬레스",
+    # 피부
+    "피부", "살", "살갗",
+    # 기타
+    "관절", "뼈", "근육", "힘줄", "인대",
+]
+
+# 증상/상태 표현 (구어체 대폭 확장)
+SYMPTOM_KEYWORDS = [
+    # 열/감기 관련
+    "열", "열나", "열이", "발열", "고열", "미열", "오한", "춥", "으슬으슬",
+    "기침", "마른기침", "가래", "기침이", "콜록", "캑캑",
+    "콧물", "코막힘", "코가", "재채기", "훌쩍",
+    "감기", "독감", "몸살", "오들오들",
+
+    # 소화기 관련
+    "속", "속이", "속쓰림", "더부룩", "소화", "체", "체했", "체한", "소화불량",
+    "구토", "토", "울렁", "메스꺼", "메슥", "욕지기", "헛구역",
+    "설사", "묽은변", "변비", "배변", "대변", "변", "똥",
+    "복통", "배탈", "배아파", "배가", "뱃속",
+    "가스", "방귀", "트림", "장",
+    "식욕", "입맛", "못먹", "안먹",
+
+    # 피부 관련
+    "가려", "가렵", "간지러", "간지", "긁", "두드러기",
+    "발진", "뾰루지", "여드름", "트러블", "피부트러블",
+    "붓", "부었", "부어", "붓기", "부종", "퉁퉁",
+    "빨개", "빨갛", "붉", "충혈", "발적",
+    "건조", "각질", "갈라", "터져", "트",
+    "멍", "멍이", "피멍", "타박",
+    "물집", "수포",
+    "탈모", "머리카락", "빠져",
+
+    # 호흡기 관련
+    "숨", "호흡", "숨쉬기", "답답", "가쁘", "헐떡", "천식",
+
+    # 순환기 관련
+    "심장", "두근", "두근거리", "빈맥", "맥박", "혈압", "어지러", "어지럼", "현기증", "빙글빙글",
+
+    # 신경/정신 관련
+    "두통", "머리아파", "머리가", "편두통",
+    "불면", "잠", "못자", "안자", "잠이안와", "수면",
+    "피곤", "피로", "지치", "기운", "힘이없", "무기력", "나른",
+    "스트레스", "우울", "불안", "초조", "예민", "짜증",
+    "집중", "건망증", "깜빡", "기억",
+
+    # 근골격계 관련
+    "삐끗", "삐었", "접질", "염좌", "골절", "부러",
+    "관절", "뻣뻣", "굳", "뻑뻑",
+
+    # 비뇨기/생식기 관련
+    "소변", "오줌", "소변볼때", "자주", "화장실",
+    "생리", "월경", "생리통", "생리불순",
+
+    # 눈 관련
+    "침침", "흐릿", "안보여", "눈아파", "눈이", "눈물",
+
+    # 귀 관련
+    "안들려", "이명", "귀울림", "귀에서",
+
+    # 기타 일반 증상
+    "증상", "이상", "불편", "안좋", "좀이상", "뭔가이상",
+    "아무래도", "걱정", "신경쓰", "찜찜",
+]
+
+# 질병명 직접 인식
+INTENT_DISEASE_KEYWORDS = [
+    # 감염성 질환
+    "감기", "독감", "코로나", "코비드", "장염", "식중독", "위염", "위궤양",
+    "방광염", "요로감염", "결막염", "중이염", "편도염", "폐렴", "기관지염",
+    "축농증", "비염", "부비동염",
+
+    # 피부 질환
+    "아토피", "습진", "건선", "두드러기", "대상포진", "헤르페스",
+    "무좀", "백선", "사마귀", "티눈",
+
+    # 근골격계 질환
+    "디스크", "허리디스크", "목디스크", "관절염", "류마티스", "통풍",
+    "오십견", "회전근개", "테니스엘보", "골다공증",
+
+    # 소화기 질환
+    "역류성", "역류성식도염", "과민성대장", "변비", "치질", "치핵",
+    "담석", "담낭염", "췌장염", "간염",
+
+    # 순환기/심장 질환
+    "고혈압", "저혈압", "부정맥", "협심증", "심근경색",
+
+    # 대사 질환
+    "당뇨", "당뇨병", "고지혈증", "갑상선", "갑상선기능",
+
+    # 신경계 질환
+    "편두통", "긴장성두통", "어지럼증", "메니에르", "이석증",
+    "수근관증후군", "손목터널",
+
+    # 정신건강
+    "우울증", "불안장애", "공황장애", "공황", "불면증", "수면장애",
+
+    # 알레르기
+    "알레르기", "알러지", "꽃가루", "비염",
+
+    # 여성 질환
+    "생리통", "생리불순", "다낭성", "자궁근종", "자궁내막",
+
+    # 기타
+    "탈장", "치질", "대장용종",
+]
+
+# 질문 패턴 인식
+QUESTION_KEYWORDS = [
+    "어디로 가", "어디 가", "뭘 먹", "어떻게 해", "어떡해", "어쩌지", "어쩔",
+    "왜 이러", "왜이러", "왜 그러", "왜그러", "무슨 일", "무슨일",
+    "괜찮", "심각", "위험", "병원 가야", "응급", "급해",
+    "치료", "낫", "좋아지", "언제", "얼마나",
+    "~인가요", "~일까요", "~한가요", "~할까요",
+    "인 것 같", "인것같", "인거같", "인가", "일까",
+    "같아요", "같은데", "것 같은데",
+]
+
+# ============================================
+# 증상 카테고리 단일 패스 스캔
+# ============================================
+# 카테고리별로 따로 검색하는 대신 전체 어휘를 한 번에 스캔한다.
+# 키워드 -> 속한 카테고리 태그 집합
+_INTENT_TAGS: dict = {}
+for _tag, _keywords in (
+    ("pain", PAIN_KEYWORDS),
+    ("symptom", SYMPTOM_KEYWORDS),
+    ("body_part", BODY_PART_KEYWORDS),
+    ("disease", INTENT_DISEASE_KEYWORDS),
+    ("question", QUESTION_KEYWORDS),
+):
+    for _kw in _keywords:
+        _INTENT_TAGS.setdefault(_kw, set()).add(_tag)
+
+# 스캔은 각 위치에서 가장 긴 키워드만 잡으므로, 접두어인 짧은 키워드의
+# 태그를 긴 키워드 쪽에 흡수시켜 개별 부분문자열 검사와 동일하게 만든다.
+for _kw, _tags in _INTENT_TAGS.items():
+    for _other, _other_tags in _INTENT_TAGS.items():
+        if _other is not _kw and _kw.startswith(_other):
+            _tags |= _other_tags
+
+_INTENT_TAG_COUNT = 5
+
+# 룩어헤드 캡처로 모든 시작 위치의 키워드를 한 번의 패스로 수집
+INTENT_SCAN_RE = re.compile(
+    "(?=({}))".format(
+        "|".join(sorted(map(re.escape, _INTENT_TAGS), key=len, reverse=True))
+    )
+)
+
+
+def _scan_intent_tags(message: str) -> set:
+    """메시지에서 증상/부위/질병/질문 카테고리 태그를 단일 패스로 수집"""
+    hits = set()
+    for match in INTENT_SCAN_RE.finditer(message):
+        hits |= _INTENT_TAGS[match.group(1)]
+        if len(hits) == _INTENT_TAG_COUNT:
+            break
+    return hits
+
+
+# 증상 부위 우선순위 (이유 설명용) - 앞에 올수록 우선
+_SYMPTOM_AREA_PARTS = ("배", "머리", "허리", "가슴", "목", "피부", "눈", "귀", "관절", "어지러")
+
+
+def _detect_symptom_area(symptoms: str) -> str:
+    """메시지에서 이유 설명에 쓸 증상 부위를 우선순위 순으로 찾는다"""
+    for part in _SYMPTOM_AREA_PARTS:
+        if part in symptoms:
+            return part
+    return ""
+
+
 def extract_intent(user_message: str) -> dict:
-    """사용자 메시지에서 의도 추출 (확장된 자연어 인식)"""
+    """사용자 메시지에서 의도 추출 (확장된 자연어 인식)
+
+    같은 문구가 반복해서 들어오는 경우가 많아("도움말", "배가 아파요" 등)
+    결과를 LRU 캐시하고, 호출자가 수정해도 안전하도록 사본을 돌려준다.
+    """
+    return dict(_extract_intent_cached(user_message))
+
+
+# 자주 들어오는 결정적 발화 -> 의도
+# 버튼/인사말 등 전체 스캔 없이 결과가 정해지는 단문만 등록한다.
+# (등록된 결과는 반드시 아래 본문 캐스케이드와 같아야 한다)
+_EXACT_INTENTS = {
+    "안녕": {"intent": "greeting"},
+    "안녕하세요": {"intent": "greeting"},
+    "하이": {"intent": "greeting"},
+    "도움말": {"intent": "help"},
+    "사용법": {"intent": "help"},
+    "메뉴": {"intent": "help"},
+    "약국": {"intent": "search_pharmacy", "region": None},
+    "다른 병원": {"intent": "more_hospitals"},
+    "다른 병원 추천해줘": {"intent": "more_hospitals"},
+}
+
+
+@lru_cache(maxsize=2048)
+def _extract_intent_cached(user_message: str) -> dict:
+    """extract_intent 본체 (메시지 문자열 기준 캐시)"""
     message = user_message.lower()
     original_message = user_message  # 원본 보존
 
-    # 지역 패턴 (먼저 추출)
-    region_pattern = r'(서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주|강남|홍대|신촌|서면|해운대|동성로|판교|분당|첨단|잠실|여의도|명동|종로|신림|사당|왕십리|건대|혜화|이태원|영등포|동대문|용산|수원|일산|부천|안양|의정부|평택|송도|부평|둔산|유성|수성구|남포동|센텀시티|광안리|상무|충장로|금남로)'
-    region_match = re.search(region_pattern, message)
+    # 결정적 단문은 스캔 없이 바로 분기
+    exact = _EXACT_INTENTS.get(message.strip())
+    if exact is not None:
+        return exact
 
-    # 진료과목 패턴 (확장)
-    dept_pattern = r'(내과|외과|피부과|정형외과|이비인후과|안과|치과|산부인과|소아과|소아청소년과|신경과|신경외과|정신과|정신건강의학과|비뇨기과|비뇨의학과|재활의학과|가정의학과|흉부외과|성형외과|마취통증의학과|영상의학과|진단검사의학과|병리과|응급의학과|핵의학과|직업환경의학과|예방의학과|결핵과|한의원|한방|통증의학과)'
-    dept_match = re.search(dept_pattern, message)
+    # 빈 메시지는 바로 도움말 (아래 길이 폴백과 동일한 결과)
+    if not message.strip():
+        return {"intent": "help"}
+
+    # 지역/진료과목 추출 - 싼 문자 검사로 통과 못 하면 정규식 생략
+    # (진료과목 이름은 모두 "과"를 포함하거나 "한의원"/"한방"이다)
+    region_match = (
+        REGION_RE.search(message)
+        if not _REGION_FIRST_CHARS.isdisjoint(message) else None
+    )
+    dept_match = (
+        DEPT_RE.search(message)
+        if "과" in message or "한" in message else None
+    )
+    # 매치 그룹은 한 번만 꺼내 모든 반환 지점에서 재사용
+    region = region_match.group(1) if region_match else None
+    department = sys.intern(dept_match.group(1)) if dept_match else None
 
     # ============================================
     # 1. 인사 (우선순위 높음)
     # ============================================
-    greeting_keywords = [
-        "안녕", "하이", "반가", "시작", "헬로", "hello", "hi",
-        "처음", "왔어", "뭐야", "뭐해", "누구"
-    ]
-    if any(word in message for word in greeting_keywords) and len(message) < 15:
+    # 길이 검사를 먼저 해서 긴 메시지는 정규식 없이 건너뛴다
+    if len(message) < 15 and (
+        message.strip() in GREETING_SET or GREETING_RE.search(message)
+    ):
         return {"intent": "greeting"}
 
     # ============================================
     # 2. 추천 이유 질문 (왜 OO과? 등) - 우선순위 높음
     # ============================================
-    why_question_patterns = [
-        # "왜 정형외과?" 패턴
-        r'왜\s*(내과|외과|피부과|정형외과|이비인후과|안과|치과|산부인과|소아과|신경과|신경외과|정신과|비뇨기과|재활의학과|가정의학과|흉부외과)',
-        # "정형외과는 왜?" 패턴
-        r'(내과|외과|피부과|정형외과|이비인후과|안과|치과|산부인과|소아과|신경과|신경외과|정신과|비뇨기과|재활의학과|가정의학과|흉부외과).{0,5}(왜|이유|뭐)',
-        # "정형외과 왜 가?" 패턴
-        r'(내과|외과|피부과|정형외과|이비인후과|안과|치과|산부인과|소아과|신경과|신경외과|정신과|비뇨기과|재활의학과|가정의학과|흉부외과).{0,10}(왜|이유)',
-    ]
-
-    # "왜?" 질문 키워드
-    why_keywords = [
-        "왜 ", "이유가", "이유는", "이유 ", "무슨 상관", "상관이", "관련이",
-        "이해가 안", "이해안", "왜요", "왜죠", "왜지", "왜야", "웬", "의아",
-        "뭔 상관", "무슨상관", "어떤 관계", "무슨 관계",
-    ]
-
     # 진료과목이 메시지에 있고 + 왜? 질문 패턴이 있는 경우
     if dept_match:
-        has_why_pattern = any(re.search(pattern, message) for pattern in why_question_patterns)
-        has_why_keyword = any(word in message for word in why_keywords)
+        has_why_pattern = any(p.search(message) for p in WHY_PATTERNS)
+        has_why_keyword = bool(WHY_KEYWORDS_RE.search(message))
 
         if has_why_pattern or has_why_keyword:
             return {
                 "intent": "explain_recommendation",
-                "department": dept_match.group(1),
+                "department": department,
             }
 
     # "왜" 키워드만 있는 경우 (진료과목 없이) - 이전 추천에 대한 질문일 수 있음
-    simple_why_patterns = ["왜요", "왜죠", "왜지", "왜야", "이유가 뭐", "왜 그래", "이해가 안 돼", "이해안돼"]
-    if any(word in message for word in simple_why_patterns) and len(message) < 20:
+    if SIMPLE_WHY_RE.search(message) and len(message) < 20:
         return {"intent": "explain_recommendation", "department": None}
 
     # ============================================
     # 3. 도움말
     # ============================================
-    help_keywords = [
-        "도움", "사용법", "뭐 할 수", "기능", "어떻게 써", "사용 방법",
-        "뭘 할 수 있", "알려줘 기능", "메뉴", "명령어"
-    ]
-    if any(word in message for word in help_keywords):
+    if HELP_RE.search(message):
         return {"intent": "help"}
 
     # ============================================
     # 3-1. 질병 확인/반문 질문 (방광염은 아니야? 등) - 새로 추가
     # ============================================
-    # 질병명 패턴 (DISEASE_INFO_DATABASE의 키와 추가 질병명)
-    disease_names_for_question = [
-        # 비뇨기계
-        "방광염", "요로감염", "신장결석", "요로결석", "전립선염", "전립선비대",
-        # 소화기계
-        "위염", "장염", "역류성식도염", "과민성대장증후군", "위궤양", "십이지장궤양",
-        "담석", "담낭염", "췌장염", "간염", "지방간", "변비", "치질",
-        # 여성 질환
-        "골반염", "난소낭종", "자궁내막증", "질염", "자궁근종", "생리통",
-        # 피부 질환
-        "아토피", "두드러기", "대상포진", "습진", "건선", "여드름", "무좀",
-        # 근골격계
-        "허리디스크", "목디스크", "관절염", "류마티스", "오십견", "척추관협착증", "통풍",
-        # 호흡기
-        "비염", "축농증", "천식", "기관지염", "폐렴",
-        # 이비인후과
-        "이명", "어지럼증", "이석증", "메니에르", "중이염", "편도염",
-        # 신경/정신
-        "편두통", "두통", "불면증", "우울증", "공황장애", "불안장애",
-        # 순환기
-        "고혈압", "저혈압", "부정맥",
-        # 대사
-        "당뇨", "당뇨병", "갑상선", "고지혈증",
-        # 기타
-        "감기", "독감", "알레르기", "탈장", "맹장염", "결막염",
-    ]
-
-    # 질병 확인 질문 패턴
-    # "방광염은 아니야?", "혹시 방광염?", "방광염일수도?", "방광염 아닌가?", "그럼 방광염은?"
-    disease_question_patterns = [
-        # "~은/는 아니야/아닌가?" 패턴
-        r'({})[\s은는이가]*(아니|아닐|아닌가|아냐|아녀|아뇨)'.format("|".join(disease_names_for_question)),
-        # "혹시 ~?" 패턴
-        r'혹시\s*({})'.format("|".join(disease_names_for_question)),
-        # "~일수도/일까/인가?" 패턴
-        r'({})[\s]*(일수도|일까|인가|인거|인건|일까요|일수|일지도|아닐까)'.format("|".join(disease_names_for_question)),
-        # "그럼/그러면 ~은/는?" 패턴
-        r'(그럼|그러면|그래서)\s*({})'.format("|".join(disease_names_for_question)),
-        # "~ 아니야?/아닌가요?" (공백 포함)
-        r'({})[\s]+(아니야|아닌가요|아닌가|아냐|아녀)'.format("|".join(disease_names_for_question)),
-    ]
-
     # 질병명 직접 확인 (짧은 질문)
     # "방광염?", "방광염은?", "방광염 아니야?"
-    for disease in disease_names_for_question:
+    # 게이트: 질병명이 전혀 없으면 목록 순회를 건너뛴다
+    for disease in (DISEASE_NAMES_FOR_QUESTION if DISEASE_NAME_RE.search(message) else ()):
         # 질병명이 메시지에 있고 + 질문/확인 맥락인 경우
         if disease in message:
             # 질문 패턴 확인
-            question_indicators = [
-                "아니", "아냐", "아녀", "인가", "일까", "혹시", "그럼", "그러면",
-                "?", "맞아", "맞나", "맞는", "같아", "같은데", "수도", "일지도",
-                "은?", "는?", "이야?", "예요?", "인가요", "일까요", "아닌가",
-                "아닐까", "일수", "아닐", "인거야", "인건가", "일 수도"
-            ]
-            has_question = any(q in message for q in question_indicators)
+            has_question = bool(QUESTION_INDICATOR_RE.search(message))
 
             # 짧은 질문 (질병명 + 물음표 등) 또는 명확한 질문 패턴
             is_short_question = len(message) < 25 and ("?" in message or has_question)
-            has_pattern = any(re.search(p, message) for p in disease_question_patterns)
+            has_pattern = any(p.search(message) for p in DISEASE_QUESTION_PATTERNS)
 
             if is_short_question or has_pattern:
                 return {
@@ -1398,37 +2174,17 @@ def extract_intent(user_message: str) -> dict:
     # ============================================
     # 3-2. 다른 진료과 추천 요청
     # ============================================
-    other_dept_keywords = [
-        "다른 과", "다른과", "다른 진료과", "다른진료과",
-        "다른 데 가", "딴 데", "딴데", "다른 병원과",
-        "다른 선택", "다른 옵션", "대안", "차선책",
-    ]
-    if any(word in message for word in other_dept_keywords):
+    if OTHER_DEPT_RE.search(message):
         return {"intent": "suggest_other_departments"}
 
     # ============================================
     # 4. 다른 병원 추천 요청
     # ============================================
-    more_hospital_keywords = [
-        # 다른 병원 요청
-        "다른 병원", "다른곳", "다른 곳", "다른 데", "다른데",
-        "또 다른", "또다른", "다른거", "다른 거",
-        # 더 보기/찾기 요청
-        "더 보여", "더 찾아", "더 알려", "더 검색", "더 추천",
-        "더 없어", "더 있어", "더 없나", "더 있나",
-        # 새로운 추천 요청
-        "새로운", "다른 추천", "다시 찾아", "다시 검색", "다시 추천",
-        # 질문형
-        "없어?", "없나요", "없어요", "없을까", "또 없어", "또 있어",
-        # 추가 요청
-        "말고", "외에", "빼고",
-    ]
     # "다른" 단독은 "다른 병원", "다른 곳" 등과 함께 쓰일 때만 인식
-    more_hospital_patterns = ["다른", "또", "더"]
-    has_more_keyword = any(word in message for word in more_hospital_keywords)
-    has_pattern_with_hospital = any(
-        pattern in message and ("병원" in message or "추천" in message or "찾아" in message or "검색" in message or "알려" in message)
-        for pattern in more_hospital_patterns
+    has_more_keyword = bool(MORE_HOSPITAL_RE.search(message))
+    has_pattern_with_hospital = (
+        any(pattern in message for pattern in MORE_HOSPITAL_PATTERNS)
+        and ("병원" in message or "추천" in message or "찾아" in message or "검색" in message or "알려" in message)
     )
     if has_more_keyword or has_pattern_with_hospital:
         return {"intent": "more_hospitals"}
@@ -1439,198 +2195,27 @@ def extract_intent(user_message: str) -> dict:
     if "약국" in message:
         return {
             "intent": "search_pharmacy",
-            "region": region_match.group(1) if region_match else None,
+            "region": region,
         }
 
     # ============================================
     # 5. 병원 검색 (지역 + 과목이 명확한 경우)
     # ============================================
-    hospital_keywords = [
-        "병원", "의원", "클리닉", "찾아", "검색", "추천", "알려",
-        "어디", "어딜", "가까운", "근처", "주변"
-    ]
-
-    if dept_match and (region_match or any(word in message for word in hospital_keywords)):
+    if dept_match and (region_match or HOSPITAL_RE.search(message)):
         return {
             "intent": "search_hospital",
-            "region": region_match.group(1) if region_match else None,
-            "department": dept_match.group(1) if dept_match else None,
+            "region": region,
+            "department": department,
         }
 
     # ============================================
     # 6. 증상 분석 (대폭 확장된 키워드)
     # ============================================
-
-    # 6-1. 통증/불편감 표현 (구어체 포함)
-    pain_keywords = [
-        # 기본 통증
-        "아파", "아프", "아픔", "아팠", "아플", "아픈", "통증", "쑤시", "쑤셔", "쑤심",
-        # 찌르는/날카로운 통증
-        "찌릿", "찌르", "콕콕", "쿡쿡", "뻐근", "뻣뻣", "뻑뻑",
-        # 저림/무감각
-        "저리", "저림", "저려", "마비", "감각이 없", "먹먹",
-        # 당김/뻗침
-        "당기", "당김", "뻗치", "뻗어", "땡기", "땡김",
-        # 욱신/울림
-        "욱신", "지끈", "지근", "울리", "울림",
-        # 화끈/열감
-        "화끈", "뜨거", "뜨겁", "열감", "후끈", "달아올",
-        # 시림/차가움
-        "시리", "시림", "시려", "차가", "차갑", "썰렁",
-        # 묵직/무거움
-        "묵직", "무거", "무겁", "눌리", "짓눌",
-        # 결림
-        "결리", "결림", "담", "뭉치", "뭉침", "뭉쳐",
-    ]
-
-    # 6-2. 신체 부위별 표현
-    body_part_keywords = [
-        # 머리
-        "머리", "두통", "관자놀이", "뒷통수", "이마", "정수리", "편두통",
-        # 눈
-        "눈", "눈알", "안구", "시력", "눈물", "충혈", "눈꺼풀",
-        # 코
-        "코", "콧물", "코막힘", "재채기", "비염", "축농증",
-        # 귀
-        "귀", "이명", "귀울림", "청력", "중이염",
-        # 입/목
-        "입", "혀", "입술", "목", "목구멍", "인후", "편도", "성대", "기도",
-        # 치아
-        "이", "이빨", "치아", "잇몸", "사랑니", "충치",
-        # 목/어깨
-        "목덜미", "어깨", "승모근", "견갑골",
-        # 가슴/흉부
-        "가슴", "흉부", "심장", "폐", "갈비뼈", "명치",
-        # 배/복부
-        "배", "복부", "위", "장", "소장", "대장", "맹장", "간", "췌장", "신장", "콩팥",
-        # 등/허리
-        "등", "허리", "척추", "요추", "디스크", "꼬리뼈",
-        # 팔/손
-        "팔", "팔꿈치", "손목", "손", "손가락", "손바닥", "손등",
-        # 다리/발
-        "다리", "허벅지", "종아리", "무릎", "발목", "발", "발가락", "발바닥", "발등", "아킬레스",
-        # 피부
-        "피부", "살", "살갗",
-        # 기타
-        "관절", "뼈", "근육", "힘줄", "인대",
-    ]
-
-    # 6-3. 증상/상태 표현 (구어체 대폭 확장)
-    symptom_keywords = [
-        # 열/감기 관련
-        "열", "열나", "열이", "발열", "고열", "미열", "오한", "춥", "으슬으슬",
-        "기침", "마른기침", "가래", "기침이", "콜록", "캑캑",
-        "콧물", "코막힘", "코가", "재채기", "훌쩍",
-        "감기", "독감", "몸살", "오들오들",
-
-        # 소화기 관련
-        "속", "속이", "속쓰림", "더부룩", "소화", "체", "체했", "체한", "소화불량",
-        "구토", "토", "울렁", "메스꺼", "메슥", "욕지기", "헛구역",
-        "설사", "묽은변", "변비", "배변", "대변", "변", "똥",
-        "복통", "배탈", "배아파", "배가", "뱃속",
-        "가스", "방귀", "트림", "장",
-        "식욕", "입맛", "못먹", "안먹",
-
-        # 피부 관련
-        "가려", "가렵", "간지러", "간지", "긁", "두드러기",
-        "발진", "뾰루지", "여드름", "트러블", "피부트러블",
-        "붓", "부었", "부어", "붓기", "부종", "퉁퉁",
-        "빨개", "빨갛", "붉", "충혈", "발적",
-        "건조", "각질", "갈라", "터져", "트",
-        "멍", "멍이", "피멍", "타박",
-        "물집", "수포",
-        "탈모", "머리카락", "빠져",
-
-        # 호흡기 관련
-        "숨", "호흡", "숨쉬기", "답답", "가쁘", "헐떡", "천식",
-
-        # 순환기 관련
-        "심장", "두근", "두근거리", "빈맥", "맥박", "혈압", "어지러", "어지럼", "현기증", "빙글빙글",
-
-        # 신경/정신 관련
-        "두통", "머리아파", "머리가", "편두통",
-        "불면", "잠", "못자", "안자", "잠이안와", "수면",
-        "피곤", "피로", "지치", "기운", "힘이없", "무기력", "나른",
-        "스트레스", "우울", "불안", "초조", "예민", "짜증",
-        "집중", "건망증", "깜빡", "기억",
-
-        # 근골격계 관련
-        "삐끗", "삐었", "접질", "염좌", "골절", "부러",
-        "관절", "뻣뻣", "굳", "뻑뻑",
-
-        # 비뇨기/생식기 관련
-        "소변", "오줌", "소변볼때", "자주", "화장실",
-        "생리", "월경", "생리통", "생리불순",
-
-        # 눈 관련
-        "침침", "흐릿", "안보여", "눈아파", "눈이", "눈물",
-
-        # 귀 관련
-        "안들려", "이명", "귀울림", "귀에서",
-
-        # 기타 일반 증상
-        "증상", "이상", "불편", "안좋", "좀이상", "뭔가이상",
-        "아무래도", "걱정", "신경쓰", "찜찜",
-    ]
-
-    # 6-4. 질병명 직접 인식
-    disease_keywords = [
-        # 감염성 질환
-        "감기", "독감", "코로나", "코비드", "장염", "식중독", "위염", "위궤양",
-        "방광염", "요로감염", "결막염", "중이염", "편도염", "폐렴", "기관지염",
-        "축농증", "비염", "부비동염",
-
-        # 피부 질환
-        "아토피", "습진", "건선", "두드러기", "대상포진", "헤르페스",
-        "무좀", "백선", "사마귀", "티눈",
-
-        # 근골격계 질환
-        "디스크", "허리디스크", "목디스크", "관절염", "류마티스", "통풍",
-        "오십견", "회전근개", "테니스엘보", "골다공증",
-
-        # 소화기 질환
-        "역류성", "역류성식도염", "과민성대장", "변비", "치질", "치핵",
-        "담석", "담낭염", "췌장염", "간염",
-
-        # 순환기/심장 질환
-        "고혈압", "저혈압", "부정맥", "협심증", "심근경색",
-
-        # 대사 질환
-        "당뇨", "당뇨병", "고지혈증", "갑상선", "갑상선기능",
-
-        # 신경계 질환
-        "편두통", "긴장성두통", "어지럼증", "메니에르", "이석증",
-        "수근관증후군", "손목터널",
-
-        # 정신건강
-        "우울증", "불안장애", "공황장애", "공황", "불면증", "수면장애",
-
-        # 알레르기
-        "알레르기", "알러지", "꽃가루", "비염",
-
-        # 여성 질환
-        "생리통", "생리불순", "다낭성", "자궁근종", "자궁내막",
-
-        # 기타
-        "탈장", "치질", "대장용종",
-    ]
-
-    # 6-5. 질문 패턴 인식
-    question_patterns = [
-        "어디로 가", "어디 가", "뭘 먹", "어떻게 해", "어떡해", "어쩌지", "어쩔",
-        "왜 이러", "왜이러", "왜 그러", "왜그러", "무슨 일", "무슨일",
-        "괜찮", "심각", "위험", "병원 가야", "응급", "급해",
-        "치료", "낫", "좋아지", "언제", "얼마나",
-        "~인가요", "~일까요", "~한가요", "~할까요",
-        "인 것 같", "인것같", "인거같", "인가", "일까",
-        "같아요", "같은데", "것 같은데",
-    ]
-
-    # 6-6. 상태 확인
-    has_symptom = any(word in message for word in pain_keywords + symptom_keywords)
-    has_body_part = any(word in message for word in body_part_keywords)
-    has_disease = any(word in message for word in disease_keywords)
-    has_question = any(word in message for word in question_patterns)
+    tags = _scan_intent_tags(message)
+    has_symptom = "pain" in tags or "symptom" in tags
+    has_body_part = "body_part" in tags
+    has_disease = "disease" in tags
+    has_question = "question" in tags
 
     # 증상 분석으로 처리할지 결정
     should_analyze = (
@@ -1644,17 +2229,18 @@ def extract_intent(user_message: str) -> dict:
         return {
             "intent": "analyze_symptoms",
             "symptoms": original_message,
-            "region": region_match.group(1) if region_match else None,
+            "symptom_area": _detect_symptom_area(original_message),
+            "region": region,
             "has_disease_mention": has_disease,
         }
 
     # ============================================
     # 7. 병원 검색 키워드만 있는 경우
     # ============================================
-    if any(word in message for word in hospital_keywords):
+    if HOSPITAL_RE.search(message):
         return {
             "intent": "search_hospital",
-            "region": region_match.group(1) if region_match else None,
+            "region": region,
             "department": None,
         }
 
@@ -1669,724 +2255,537 @@ def extract_intent(user_message: str) -> dict:
     return {
         "intent": "analyze_symptoms",
         "symptoms": original_message,
-        "region": region_match.group(1) if region_match else None,
+        "symptom_area": _detect_symptom_area(original_message),
+        "region": region,
     }
 
 
-async def process_kakao_skill(user_message: str, user_id: str = "anonymous") -> dict:
-    """카카오 스킬 요청 처리"""
-    intent_data = extract_intent(user_message)
-    intent = intent_data.get("intent")
+# ============================================
+# 고정 텍스트 응답 (모듈 로드 시 1회 생성)
+# ============================================
+# 아래 응답들은 내용이 항상 같으므로 요청마다 dict를 다시 만들지 않는다.
+# 호출자는 응답을 수정하지 않고 그대로 직렬화한다.
+_GREETING_RESPONSE = create_kakao_response(
+    "안녕하세요! 🏥 MediMatch입니다.\n\n"
+    "증상을 말씀해주시면 의심 질병과 추천 진료과를 알려드리고, "
+    "주변 병원도 찾아드려요.\n\n"
+    "예시:\n"
+    "• \"머리가 아프고 어지러워요\"\n"
+    "• \"강남 피부과 찾아줘\"\n"
+    "• \"배가 아프고 설사해요\"",
+    quick_replies=[
+        {"label": "증상 분석하기", "message": "증상 분석해줘"},
+        {"label": "사용법 보기", "message": "도움말"},
+    ]
+)
 
-    # 캐시 만료 체크
-    current_time = time.time()
-    if current_time - search_session_cache[user_id]["last_updated"] > CACHE_EXPIRY_SECONDS:
-        search_session_cache[user_id] = {
-            "region": None,
-            "department": None,
-            "shown_ids": set(),
-            "location": None,
-            "last_updated": 0,
-            "last_recommendation": None,
-        }
+_HELP_RESPONSE = create_kakao_response(
+    "📋 MediMatch 사용법\n\n"
+    "1️⃣ 증상 말하기\n"
+    "\"머리가 아파요\", \"피부가 가려워요\"\n\n"
+    "2️⃣ 병원 찾기\n"
+    "\"강남 피부과\", \"홍대 근처 정형외과\"\n\n"
+    "3️⃣ 병원+약국 찾기\n"
+    "\"서면 내과랑 약국\"\n\n"
+    "증상을 자세히 설명할수록 더 정확한 분석이 가능해요!",
+    quick_replies=[
+        {"label": "증상 말하기", "message": "배가 아파요"},
+        {"label": "병원 찾기", "message": "강남 피부과 찾아줘"},
+    ]
+)
 
-    # ============================================
-    # 질병 확인/반문 질문 처리 (방광염은 아니야? 등)
-    # ============================================
-    if intent == "ask_disease_info":
-        disease_name = intent_data.get("disease_name")
-        cache = search_session_cache[user_id]
-        last_rec = cache.get("last_recommendation")
-
-        # DISEASE_INFO_DATABASE에서 질병 정보 가져오기
-        disease_info = DISEASE_INFO_DATABASE.get(disease_name)
-
-        if disease_info:
-            response_text = f"🔍 {disease_name} 정보\n\n"
-            response_text += f"📌 {disease_info['description']}\n\n"
-
-            # 주요 증상
-            response_text += f"📋 주요 증상:\n"
-            for symptom in disease_info["symptoms"][:5]:
-                response_text += f"  • {symptom}\n"
-            response_text += "\n"
-
-            # 이전 증상과 비교해서 설명
-            if last_rec and last_rec.get("symptoms"):
-                response_text += f"💬 말씀하신 '{last_rec['symptoms'][:20]}...' 증상과 비교:\n"
-                response_text += f"{disease_info['differentiator']}\n\n"
-
-                # 해당 질병 의심 조건
-                response_text += f"🤔 언제 의심해볼까요?\n"
-                response_text += f"{disease_info['when_to_suspect']}\n\n"
-            else:
-                response_text += f"🤔 {disease_name}을/를 의심해볼 때:\n"
-                response_text += f"{disease_info['when_to_suspect']}\n\n"
 
-            # 추천 진료과
-            dept = disease_info["department"]
-            response_text += f"🏥 추천 진료과: {dept}\n"
+async def _handle_ask_disease_info(intent_data: dict, user_message: str, user_id: str, current_time: float) -> dict:
+    """질병 확인/반문 질문 처리 (방광염은 아니야? 등)"""
+    disease_name = intent_data.get("disease_name")
+    cache = get_session(user_id)
+    last_rec = cache.last_recommendation
 
-            # 관련 질환
-            if disease_info.get("related_diseases"):
-                related = ", ".join(disease_info["related_diseases"][:3])
-                response_text += f"🔗 관련 질환: {related}\n"
+    # DISEASE_INFO_DATABASE에서 질병 정보 가져오기
+    disease_info = DISEASE_INFO_DATABASE.get(disease_name)
 
-            # 빠른 응답
-            quick_replies = [
-                {"label": f"서울 {dept} 찾기", "message": f"서울 {dept} 찾아줘"},
-            ]
+    if disease_info:
+        response_text = f"🔍 {disease_name} 정보\n\n"
+        response_text += f"📌 {disease_info['description']}\n\n"
 
-            # 관련 질환 중 하나에 대해 물어보기
-            if disease_info.get("related_diseases"):
-                related = disease_info["related_diseases"][0]
-                if related in DISEASE_INFO_DATABASE:
-                    quick_replies.append({"label": f"{related}은?", "message": f"{related}은 아니야?"})
+        # 주요 증상
+        response_text += f"📋 주요 증상:\n"
+        for symptom in disease_info["symptoms"][:5]:
+            response_text += f"  • {symptom}\n"
+        response_text += "\n"
 
-            quick_replies.append({"label": "증상 다시 말하기", "message": "증상 분석해줘"})
+        # 이전 증상과 비교해서 설명
+        if last_rec and last_rec.get("symptoms"):
+            response_text += f"💬 말씀하신 '{last_rec['symptoms'][:20]}...' 증상과 비교:\n"
+            response_text += f"{disease_info['differentiator']}\n\n"
 
-            return create_kakao_response(response_text, quick_replies=quick_replies)
+            # 해당 질병 의심 조건
+            response_text += f"🤔 언제 의심해볼까요?\n"
+            response_text += f"{disease_info['when_to_suspect']}\n\n"
         else:
-            # DISEASE_INFO_DATABASE에 없는 질병
-            # 증상 분석기로 해당 질병에 대한 정보 가져오기 시도
-            diagnosis = symptom_analyzer.diagnose_disease(disease_name)
-
-            if diagnosis["has_diagnosis"]:
-                response_text = f"🔍 {disease_name} 관련 정보\n\n"
+            response_text += f"🤔 {disease_name}을/를 의심해볼 때:\n"
+            response_text += f"{disease_info['when_to_suspect']}\n\n"
 
-                if diagnosis.get("recommended_departments"):
-                    depts = diagnosis["recommended_departments"]
-                    response_text += f"🏥 관련 진료과: {', '.join(depts[:2])}\n\n"
+        # 추천 진료과
+        dept = disease_info["department"]
+        response_text += f"🏥 추천 진료과: {dept}\n"
 
-                if diagnosis.get("diagnosis_description"):
-                    response_text += f"📌 {diagnosis['diagnosis_description']}\n\n"
+        # 관련 질환
+        if disease_info.get("related_diseases"):
+            related = ", ".join(disease_info["related_diseases"][:3])
+            response_text += f"🔗 관련 질환: {related}\n"
 
-                response_text += f"💡 정확한 진단을 위해 병원을 방문해보세요!"
+        # 빠른 응답
+        quick_replies = [
+            {"label": f"서울 {dept} 찾기", "message": f"서울 {dept} 찾아줘"},
+        ]
 
-                quick_replies = []
-                if diagnosis.get("recommended_departments"):
-                    dept = diagnosis["recommended_departments"][0]
-                    quick_replies.append({"label": f"서울 {dept} 찾기", "message": f"서울 {dept} 찾아줘"})
-                quick_replies.append({"label": "증상 다시 말하기", "message": "증상 분석해줘"})
+        # 관련 질환 중 하나에 대해 물어보기
+        if disease_info.get("related_diseases"):
+            related = disease_info["related_diseases"][0]
+            if related in DISEASE_INFO_DATABASE:
+                quick_replies.append({"label": f"{related}은?", "message": f"{related}은 아니야?"})
 
-                return create_kakao_response(response_text, quick_replies=quick_replies)
-            else:
-                return create_kakao_response(
-                    f"'{disease_name}'에 대한 상세 정보가 없어요.\n\n"
-                    "증상을 자세히 말씀해주시면 더 정확하게 분석해드릴게요!",
-                    quick_replies=[
-                        {"label": "증상 말하기", "message": "증상이 어때요?"},
-                        {"label": "도움말", "message": "도움말"},
-                    ]
-                )
+        quick_replies.append({"label": "증상 다시 말하기", "message": "증상 분석해줘"})
 
-    # ============================================
-    # 다른 진료과 추천 요청 처리
-    # ============================================
-    if intent == "suggest_other_departments":
-        cache = search_session_cache[user_id]
-        last_rec = cache.get("last_recommendation")
+        return create_kakao_response(response_text, quick_replies=quick_replies)
+    else:
+        # DISEASE_INFO_DATABASE에 없는 질병
+        # 증상 분석기로 해당 질병에 대한 정보 가져오기 시도
+        diagnosis = symptom_analyzer.diagnose_disease(disease_name)
 
-        if last_rec and last_rec.get("departments") and len(last_rec["departments"]) > 1:
-            symptom_area = last_rec.get("symptom_area", "해당 증상")
-            symptoms = last_rec.get("symptoms", "")
-            all_depts = last_rec["departments"]
+        if diagnosis["has_diagnosis"]:
+            response_text = f"🔍 {disease_name} 관련 정보\n\n"
 
-            response_text = f"📋 다른 진료과 옵션\n\n"
-            response_text += f"'{symptoms}'에 대해 다른 진료과도 고려해볼 수 있어요:\n\n"
+            if diagnosis.get("recommended_departments"):
+                depts = diagnosis["recommended_departments"]
+                response_text += f"🏥 관련 진료과: {', '.join(depts[:2])}\n\n"
 
-            # 첫 번째 외의 다른 진료과 추천
-            for dept in all_depts[1:4]:
-                reason = get_department_reason(symptom_area, dept)
-                response_text += f"• {dept}: {reason}\n\n"
+            if diagnosis.get("diagnosis_description"):
+                response_text += f"📌 {diagnosis['diagnosis_description']}\n\n"
 
-            response_text += "💡 증상이 복잡하면 가정의학과에서 먼저 진찰받고 전문과로 의뢰받는 것도 좋아요!"
+            response_text += f"💡 정확한 진단을 위해 병원을 방문해보세요!"
 
-            quick_replies = [
-                {"label": f"서울 {dept} 찾기", "message": f"서울 {dept} 찾아줘"}
-                for dept in all_depts[1:3]
-            ]
-            quick_replies.append({"label": "가정의학과 찾기", "message": "서울 가정의학과 찾아줘"})
+            quick_replies = []
+            if diagnosis.get("recommended_departments"):
+                dept = diagnosis["recommended_departments"][0]
+                quick_replies.append({"label": f"서울 {dept} 찾기", "message": f"서울 {dept} 찾아줘"})
+            quick_replies.append({"label": "증상 다시 말하기", "message": "증상 분석해줘"})
 
             return create_kakao_response(response_text, quick_replies=quick_replies)
-        elif last_rec and last_rec.get("departments"):
-            # 추천된 진료과가 1개뿐인 경우
-            dept = last_rec["departments"][0]
-            return create_kakao_response(
-                f"현재 증상에는 {dept}가 가장 적합해 보여요.\n\n"
-                "다른 증상이 더 있으시면 말씀해주세요!",
-                quick_replies=[
-                    {"label": f"서울 {dept} 찾기", "message": f"서울 {dept} 찾아줘"},
-                    {"label": "증상 추가하기", "message": "다른 증상도 있어요"},
-                ]
-            )
         else:
             return create_kakao_response(
-                "이전 증상 분석 기록이 없어요.\n\n"
-                "증상을 말씀해주시면 적합한 진료과를 추천해드릴게요!",
+                f"'{disease_name}'에 대한 상세 정보가 없어요.\n\n"
+                "증상을 자세히 말씀해주시면 더 정확하게 분석해드릴게요!",
                 quick_replies=[
-                    {"label": "증상 말하기", "message": "배가 아파요"},
+                    {"label": "증상 말하기", "message": "증상이 어때요?"},
                     {"label": "도움말", "message": "도움말"},
                 ]
             )
 
-    # ============================================
-    # 추천 이유 설명 처리 (왜 OO과?)
-    # ============================================
-    if intent == "explain_recommendation":
-        asked_department = intent_data.get("department")
-        cache = search_session_cache[user_id]
-        last_rec = cache.get("last_recommendation")
-
-        # 1. 특정 진료과목에 대해 물어본 경우
-        if asked_department:
-            if last_rec and last_rec.get("symptom_area"):
-                symptom_area = last_rec["symptom_area"]
-                explanation = get_why_explanation(symptom_area, asked_department)
-
-                response_text = f"❓ 왜 {asked_department}를 추천했나요?\n\n"
-                response_text += explanation + "\n\n"
-
-                # 다른 진료과목 옵션도 설명
-                if symptom_area in DEPARTMENT_REASONS:
-                    other_depts = [d for d in DEPARTMENT_REASONS[symptom_area].keys() if d != asked_department]
-                    if other_depts:
-                        response_text += "📋 다른 가능성:\n"
-                        for dept in other_depts[:2]:
-                            reason = get_department_reason(symptom_area, dept)
-                            response_text += f"• {dept}: {reason}\n"
-
-                response_text += "\n💡 증상에 따라 적합한 진료과가 달라요. 추가 증상이 있으시면 알려주세요!"
-
-                quick_replies = []
-                if last_rec.get("departments"):
-                    for dept in last_rec["departments"][:2]:
-                        if dept != asked_department:
-                            quick_replies.append({
-                                "label": f"왜 {dept}?",
-                                "message": f"왜 {dept}를 추천했어?"
-                            })
-                quick_replies.append({"label": "증상 다시 말하기", "message": "증상 분석해줘"})
-
-                return create_kakao_response(response_text, quick_replies=quick_replies)
-            else:
-                # 이전 추천 정보가 없는 경우
-                reason = get_department_reason("", asked_department)
-                return create_kakao_response(
-                    f"❓ {asked_department}는요...\n\n"
-                    f"{reason}\n\n"
-                    "💡 증상을 말씀해주시면 왜 해당 진료과를 추천했는지 더 자세히 설명드릴 수 있어요!",
-                    quick_replies=[
-                        {"label": "증상 말하기", "message": "배가 아파요"},
-                        {"label": "도움말", "message": "도움말"},
-                    ]
-                )
 
-        # 2. "왜요?" 같은 단순 질문 (진료과목 없음)
-        else:
-            if last_rec and last_rec.get("departments") and last_rec.get("symptom_area"):
-                symptom_area = last_rec["symptom_area"]
-                departments = last_rec["departments"]
+async def _handle_suggest_other_departments(intent_data: dict, user_message: str, user_id: str, current_time: float) -> dict:
+    """다른 진료과 추천 요청 처리"""
+    cache = get_session(user_id)
+    last_rec = cache.last_recommendation
 
-                response_text = f"❓ 추천 이유 설명\n\n"
-                response_text += f"'{symptom_area}' 증상으로 다음 진료과를 추천드렸어요:\n\n"
+    if last_rec and last_rec.get("departments") and len(last_rec["departments"]) > 1:
+        symptom_area = last_rec.get("symptom_area", "해당 증상")
+        symptoms = last_rec.get("symptoms", "")
+        all_depts = last_rec["departments"]
 
-                for dept in departments[:3]:
-                    reason = get_department_reason(symptom_area, dept)
-                    response_text += f"• {dept}: {reason}\n"
+        response_text = f"📋 다른 진료과 옵션\n\n"
+        response_text += f"'{symptoms}'에 대해 다른 진료과도 고려해볼 수 있어요:\n\n"
 
-                response_text += "\n💡 특정 진료과에 대해 더 궁금하시면 물어봐주세요!"
+        # 첫 번째 외의 다른 진료과 추천
+        for dept in all_depts[1:4]:
+            reason = get_department_reason(symptom_area, dept)
+            response_text += f"• {dept}: {reason}\n\n"
 
-                quick_replies = [
-                    {"label": f"왜 {dept}?", "message": f"왜 {dept}?"}
-                    for dept in departments[:2]
-                ]
-                quick_replies.append({"label": "병원 찾기", "message": f"서울 {departments[0]} 찾아줘"})
+        response_text += "💡 증상이 복잡하면 가정의학과에서 먼저 진찰받고 전문과로 의뢰받는 것도 좋아요!"
 
-                return create_kakao_response(response_text, quick_replies=quick_replies)
-            else:
-                return create_kakao_response(
-                    "이전에 추천드린 진료과가 없어요.\n\n"
-                    "증상을 말씀해주시면 적합한 진료과와 이유를 알려드릴게요!",
-                    quick_replies=[
-                        {"label": "증상 말하기", "message": "배가 아파요"},
-                        {"label": "도움말", "message": "도움말"},
-                    ]
-                )
+        quick_replies = [
+            {"label": f"서울 {dept} 찾기", "message": f"서울 {dept} 찾아줘"}
+            for dept in all_depts[1:3]
+        ]
+        quick_replies.append({"label": "가정의학과 찾기", "message": "서울 가정의학과 찾아줘"})
+
+        return create_kakao_response(response_text, quick_replies=quick_replies)
+    elif last_rec and last_rec.get("departments"):
+        # 추천된 진료과가 1개뿐인 경우
+        dept = last_rec["departments"][0]
+        return create_kakao_response(
+            f"현재 증상에는 {dept}가 가장 적합해 보여요.\n\n"
+            "다른 증상이 더 있으시면 말씀해주세요!",
+            quick_replies=[
+                {"label": f"서울 {dept} 찾기", "message": f"서울 {dept} 찾아줘"},
+                {"label": "증상 추가하기", "message": "다른 증상도 있어요"},
+            ]
+        )
+    else:
+        return create_kakao_response(
+            "이전 증상 분석 기록이 없어요.\n\n"
+            "증상을 말씀해주시면 적합한 진료과를 추천해드릴게요!",
+            quick_replies=_QR_SYMPTOM_OR_HELP
+        )
+
+
+async def _handle_explain_recommendation(intent_data: dict, user_message: str, user_id: str, current_time: float) -> dict:
+    """추천 이유 설명 처리 (왜 OO과?)"""
+    asked_department = intent_data.get("department")
+    cache = get_session(user_id)
+    last_rec = cache.last_recommendation
 
-    # 다른 병원 추천 요청 처리
-    if intent == "more_hospitals":
-        cache = search_session_cache[user_id]
+    # 1. 특정 진료과목에 대해 물어본 경우
+    if asked_department:
+        if last_rec and last_rec.get("symptom_area"):
+            symptom_area = last_rec["symptom_area"]
+            explanation = get_why_explanation(symptom_area, asked_department)
 
-        if not cache["region"] or not cache["department"] or not cache["location"]:
+            parts = [
+                f"❓ 왜 {asked_department}를 추천했나요?\n\n",
+                explanation,
+                "\n\n",
+            ]
+
+            # 다른 진료과목 옵션도 설명
+            if symptom_area in DEPARTMENT_REASONS:
+                other_depts = [d for d in DEPARTMENT_REASONS[symptom_area].keys() if d != asked_department]
+                if other_depts:
+                    parts.append("📋 다른 가능성:\n")
+                    for dept in other_depts[:2]:
+                        reason = get_department_reason(symptom_area, dept)
+                        parts.append(f"• {dept}: {reason}\n")
+
+            parts.append("\n💡 증상에 따라 적합한 진료과가 달라요. 추가 증상이 있으시면 알려주세요!")
+            response_text = "".join(parts)
+
+            quick_replies = []
+            if last_rec.get("departments"):
+                for dept in last_rec["departments"][:2]:
+                    if dept != asked_department:
+                        quick_replies.append({
+                            "label": f"왜 {dept}?",
+                            "message": f"왜 {dept}를 추천했어?"
+                        })
+            quick_replies.append({"label": "증상 다시 말하기", "message": "증상 분석해줘"})
+
+            return create_kakao_response(response_text, quick_replies=quick_replies)
+        else:
+            # 이전 추천 정보가 없는 경우
+            reason = get_department_reason("", asked_department)
             return create_kakao_response(
-                "이전에 검색하신 병원 정보가 없어요.\n\n"
-                "먼저 병원을 검색해주세요!\n"
-                "예: \"홍대 이비인후과 찾아줘\"",
-                quick_replies=[
-                    {"label": "홍대 이비인후과", "message": "홍대 이비인후과 찾아줘"},
-                    {"label": "강남 피부과", "message": "강남 피부과 찾아줘"},
-                ]
+                f"❓ {asked_department}는요...\n\n"
+                f"{reason}\n\n"
+                "💡 증상을 말씀해주시면 왜 해당 진료과를 추천했는지 더 자세히 설명드릴 수 있어요!",
+                quick_replies=_QR_SYMPTOM_OR_HELP
             )
 
-        # 더 많은 병원 검색 (size를 늘려서 검색)
-        result = await kakao_client.get_nearby_hospitals(
-            x=cache["location"]["x"],
-            y=cache["location"]["y"],
-            radius=7000,  # 검색 반경 확대
-            department=cache["department"],
-            size=15,  # 더 많이 검색
-        )
-
-        if result["success"] and result.get("hospitals"):
-            hospitals = result["hospitals"]
+    # 2. "왜요?" 같은 단순 질문 (진료과목 없음)
+    else:
+        if last_rec and last_rec.get("departments") and last_rec.get("symptom_area"):
+            symptom_area = last_rec["symptom_area"]
+            departments = last_rec["departments"]
 
-            # 이미 보여준 병원 제외
-            new_hospitals = [
-                h for h in hospitals
-                if h.get("id") not in cache["shown_ids"]
+            parts = [
+                "❓ 추천 이유 설명\n\n",
+                f"'{symptom_area}' 증상으로 다음 진료과를 추천드렸어요:\n\n",
             ]
 
-            if not new_hospitals:
-                return create_kakao_response(
-                    f"{cache['region']} 주변에서 더 이상 찾을 수 있는 {cache['department']}이 없어요.\n\n"
-                    "다른 지역이나 진료과를 검색해보세요!",
-                    quick_replies=[
-                        {"label": "서울 전체 검색", "message": f"서울 {cache['department']} 찾아줘"},
-                        {"label": "다른 진료과", "message": "도움말"},
-                    ]
-                )
+            for dept in departments[:3]:
+                reason = get_department_reason(symptom_area, dept)
+                parts.append(f"• {dept}: {reason}\n")
 
-            # 새로운 병원 카드 생성
-            cards = []
-            for h in new_hospitals[:5]:
-                hospital_id = h.get("id")
-                if hospital_id:
-                    cache["shown_ids"].add(hospital_id)
-
-                name = h.get("name", "")
-                title = name if name else "병원 정보"
-
-                address = h.get("road_address") or h.get("address") or ""
-                phone = h.get("phone") or ""
-                description_parts = []
-                if address:
-                    description_parts.append(f"주소: {address}")
-                if phone:
-                    description_parts.append(f"전화: {phone}")
-                description = "\n".join(description_parts) if description_parts else "상세정보 없음"
-
-                coords = h.get("coordinates") or {}
-                x = coords.get("x")
-                y = coords.get("y")
-
-                map_url = h.get("kakao_map_url")
-                if not map_url and name and x and y:
-                    map_url = kakao_client.generate_map_url(name, x, y)
-
-                directions_url = None
-                if name and x and y:
-                    directions_url = kakao_client.generate_directions_url(
-                        dest_name=name,
-                        dest_x=x,
-                        dest_y=y,
-                        origin_x=cache["location"]["x"],
-                        origin_y=cache["location"]["y"],
-                    )
+            parts.append("\n💡 특정 진료과에 대해 더 궁금하시면 물어봐주세요!")
+            response_text = "".join(parts)
 
-                card = {
-                    "title": title,
-                    "description": description,
-                    "thumbnail": {
-                        "imageUrl": "https://t1.kakaocdn.net/openbuilder/sample/img_005.jpg"
-                    },
-                }
+            quick_replies = [
+                {"label": f"왜 {dept}?", "message": f"왜 {dept}?"}
+                for dept in departments[:2]
+            ]
+            quick_replies.append({"label": "병원 찾기", "message": f"서울 {departments[0]} 찾아줘"})
 
-                buttons = []
-                if map_url:
-                    buttons.append({
-                        "label": "카카오맵 보기",
-                        "action": "webLink",
-                        "webLinkUrl": map_url,
-                    })
-                if directions_url:
-                    buttons.append({
-                        "label": "길찾기",
-                        "action": "webLink",
-                        "webLinkUrl": directions_url,
-                    })
-                if buttons:
-                    card["buttons"] = buttons
-
-                cards.append(card)
-
-            cache["last_updated"] = current_time
-
-            return create_kakao_cards_response(
-                cards,
-                quick_replies=[
-                    {"label": "다른 병원 더 보기", "message": "다른 병원 추천해줘"},
-                ]
+            return create_kakao_response(response_text, quick_replies=quick_replies)
+        else:
+            return create_kakao_response(
+                "이전에 추천드린 진료과가 없어요.\n\n"
+                "증상을 말씀해주시면 적합한 진료과와 이유를 알려드릴게요!",
+                quick_replies=_QR_SYMPTOM_OR_HELP
             )
 
+
+async def _handle_more_hospitals(intent_data: dict, user_message: str, user_id: str, current_time: float) -> dict:
+    """다른 병원 추천 요청 처리"""
+    cache = get_session(user_id)
+
+    if not cache.region or not cache.department or not cache.location:
         return create_kakao_response(
-            f"{cache['region']} 주변에서 더 찾을 수 있는 {cache['department']}이 없어요.",
+            "이전에 검색하신 병원 정보가 없어요.\n\n"
+            "먼저 병원을 검색해주세요!\n"
+            "예: \"홍대 이비인후과 찾아줘\"",
             quick_replies=[
-                {"label": "범위 넓혀 검색", "message": f"서울 {cache['department']} 찾아줘"},
+                {"label": "홍대 이비인후과", "message": "홍대 이비인후과 찾아줘"},
+                {"label": "강남 피부과", "message": "강남 피부과 찾아줘"},
             ]
         )
 
-    # 인사
-    if intent == "greeting":
-        return create_kakao_response(
-            "안녕하세요! 🏥 MediMatch입니다.\n\n"
-            "증상을 말씀해주시면 의심 질병과 추천 진료과를 알려드리고, "
-            "주변 병원도 찾아드려요.\n\n"
-            "예시:\n"
-            "• \"머리가 아프고 어지러워요\"\n"
-            "• \"강남 피부과 찾아줘\"\n"
-            "• \"배가 아프고 설사해요\"",
-            quick_replies=[
-                {"label": "증상 분석하기", "message": "증상 분석해줘"},
-                {"label": "사용법 보기", "message": "도움말"},
-            ]
+    # 더 많은 병원 검색 (size를 늘려서 검색)
+    result = await _nearby_hospitals_shared(
+        x=cache.location["x"],
+        y=cache.location["y"],
+        radius=7000,  # 검색 반경 확대
+        department=cache.department,
+        size=15,  # 더 많이 검색
+    )
+
+    if result["success"] and result.get("hospitals"):
+        hospitals = result["hospitals"]
+
+        # 이미 보여준 병원 제외
+        new_hospitals = [
+            h for h in hospitals
+            if _HOSPITAL_ID_REGISTRY.get(h.get("id")) not in cache.shown_ids
+        ]
+
+        if not new_hospitals:
+            return create_kakao_response(
+                f"{cache.region} 주변에서 더 이상 찾을 수 있는 {cache.department}이 없어요.\n\n"
+                "다른 지역이나 진료과를 검색해보세요!",
+                quick_replies=[
+                    {"label": "서울 전체 검색", "message": f"서울 {cache.department} 찾아줘"},
+                    {"label": "다른 진료과", "message": "도움말"},
+                ]
+            )
+
+        # 새로운 병원 카드 생성
+        cards = _build_cards(
+            new_hospitals, 5, cache.location["x"], cache.location["y"], cache,
         )
 
-    # 도움말
-    if intent == "help":
-        return create_kakao_response(
-            "📋 MediMatch 사용법\n\n"
-            "1️⃣ 증상 말하기\n"
-            "\"머리가 아파요\", \"피부가 가려워요\"\n\n"
-            "2️⃣ 병원 찾기\n"
-            "\"강남 피부과\", \"홍대 근처 정형외과\"\n\n"
-            "3️⃣ 병원+약국 찾기\n"
-            "\"서면 내과랑 약국\"\n\n"
-            "증상을 자세히 설명할수록 더 정확한 분석이 가능해요!",
-            quick_replies=[
-                {"label": "증상 말하기", "message": "배가 아파요"},
-                {"label": "병원 찾기", "message": "강남 피부과 찾아줘"},
-            ]
+        cache.last_updated = current_time
+
+        return create_kakao_cards_response(
+            cards,
+            quick_replies=_QR_MORE_HOSPITALS
         )
 
-    # 증상 분석 + 병원 추천
-    if intent == "analyze_symptoms":
-        symptoms = intent_data.get("symptoms", user_message)
-        region = intent_data.get("region")
+    return create_kakao_response(
+        f"{cache.region} 주변에서 더 찾을 수 있는 {cache.department}이 없어요.",
+        quick_replies=[
+            {"label": "범위 넓혀 검색", "message": f"서울 {cache.department} 찾아줘"},
+        ]
+    )
 
-        # 증상 분석
-        diagnosis = symptom_analyzer.diagnose_disease(symptoms)
-        analysis = symptom_analyzer.analyze_symptoms(symptoms)
 
-        # 증상 부위 추출 (이유 설명용)
-        symptom_area = ""
-        body_parts = ["배", "머리", "허리", "가슴", "목", "피부", "눈", "귀", "관절", "어지러"]
-        for part in body_parts:
-            if part in symptoms:
-                symptom_area = part
-                break
+async def _handle_analyze_symptoms(intent_data: dict, user_message: str, user_id: str, current_time: float) -> dict:
+    """증상 분석 + 병원 추천"""
+    symptoms = intent_data.get("symptoms", user_message)
+    region = intent_data.get("region")
 
-        # 응답 텍스트 구성
-        response_text = ""
+    # 증상 분석
+    diagnosis = symptom_analyzer.diagnose_disease(symptoms)
+    analysis = symptom_analyzer.analyze_symptoms(symptoms)
 
-        # 질병 진단 결과
-        if diagnosis["has_diagnosis"]:
-            diseases = diagnosis["suspected_diseases"][:3]
-            response_text += f"🔍 증상 분석 결과\n\n"
-            response_text += f"의심 질병: {', '.join(diseases)}\n"
-            response_text += f"심각도: {diagnosis['severity']}\n\n"
+    # 증상 부위 (extract_intent에서 이미 추출됨 - 재스캔 방지)
+    symptom_area = intent_data.get("symptom_area", "")
 
-        # 추천 진료과
-        departments = diagnosis["recommended_departments"] if diagnosis["has_diagnosis"] else analysis["recommended_departments"]
-        if departments:
-            # 진료과목과 함께 간단한 이유 표시
-            response_text += f"🏥 추천 진료과:\n"
-            for dept in departments[:2]:
-                reason = get_department_reason(symptom_area, dept)
-                response_text += f"• {dept} - {reason}\n"
-            response_text += "\n"
-
-        # 세션 캐시에 마지막 추천 정보 저장 (이유 질문 대비)
-        cache = search_session_cache[user_id]
-        cache["last_recommendation"] = {
-            "symptom_area": symptom_area,
-            "symptoms": symptoms,
-            "departments": departments,
-            "diseases": diagnosis.get("suspected_diseases", []),
-        }
-        cache["last_updated"] = current_time
-
-        # 지역이 있으면 병원 검색
-        hospitals = []
-        if region and departments:
-            primary_dept = departments[0]
-            location = await kakao_client.get_coordinates_from_place(region)
-
-            if location["success"]:
-                result = await kakao_client.get_nearby_hospitals(
-                    x=location["x"],
-                    y=location["y"],
-                    radius=5000,
-                    department=primary_dept,
-                    size=10,  # 더 많이 검색해서 "다른 병원" 요청에 대비
-                )
-                if result["success"]:
-                    hospitals = result.get("hospitals", [])
-
-                # 세션 캐시 저장 (다른 병원 추천 기능용)
-                cache["region"] = region
-                cache["department"] = primary_dept
-                cache["location"] = {"x": location["x"], "y": location["y"]}
-                cache["shown_ids"] = set()
-                cache["last_updated"] = current_time
-
-        if hospitals:
-            response_text += f"📍 {region} 주변 {departments[0]}"
-
-            # 병원 카드 생성 (카카오맵, 길찾기 링크 포함)
-            cards = []
-            for h in hospitals[:3]:
-                # 세션 캐시에 보여준 병원 ID 저장
-                hospital_id = h.get("id")
-                if hospital_id:
-                    cache["shown_ids"].add(hospital_id)
-                name = h.get("name", "")
-                if not name:
-                    continue
-
-                address = h.get("road_address") or h.get("address") or ""
-                phone = h.get("phone") or ""
-
-                description_parts = []
-                if address:
-                    description_parts.append(f"📍 {address}")
-                if phone:
-                    description_parts.append(f"📞 {phone}")
-                description = "\n".join(description_parts) if description_parts else "상세정보 없음"
-
-                coords = h.get("coordinates") or {}
-                x = coords.get("x")
-                y = coords.get("y")
-
-                map_url = h.get("kakao_map_url")
-                if not map_url and name and x and y:
-                    map_url = kakao_client.generate_map_url(name, x, y)
-
-                directions_url = None
-                if name and x and y:
-                    directions_url = kakao_client.generate_directions_url(
-                        dest_name=name,
-                        dest_x=x,
-                        dest_y=y,
-                        origin_x=location["x"],
-                        origin_y=location["y"],
-                    )
+    # 응답 텍스트 구성
+    response_text = ""
 
-                card = {
-                    "title": name,
-                    "description": description,
-                }
+    # 질병 진단 결과
+    if diagnosis["has_diagnosis"]:
+        diseases = diagnosis["suspected_diseases"][:3]
+        response_text += f"🔍 증상 분석 결과\n\n"
+        response_text += f"의심 질병: {', '.join(diseases)}\n"
+        response_text += f"심각도: {diagnosis['severity']}\n\n"
+
+    # 추천 진료과
+    departments = diagnosis["recommended_departments"] if diagnosis["has_diagnosis"] else analysis["recommended_departments"]
+    if departments:
+        # 진료과목과 함께 간단한 이유 표시
+        response_text += f"🏥 추천 진료과:\n"
+        for dept in departments[:2]:
+            reason = get_department_reason(symptom_area, dept)
+            response_text += f"• {dept} - {reason}\n"
+        response_text += "\n"
+
+    # 세션 캐시에 마지막 추천 정보 저장 (이유 질문 대비)
+    cache = get_session(user_id)
+    cache.last_recommendation = {
+        "symptom_area": symptom_area,
+        "symptoms": symptoms,
+        "departments": departments,
+        "diseases": diagnosis.get("suspected_diseases", []),
+    }
+    cache.last_updated = current_time
 
-                buttons = []
-                if map_url:
-                    buttons.append({
-                        "label": "카카오맵 보기",
-                        "action": "webLink",
-                        "webLinkUrl": map_url,
-                    })
-                if directions_url:
-                    buttons.append({
-                        "label": "길찾기",
-                        "action": "webLink",
-                        "webLinkUrl": directions_url,
-                    })
-                if buttons:
-                    card["buttons"] = buttons
-
-                cards.append(card)
-
-            # 빠른 응답
-            quick_replies = [
-                {"label": "다른 병원 더 보기", "message": "다른 병원 추천해줘"}
-            ]
-            if departments:
-                quick_replies.append({
-                    "label": f"서울 {departments[0]} 찾기",
-                    "message": f"서울 {departments[0]} 찾아줘"
-                })
-
-            if cards:
-                # 텍스트 + 카드 캐러셀 응답
-                return create_symptom_analysis_with_cards_response(
-                    response_text, cards, quick_replies
-                )
-            else:
-                return create_kakao_response(response_text, quick_replies=quick_replies)
-        else:
-            response_text += "\n\n💡 지역을 알려주시면 주변 병원을 찾아드릴게요.\n"
-            response_text += "예: \"강남 피부과\", \"홍대 근처 정형외과\""
+    # 지역이 있으면 병원 검색
+    hospitals = []
+    if region and departments:
+        primary_dept = departments[0]
+        location = await _geocode_region(region)
 
-            # 빠른 응답
-            quick_replies = []
-            if departments:
-                quick_replies.append({
-                    "label": f"서울 {departments[0]} 찾기",
-                    "message": f"서울 {departments[0]} 찾아줘"
-                })
+        if location["success"]:
+            result = await _nearby_hospitals_shared(
+                x=location["x"],
+                y=location["y"],
+                radius=5000,
+                department=primary_dept,
+                size=10,  # 더 많이 검색해서 "다른 병원" 요청에 대비
+            )
+            if result["success"]:
+                hospitals = result.get("hospitals", [])
+
+            # 세션 캐시 저장 (다른 병원 추천 기능용)
+            cache.region = region
+            cache.department = primary_dept
+            cache.location = {"x": location["x"], "y": location["y"]}
+            cache.shown_ids.clear()  # 기존 set 객체 재사용
+            cache.last_updated = current_time
+
+    if hospitals:
+        response_text += f"📍 {region} 주변 {departments[0]}"
+
+        # 병원 카드 생성 (카카오맵, 길찾기 링크 포함)
+        cards = _build_cards(
+            hospitals, 3, location["x"], location["y"], cache,
+            addr_prefix="📍 ",
+            phone_prefix="📞 ",
+            include_thumbnail=False,
+            skip_nameless=True,
+        )
 
+        # 빠른 응답
+        quick_replies = [
+            {"label": "다른 병원 더 보기", "message": "다른 병원 추천해줘"}
+        ]
+        if departments:
+            quick_replies.append({
+                "label": f"서울 {departments[0]} 찾기",
+                "message": f"서울 {departments[0]} 찾아줘"
+            })
+
+        if cards:
+            # 텍스트 + 카드 캐러셀 응답
+            return create_symptom_analysis_with_cards_response(
+                response_text, cards, quick_replies
+            )
+        else:
             return create_kakao_response(response_text, quick_replies=quick_replies)
+    else:
+        response_text += "\n\n💡 지역을 알려주시면 주변 병원을 찾아드릴게요.\n"
+        response_text += "예: \"강남 피부과\", \"홍대 근처 정형외과\""
+
+        # 빠른 응답
+        quick_replies = []
+        if departments:
+            quick_replies.append({
+                "label": f"서울 {departments[0]} 찾기",
+                "message": f"서울 {departments[0]} 찾아줘"
+            })
+
+        return create_kakao_response(response_text, quick_replies=quick_replies)
+
+
+async def _handle_search_hospital(intent_data: dict, user_message: str, user_id: str, current_time: float) -> dict:
+    """병원 검색"""
+    region = intent_data.get("region", "서울")
+    department = intent_data.get("department")
+
+    if not department:
+        return create_kakao_response(
+            f"어떤 진료과를 찾으시나요?\n\n"
+            f"예: \"{region} 피부과\", \"{region} 정형외과\"",
+            quick_replies=[
+                {"label": "내과", "message": f"{region} 내과 찾아줘"},
+                {"label": "피부과", "message": f"{region} 피부과 찾아줘"},
+                {"label": "정형외과", "message": f"{region} 정형외과 찾아줘"},
+            ]
+        )
 
     # 병원 검색
-    if intent == "search_hospital":
-        region = intent_data.get("region", "서울")
-        department = intent_data.get("department")
+    location = await _geocode_region(region)
 
-        if not department:
-            return create_kakao_response(
-                f"어떤 진료과를 찾으시나요?\n\n"
-                f"예: \"{region} 피부과\", \"{region} 정형외과\"",
-                quick_replies=[
-                    {"label": "내과", "message": f"{region} 내과 찾아줘"},
-                    {"label": "피부과", "message": f"{region} 피부과 찾아줘"},
-                    {"label": "정형외과", "message": f"{region} 정형외과 찾아줘"},
-                ]
-            )
+    if not location["success"]:
+        return create_kakao_response(_MSG_REGION_NOT_FOUND.format(region=region))
 
-        # 병원 검색
-        location = await kakao_client.get_coordinates_from_place(region)
+    result = await _nearby_hospitals_shared(
+        x=location["x"],
+        y=location["y"],
+        radius=5000,
+        department=department,
+        size=5,
+    )
 
-        if not location["success"]:
-            return create_kakao_response(
-                f"'{region}'의 위치를 찾을 수 없어요.\n"
-                "더 구체적인 지역명을 입력해주세요.\n\n"
-                "예: 강남역, 홍대입구, 부산 서면"
-            )
+    if result["success"] and result.get("hospitals"):
+        hospitals = result["hospitals"]
 
-        result = await kakao_client.get_nearby_hospitals(
-            x=location["x"],
-            y=location["y"],
-            radius=5000,
-            department=department,
-            size=5,
+        # 세션 캐시 저장 (다른 병원 추천 기능용)
+        cache = get_session(user_id)
+        cache.region = region
+        cache.department = department
+        cache.location = {"x": location["x"], "y": location["y"]}
+        cache.shown_ids.clear()  # 기존 set 객체 재사용
+        cache.last_updated = current_time
+
+        cards = _build_cards(
+            hospitals, 5, location["x"], location["y"], cache,
         )
 
-        if result["success"] and result.get("hospitals"):
-            hospitals = result["hospitals"]
-            cards = []
+        return create_kakao_cards_response(
+            cards,
+            quick_replies=_QR_MORE_HOSPITALS
+        )
 
-            # 세션 캐시 저장 (다른 병원 추천 기능용)
-            cache = search_session_cache[user_id]
-            cache["region"] = region
-            cache["department"] = department
-            cache["location"] = {"x": location["x"], "y": location["y"]}
-            cache["shown_ids"] = set()
-            cache["last_updated"] = current_time
-
-            for h in hospitals[:5]:
-                hospital_id = h.get("id")
-                if hospital_id:
-                    cache["shown_ids"].add(hospital_id)
-
-                name = h.get("name", "")
-                title = name if name else "병원 정보"
-
-                address = h.get("road_address") or h.get("address") or ""
-                phone = h.get("phone") or ""
-                description_parts = []
-                if address:
-                    description_parts.append(f"주소: {address}")
-                if phone:
-                    description_parts.append(f"전화: {phone}")
-                description = "\n".join(description_parts) if description_parts else "상세정보 없음"
-
-                coords = h.get("coordinates") or {}
-                x = coords.get("x")
-                y = coords.get("y")
-
-                map_url = h.get("kakao_map_url")
-                if not map_url and name and x and y:
-                    map_url = kakao_client.generate_map_url(name, x, y)
-
-                directions_url = None
-                if name and x and y:
-                    directions_url = kakao_client.generate_directions_url(
-                        dest_name=name,
-                        dest_x=x,
-                        dest_y=y,
-                        origin_x=location["x"],
-                        origin_y=location["y"],
-                    )
+    else:
+        return create_kakao_response(
+            _MSG_NO_HOSPITAL.format(region=region, department=department),
+            quick_replies=[
+                {"label": "범위 넓혀 검색", "message": f"서울 {department} 찾아줘"},
+            ]
+        )
 
-                card = {
-                    "title": title,
-                    "description": description,
-                    "thumbnail": {
-                        "imageUrl": "https://t1.kakaocdn.net/openbuilder/sample/img_005.jpg"
-                    },
-                }
 
-                buttons = []
-                if map_url:
-                    buttons.append({
-                        "label": "카카오맵 보기",
-                        "action": "webLink",
-                        "webLinkUrl": map_url,
-                    })
-                if directions_url:
-                    buttons.append({
-                        "label": "길찾기",
-                        "action": "webLink",
-                        "webLinkUrl": directions_url,
-                    })
-                if buttons:
-                    card["buttons"] = buttons
-
-                cards.append(card)
-
-            return create_kakao_cards_response(
-                cards,
-                quick_replies=[
-                    {"label": "다른 병원 더 보기", "message": "다른 병원 추천해줘"},
-                ]
-            )
+async def _handle_search_pharmacy(intent_data: dict, user_message: str, user_id: str, current_time: float) -> dict:
+    """약국 검색"""
+    region = intent_data.get("region", "서울")
 
-        else:
-            return create_kakao_response(
-                f"{region} 주변에서 {department}를 찾지 못했어요.\n"
-                "검색 범위를 넓혀서 다시 찾아볼까요?",
-                quick_replies=[
-                    {"label": "범위 넓혀 검색", "message": f"서울 {department} 찾아줘"},
-                ]
-            )
+    location = await _geocode_region(region)
 
-    # 약국 검색
-    if intent == "search_pharmacy":
-        region = intent_data.get("region", "서울")
+    if location["success"]:
+        result = await kakao_client.get_nearby_pharmacies(
+            x=location["x"],
+            y=location["y"],
+            radius=3000,
+        )
 
-        location = await kakao_client.get_coordinates_from_place(region)
+        if result["success"] and result.get("pharmacies"):
+            pharmacies = result["pharmacies"]
+            # += 누적 대신 join으로 한 번에 조립 (목록이 길어져도 O(n))
+            lines = [f"💊 {region} 주변 약국\n\n"]
+            for i, p in enumerate(pharmacies[:5], 1):
+                name = p.get("name", "")
+                distance = p.get("distance", "")
+                dist_text = f" ({distance}m)" if distance else ""
+                lines.append(f"{i}. {name}{dist_text}\n")
 
-        if location["success"]:
-            result = await kakao_client.get_nearby_pharmacies(
-                x=location["x"],
-                y=location["y"],
-                radius=3000,
-            )
+            return create_kakao_response("".join(lines))
 
-            if result["success"] and result.get("pharmacies"):
-                pharmacies = result["pharmacies"]
-                response_text = f"💊 {region} 주변 약국\n\n"
+    return create_kakao_response(_MSG_NO_PHARMACY.format(region=region))
 
-                for i, p in enumerate(pharmacies[:5], 1):
-                    name = p.get("name", "")
-                    distance = p.get("distance", "")
-                    dist_text = f" ({distance}m)" if distance else ""
-                    response_text += f"{i}. {name}{dist_text}\n"
 
-                return create_kakao_response(response_text)
+async def _handle_greeting(intent_data: dict, user_message: str, user_id: str, current_time: float) -> dict:
+    """인사"""
+    return _GREETING_RESPONSE
 
-        return create_kakao_response(f"{region} 주변에서 약국을 찾지 못했어요.")
 
-    # 기본 응답
+async def _handle_help(intent_data: dict, user_message: str, user_id: str, current_time: float) -> dict:
+    """도움말"""
+    return _HELP_RESPONSE
+
+
+async def _handle_fallback(intent_data: dict, user_message: str, user_id: str, current_time: float) -> dict:
+    """기본 응답 (이해하지 못한 발화)"""
     return create_kakao_response(
         "죄송해요, 잘 이해하지 못했어요.\n\n"
         "증상을 말씀해주시거나, 찾으시는 병원 종류를 알려주세요.\n\n"
@@ -2399,8 +2798,41 @@ async def process_kakao_skill(user_message: str, user_id: str = "anonymous") ->
     )
 
 
+# 의도 -> 핸들러 디스패치 테이블 (if-elif 체인 대신 O(1) 조회)
+_INTENT_HANDLERS = {
+    "ask_disease_info": _handle_ask_disease_info,
+    "suggest_other_departments": _handle_suggest_other_departments,
+    "explain_recommendation": _handle_explain_recommendation,
+    "more_hospitals": _handle_more_hospitals,
+    "greeting": _handle_greeting,
+    "help": _handle_help,
+    "analyze_symptoms": _handle_analyze_symptoms,
+    "search_hospital": _handle_search_hospital,
+    "search_pharmacy": _handle_search_pharmacy,
+}
+
+
+async def process_kakao_skill(user_message: str, user_id: str = "anonymous") -> dict:
+    """카카오 스킬 요청 처리 (의도별 핸들러 디스패치)"""
+    intent_data = extract_intent(user_message)
+    intent = intent_data.get("intent")
+
+    # 캐시 만료 체크 — 세션이 없는 사용자는 여기서 만들지 않는다.
+    # 인사/도움말/검증 실패처럼 세션이 필요 없는 경로가 스킬 트래픽의
+    # 상당수라, 세션 생성은 실제로 쓰는 핸들러의 get_session에 미룬다.
+    current_time = time.time()
+    _touch_session(user_id, current_time)
+    session = search_session_cache.get(user_id)
+    if session is not None and current_time - session.last_updated > CACHE_EXPIRY_SECONDS:
+        session.reset()
+
+    handler = _INTENT_HANDLERS.get(intent, _handle_fallback)
+    return await handler(intent_data, user_message, user_id, current_time)
+
+
+
 @mcp.custom_route("/kakao/skill", methods=["POST"])
-async def kakao_skill_endpoint(request: Request) -> JSONResponse:
+async def kakao_skill_endpoint(request: Request) -> ORJSONResponse:
     """
     카카오 i 오픈빌더 스킬 서버 엔드포인트
 
@@ -2408,7 +2840,11 @@ async def kakao_skill_endpoint(request: Request) -> JSONResponse:
     URL: https://medimatch-mcp.onrender.com/kakao/skill
     """
     try:
-        body = await request.json()
+        # orjson이 있으면 stdlib json 대신 C 파서로 요청 본문을 읽는다
+        if orjson is not None:
+            body = orjson.loads(await request.body())
+        else:
+            body = await request.json()
 
         # 사용자 발화 및 ID 추출
         user_request = body.get("userRequest", {})
@@ -2416,29 +2852,29 @@ async def kakao_skill_endpoint(request: Request) -> JSONResponse:
         user_id = get_user_id_from_request(body)
 
         if not utterance:
-            return JSONResponse(create_kakao_response("메시지를 입력해주세요."))
+            return ORJSONResponse(create_kakao_response("메시지를 입력해주세요."))
 
         # 스킬 처리
         response = await process_kakao_skill(utterance, user_id)
-        return JSONResponse(response)
+        return ORJSONResponse(response)
 
     except Exception as e:
         error_response = create_kakao_response(
             "죄송해요, 오류가 발생했어요.\n잠시 후 다시 시도해주세요."
         )
-        return JSONResponse(error_response)
+        return ORJSONResponse(error_response)
 
 
 @mcp.custom_route("/health", methods=["GET"])
-async def health_check(request: Request) -> JSONResponse:
+async def health_check(request: Request) -> ORJSONResponse:
     """서버 상태 확인용 헬스체크 엔드포인트"""
-    return JSONResponse({"status": "ok", "service": "MediMatch MCP Server"})
+    return ORJSONResponse({"status": "ok", "service": "MediMatch MCP Server"})
 
 
 @mcp.custom_route("/", methods=["GET"])
-async def root(request: Request) -> JSONResponse:
+async def root(request: Request) -> ORJSONResponse:
     """루트 경로 - 서비스 정보 제공"""
-    return JSONResponse({
+    return ORJSONResponse({
         "service": "MediMatch",
         "description": "AI 기반 증상 분석 및 전문 병원 매칭 MCP 서버",
         "mcp_endpoint": "/mcp",
@@ -2452,6 +2888,14 @@ if __name__ == "__main__":
     import os
     from src.config import HOST, PORT
 
+    # 서버 전체가 async I/O 경로라 이벤트 루프 교체 효과가 크다.
+    # uvloop은 선택 의존성 (윈도우 미지원, 없으면 기본 루프 사용)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     print(f"🏥 MediMatch MCP Server 시작")
     print(f"📍 MCP Endpoint: http://{HOST}:{PORT}/mcp")
     print(f"💚 Health Check: http://{HOST}:{PORT}/health")
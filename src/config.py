@@ -1,5 +1,8 @@
 """설정 및 상수 정의"""
 import os
+import sys
+from types import MappingProxyType
+
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -84,6 +87,11 @@ DEPARTMENT_CODES = {
     "사상체질과": "87",
     "한방응급": "88",
 }
+# 조회 전용 테이블: 키를 intern해 짧은 한글 키 비교를 포인터 비교로 줄이고,
+# 읽기 전용 뷰로 감싸 실수로 변형되지 않게 한다.
+DEPARTMENT_CODES = MappingProxyType(
+    {sys.intern(k): v for k, v in DEPARTMENT_CODES.items()}
+)
 
 # 증상-진료과목 매핑 (AI 기반 추천을 위한 데이터)
 # 자연어 표현, 동의어, 구어체 포함
@@ -6977,6 +6985,9 @@ SIDO_CODES = {
     "경남": "380000",
     "제주": "390000",
 }
+SIDO_CODES = MappingProxyType(
+    {sys.intern(k): v for k, v in SIDO_CODES.items()}
+)
 
 # 질환/증상 → 전문 분야 키워드 매핑
 # 카카오맵 검색 시 더 정확한 병원을 찾기 위한 검색 키워드
@@ -1,5 +1,12 @@
 """공공데이터포털 병원 정보 API 클라이언트"""
+import asyncio
+
 import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
 from typing import Optional, List
 from urllib.parse import quote
 from .config import (
@@ -8,7 +15,7 @@ from .config import (
     DEPARTMENT_CODES,
     SIDO_CODES,
 )
-from .kakao_api import kakao_client
+from .kakao_api import get_kakao_client
 
 
 class HospitalAPIClient:
@@ -17,6 +24,17 @@ class HospitalAPIClient:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or DATA_GO_KR_API_KEY
         self.base_url = HIRA_HOSPITAL_API_URL
+        # 요청마다 새 클라이언트를 만들면 DNS 조회와 TLS 핸드셰이크를
+        # 매번 다시 치르므로 커넥션 풀을 인스턴스에 유지한다.
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+
+    async def aclose(self) -> None:
+        """공유 HTTP 클라이언트 종료 (서버 종료 시 호출)"""
+        await self._client.aclose()
 
     async def search_hospitals(
         self,
@@ -26,6 +44,7 @@ class HospitalAPIClient:
         hospital_name: Optional[str] = None,
         page: int = 1,
         num_of_rows: int = 10,
+        include_urls: bool = True,
     ) -> dict:
         """
         병원 정보 검색
@@ -37,6 +56,9 @@ class HospitalAPIClient:
             hospital_name: 병원명 검색어
             page: 페이지 번호
             num_of_rows: 페이지당 결과 수
+            include_urls: 카카오맵 URL 포함 여부
+                (이름/주소만 필요한 호출은 False로 주면 레코드마다
+                URL 인코딩 비용을 건너뜁니다)
 
         Returns:
             검색 결과 딕셔너리
@@ -48,58 +70,60 @@ class HospitalAPIClient:
             "_type": "json",
         }
 
-        # 진료과목 코드 변환
-        if department and department in DEPARTMENT_CODES:
-            params["dgsbjtCd"] = DEPARTMENT_CODES[department]
+        # 진료과목 코드 변환 (get 한 번으로 멤버십 확인과 조회를 겸한다)
+        if department and (dept_code := DEPARTMENT_CODES.get(department)):
+            params["dgsbjtCd"] = dept_code
 
         # 시도 코드 변환
-        if sido and sido in SIDO_CODES:
-            params["sidoCd"] = SIDO_CODES[sido]
+        if sido and (sido_code := SIDO_CODES.get(sido)):
+            params["sidoCd"] = sido_code
 
         # 병원명 검색
         if hospital_name:
             params["yadmNm"] = hospital_name
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
+            response = await self._client.get(self.base_url, params=params)
+            response.raise_for_status()
+            if orjson is not None:
+                data = orjson.loads(response.content)
+            else:
                 data = response.json()
 
-                # API 응답 구조 파싱
-                if "response" in data:
-                    body = data["response"].get("body", {})
-                    items = body.get("items", {})
-
-                    # items가 빈 문자열이거나 None인 경우 처리
-                    if not items or items == "":
-                        return {
-                            "success": True,
-                            "total_count": 0,
-                            "hospitals": [],
-                            "message": "검색 결과가 없습니다.",
-                        }
-
-                    hospital_list = items.get("item", [])
-
-                    # 단일 결과인 경우 리스트로 변환
-                    if isinstance(hospital_list, dict):
-                        hospital_list = [hospital_list]
+            # API 응답 구조 파싱
+            if "response" in data:
+                body = data["response"].get("body", {})
+                items = body.get("items", {})
 
+                # items가 빈 문자열이거나 None인 경우 처리
+                if not items or items == "":
                     return {
                         "success": True,
-                        "total_count": body.get("totalCount", 0),
-                        "hospitals": [
-                            self._parse_hospital(h) for h in hospital_list
-                        ],
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": "API 응답 형식 오류",
+                        "total_count": 0,
                         "hospitals": [],
+                        "message": "검색 결과가 없습니다.",
                     }
 
+                hospital_list = items.get("item", [])
+
+                # 단일 결과인 경우 리스트로 변환
+                if isinstance(hospital_list, dict):
+                    hospital_list = [hospital_list]
+
+                return {
+                    "success": True,
+                    "total_count": body.get("totalCount", 0),
+                    "hospitals": [
+                        self._parse_hospital(h, include_urls) for h in hospital_list
+                    ],
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": "API 응답 형식 오류",
+                    "hospitals": [],
+                }
+
         except httpx.HTTPStatusError as e:
             return {
                 "success": False,
@@ -119,32 +143,41 @@ class HospitalAPIClient:
                 "hospitals": [],
             }
 
-    def _parse_hospital(self, raw_data: dict) -> dict:
-        """API 응답 데이터를 정제된 형식으로 변환"""
+    def _parse_hospital(self, raw_data: dict, include_urls: bool = True) -> dict:
+        """API 응답 데이터를 정제된 형식으로 변환
+
+        HIRA 응답은 레코드마다 비어 있는 필드가 많아, 값이 있는 필드만
+        담아 dict 크기와 빈 문자열 할당을 줄입니다. 소비처는 모두
+        .get()으로 읽으므로 누락 키는 문제되지 않습니다.
+        """
         name = raw_data.get("yadmNm", "")
         x_pos = raw_data.get("XPos", "")
         y_pos = raw_data.get("YPos", "")
 
-        result = {
-            "name": name,
-            "address": raw_data.get("addr", ""),
-            "phone": raw_data.get("telno", ""),
-            "hospital_type": raw_data.get("clCdNm", ""),
-            "department": raw_data.get("dgsbjtCdNm", ""),
-            "doctors_count": raw_data.get("drTotCnt", 0),
-            "specialists_count": raw_data.get("sdrCnt", 0),
-            "coordinates": {
-                "lat": y_pos,
-                "lng": x_pos,
-            },
-            "sido": raw_data.get("sidoCdNm", ""),
-            "sigungu": raw_data.get("sgguCdNm", ""),
-            "medical_institution_code": raw_data.get("ykiho", ""),
-        }
-
-        # 카카오맵 URL 추가
-        if name and x_pos and y_pos:
-            result["kakao_map_url"] = kakao_client.generate_map_url(name, x_pos, y_pos)
+        result = {"name": name}
+        for key, raw_key in (
+            ("address", "addr"),
+            ("phone", "telno"),
+            ("hospital_type", "clCdNm"),
+            ("department", "dgsbjtCdNm"),
+            ("doctors_count", "drTotCnt"),
+            ("specialists_count", "sdrCnt"),
+            ("sido", "sidoCdNm"),
+            ("sigungu", "sgguCdNm"),
+            ("medical_institution_code", "ykiho"),
+        ):
+            value = raw_data.get(raw_key)
+            if value:
+                result[key] = value
+
+        if x_pos and y_pos:
+            result["coordinates"] = {"lat": y_pos, "lng": x_pos}
+
+        # 카카오맵 URL 추가 (요청된 경우, 좌표가 있는 레코드에만)
+        if include_urls and name and x_pos and y_pos:
+            result["kakao_map_url"] = get_kakao_client().generate_map_url(
+                name, x_pos, y_pos
+            )
 
         return result
 
@@ -171,6 +204,7 @@ class HospitalAPIClient:
         Returns:
             병원 검색 결과 (카카오맵 URL 포함)
         """
+        kakao_client = get_kakao_client()
         result = await kakao_client.search_hospitals_by_specialty(
             specialty=keyword,
             region=region,
@@ -223,19 +257,27 @@ class HospitalAPIClient:
         Returns:
             주변 병원 및 약국 목록
         """
-        # 병원과 약국을 병렬로 검색
-        hospital_result = await kakao_client.get_nearby_hospitals(
-            x=x,
-            y=y,
-            radius=radius,
-            department=department,
+        # 병원과 약국을 병렬로 검색 (서로 독립이므로 동시에 실행)
+        kakao_client = get_kakao_client()
+        hospital_result, pharmacy_result = await asyncio.gather(
+            kakao_client.get_nearby_hospitals(
+                x=x,
+                y=y,
+                radius=radius,
+                department=department,
+            ),
+            kakao_client.get_nearby_pharmacies(
+                x=x,
+                y=y,
+                radius=min(radius, 2000),  # 약국은 더 가까운 반경
+            ),
+            return_exceptions=True,
         )
 
-        pharmacy_result = await kakao_client.get_nearby_pharmacies(
-            x=x,
-            y=y,
-            radius=min(radius, 2000),  # 약국은 더 가까운 반경
-        )
+        if isinstance(hospital_result, BaseException):
+            hospital_result = {"success": False}
+        if isinstance(pharmacy_result, BaseException):
+            pharmacy_result = {"success": False}
 
         return {
             "success": True,
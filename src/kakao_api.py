@@ -1,7 +1,19 @@
 """카카오 로컬 API 클라이언트"""
+import asyncio
+import time
+
 import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+import json
 from typing import Optional, List
-from urllib.parse import quote
+from functools import lru_cache
+from urllib.parse import quote, urlencode
+from types import MappingProxyType
+import re
 from .config import (
     KAKAO_REST_API_KEY,
     KAKAO_KEYWORD_SEARCH_URL,
@@ -12,294 +24,575 @@ from .config import (
 )
 
 
+# 주변 검색 핫 경로에서 매 호출마다 이름→코드 조회를 피하기 위해
+# 임포트 시점에 카테고리 코드를 굳혀 둔다.
+_HOSPITAL_CODE = KAKAO_CATEGORY_CODES.get("병원", "HP8")
+_PHARMACY_CODE = KAKAO_CATEGORY_CODES.get("약국", "PM9")
+
+
+# 장소명에서 지워 버릴 위치 표현 ("홍대 근처" → "홍대")
+_NORMALIZE_RE = re.compile(r"근처|주변|부근|쪽|에서|동네")
+
+# 행정구역 접미사 포함 여부 (any() 제너레이터 대신 C 레벨 정규식 검사)
+_HAS_ADMIN_SUFFIX = re.compile(r"[시구동읍면리]").search
+
+
+@lru_cache(maxsize=2048)
+def _normalize_place_name(place_name: str) -> str:
+    """장소명 정규화 (위치 표현 제거 + 공백 정리)
+
+    순수 함수이고 인기 지명이 반복 입력되므로 결과를 메모이즈한다.
+    """
+    # 토큰별 str.replace 여섯 번 대신 컴파일한 정규식 한 번으로 훑는다
+    return " ".join(_NORMALIZE_RE.sub("", place_name).split())
+
+
+@lru_cache(maxsize=2048)
+def _generate_search_queries(place_name: str) -> tuple:
+    """다양한 검색 쿼리 생성 (순수 함수라 지명별로 결과를 메모이즈)
+
+    캐시 항목이 공유되므로 변경 불가능한 튜플을 돌려준다.
+    """
+    queries = [place_name]
+
+    # "지역명 동이름" 패턴 처리 (예: "서울 역삼동", "광주 봉선동")
+    parts = place_name.split()
+    if len(parts) >= 2:
+        # 시/도 + 동/구 패턴
+        city = parts[0]
+        rest = " ".join(parts[1:])
+
+        # 도시명 확장
+        if city in _CITY_ALIASES:
+            queries.append(f"{_CITY_ALIASES[city]} {rest}")
+
+        # 동 이름이면 그대로 검색 가능하도록
+        if rest.endswith("동") or rest.endswith("구") or rest.endswith("읍") or rest.endswith("면"):
+            queries.append(rest)  # 동 이름만으로도 검색
+            queries.append(f"{city} {rest}")
+            queries.append(f"{_CITY_ALIASES.get(city, city)} {rest}")
+
+
+    # 매핑된 쿼리 추가 (완전 일치 해시 조회 후 부분 일치 선형 탐색)
+    values = _REGION_MAPPINGS.get(place_name)
+    if values is None:
+        for key, mapped in _REGION_MAPPINGS.items():
+            if key in place_name or place_name in key:
+                values = mapped
+                break
+    if values:
+        queries.extend(values)
+
+    # 역 추가 (역이 없으면)
+    if "역" not in place_name and len(place_name) <= 4:
+        queries.append(f"{place_name}역")
+
+    # 시/구/동 추가
+    if not _HAS_ADMIN_SUFFIX(place_name):
+        queries.append(f"{place_name}동")
+        queries.append(f"{place_name}구")
+
+    # 중복 제거하면서 순서 유지 (dict는 삽입 순서를 보존)
+    return tuple(dict.fromkeys(queries))
+
+# 지오코딩 보조 테이블 — 호출마다 dict 리터럴을 다시 만들지 않도록
+# 모듈 임포트 시 한 번만 구성한다. MappingProxyType은 읽기 전용임을
+# 밝히는 용도이며, 조회 비용은 일반 dict와 같다.
+_CITY_ALIASES = MappingProxyType({
+    "서울": "서울특별시", "부산": "부산광역시", "대구": "대구광역시",
+    "인천": "인천광역시", "광주": "광주광역시", "대전": "대전광역시",
+    "울산": "울산광역시", "세종": "세종특별자치시", "경기": "경기도",
+    "강원": "강원도", "충북": "충청북도", "충남": "충청남도",
+    "전북": "전라북도", "전남": "전라남도", "경북": "경상북도",
+    "경남": "경상남도", "제주": "제주특별자치도",
+})
+
+# 세부 지역명 → 검색 쿼리 후보
+_REGION_MAPPINGS = MappingProxyType({
+        # 광주
+        "광주 첨단": ["광주광역시 첨단동", "광주 첨단지구", "첨단역"],
+        "첨단": ["광주광역시 첨단동", "광주 첨단지구", "첨단역"],
+        "광주 상무": ["광주광역시 상무지구", "상무역", "광주 상무동"],
+        "광주 충장로": ["광주광역시 충장로", "충장로역"],
+        "광주 금남로": ["광주광역시 금남로", "금남로역"],
+        "광주 봉선동": ["광주광역시 남구 봉선동", "봉선동"],
+        "광주 월산동": ["광주광역시 남구 월산동", "월산동"],
+        "광주 치평동": ["광주광역시 서구 치평동", "치평동"],
+        "광주 농성동": ["광주광역시 서구 농성동", "농성동"],
+        "광주 화정동": ["광주광역시 서구 화정동", "화정동"],
+        "광주 풍암동": ["광주광역시 서구 풍암동", "풍암동"],
+        "광주 수완동": ["광주광역시 광산구 수완동", "수완동", "수완지구"],
+        "광주 신창동": ["광주광역시 광산구 신창동", "신창동"],
+        "광주 운남동": ["광주광역시 광산구 운남동", "운남동"],
+        "광주 송정동": ["광주광역시 광산구 송정동", "광주송정역"],
+        "광주 용봉동": ["광주광역시 북구 용봉동", "용봉동"],
+        "광주 문흥동": ["광주광역시 북구 문흥동", "문흥동"],
+        "광주 두암동": ["광주광역시 북구 두암동", "두암동"],
+        "광주 동명동": ["광주광역시 동구 동명동", "동명동"],
+        "광주 계림동": ["광주광역시 동구 계림동", "계림동"],
+        "광주 학동": ["광주광역시 동구 학동", "학동"],
+
+        # 서울 - 동 단위 추가
+        "서울 역삼동": ["서울특별시 강남구 역삼동", "역삼역", "역삼동"],
+        "서울 삼성동": ["서울특별시 강남구 삼성동", "삼성역", "삼성동"],
+        "서울 논현동": ["서울특별시 강남구 논현동", "논현역", "논현동"],
+        "서울 청담동": ["서울특별시 강남구 청담동", "청담역", "청담동"],
+        "서울 신사동": ["서울특별시 강남구 신사동", "신사역", "신사동", "가로수길"],
+        "서울 압구정동": ["서울특별시 강남구 압구정동", "압구정역", "압구정동"],
+        "서울 서초동": ["서울특별시 서초구 서초동", "서초역", "서초동"],
+        "서울 방배동": ["서울특별시 서초구 방배동", "방배역", "방배동"],
+        "서울 잠원동": ["서울특별시 서초구 잠원동", "잠원역", "잠원동"],
+        "서울 반포동": ["서울특별시 서초구 반포동", "반포역", "반포동"],
+        "서울 서교동": ["서울특별시 마포구 서교동", "홍대입구역", "서교동"],
+        "서울 합정동": ["서울특별시 마포구 합정동", "합정역", "합정동"],
+        "서울 망원동": ["서울특별시 마포구 망원동", "망원역", "망원동"],
+        "서울 연남동": ["서울특별시 마포구 연남동", "연남동", "연트럴파크"],
+        "서울 상수동": ["서울특별시 마포구 상수동", "상수역", "상수동"],
+        "서울 성수동": ["서울특별시 성동구 성수동", "성수역", "성수동"],
+        "서울 왕십리동": ["서울특별시 성동구 왕십리동", "왕십리역", "왕십리동"],
+        "서울 행당동": ["서울특별시 성동구 행당동", "행당역", "행당동"],
+        "서울 이태원동": ["서울특별시 용산구 이태원동", "이태원역", "이태원동"],
+        "서울 한남동": ["서울특별시 용산구 한남동", "한남동"],
+        "서울 용산동": ["서울특별시 용산구 용산동", "용산역", "용산동"],
+
+        # 서울 - 기존 매핑
+        "홍대": ["홍대입구역", "홍익대학교", "마포구 서교동"],
+        "홍대입구": ["홍대입구역", "마포구 서교동"],
+        "강남": ["강남역", "강남구청", "서울 강남구"],
+        "강남역": ["강남역", "서울 강남구 역삼동"],
+        "신촌": ["신촌역", "연세대학교", "서대문구 신촌동"],
+        "건대": ["건대입구역", "건국대학교", "광진구 화양동"],
+        "혜화": ["혜화역", "대학로", "종로구 혜화동"],
+        "이태원": ["이태원역", "용산구 이태원동"],
+        "명동": ["명동역", "중구 명동"],
+        "종로": ["종로역", "종로구", "서울 종로"],
+        "신림": ["신림역", "관악구 신림동"],
+        "사당": ["사당역", "동작구 사당동"],
+        "잠실": ["잠실역", "송파구 잠실동"],
+        "여의도": ["여의도역", "영등포구 여의도동"],
+        "영등포": ["영등포역", "영등포구"],
+        "왕십리": ["왕십리역", "성동구 왕십리동"],
+        "동대문": ["동대문역", "동대문구"],
+        "서울역": ["서울역", "중구 남대문로"],
+        "용산": ["용산역", "용산구"],
+
+        # 경기
+        "판교": ["판교역", "성남시 분당구 판교동"],
+        "분당": ["분당구", "성남시 분당구", "서현역"],
+        "수원": ["수원역", "수원시청", "경기도 수원시"],
+        "일산": ["일산역", "고양시 일산", "일산동구"],
+        "부천": ["부천역", "부천시청", "경기도 부천시"],
+        "안양": ["안양역", "안양시청", "경기도 안양시"],
+        "의정부": ["의정부역", "의정부시청"],
+        "평택": ["평택역", "평택시청"],
+
+        # 부산 - 동 단위 추가
+        "부산 서면": ["부산광역시 부산진구 서면", "서면역"],
+        "부산 해운대동": ["부산광역시 해운대구 해운대동", "해운대역"],
+        "부산 광안동": ["부산광역시 수영구 광안동", "광안리"],
+        "부산 남천동": ["부산광역시 수영구 남천동", "남천역"],
+        "부산 전포동": ["부산광역시 부산진구 전포동", "전포역", "전포카페거리"],
+        "서면": ["서면역", "부산 부산진구 서면"],
+        "해운대": ["해운대역", "부산 해운대구"],
+        "광안리": ["광안리해수욕장", "부산 수영구 광안리"],
+        "부산역": ["부산역", "부산 동구"],
+        "센텀시티": ["센텀시티역", "부산 해운대구 우동"],
+        "남포동": ["남포역", "부산 중구 남포동"],
+
+        # 대구
+        "동성로": ["동성로", "대구 중구 동성로"],
+        "대구역": ["대구역", "대구 북구"],
+        "수성구": ["수성구청역", "대구 수성구"],
+        "대구 수성동": ["대구광역시 수성구 수성동", "수성동"],
+        "대구 범어동": ["대구광역시 수성구 범어동", "범어역", "범어동"],
+        "대구 동성로": ["대구광역시 중구 동성로", "동성로"],
+
+        # 대전
+        "둔산": ["둔산동", "대전 서구 둔산동"],
+        "대전역": ["대전역", "대전 동구"],
+        "유성": ["유성구", "대전 유성구"],
+        "대전 둔산동": ["대전광역시 서구 둔산동", "둔산동"],
+        "대전 유성동": ["대전광역시 유성구 유성동", "유성온천역"],
+
+        # 인천
+        "부평": ["부평역", "인천 부평구"],
+        "송도": ["송도역", "인천 연수구 송도동"],
+        "인천역": ["인천역", "인천 중구"],
+        "인천 송도동": ["인천광역시 연수구 송도동", "송도"],
+        "인천 부평동": ["인천광역시 부평구 부평동", "부평역"],
+
+        # 제주
+        "제주시": ["제주시청", "제주특별자치도 제주시"],
+        "서귀포": ["서귀포시청", "제주특별자치도 서귀포시"],
+        "애월": ["애월읍", "제주시 애월읍"],
+        "제주 노형동": ["제주특별자치도 제주시 노형동", "노형동"],
+        "제주 연동": ["제주특별자치도 제주시 연동", "연동", "제주 신시가지"],
+})
+
+# 주요 지역 기본 좌표 (지오코딩 폴백용)
+_REGION_COORDS = MappingProxyType({
+        # 서울 주요 지역
+        "홍대": {"x": "126.9236", "y": "37.5563", "name": "홍대입구역"},
+        "강남": {"x": "127.0276", "y": "37.4979", "name": "강남역"},
+        "신촌": {"x": "126.9368", "y": "37.5550", "name": "신촌역"},
+        "건대": {"x": "127.0702", "y": "37.5403", "name": "건대입구역"},
+        "잠실": {"x": "127.1001", "y": "37.5133", "name": "잠실역"},
+        "여의도": {"x": "126.9245", "y": "37.5217", "name": "여의도역"},
+        "명동": {"x": "126.9857", "y": "37.5636", "name": "명동역"},
+        "종로": {"x": "126.9832", "y": "37.5700", "name": "종로역"},
+        "서울역": {"x": "126.9725", "y": "37.5547", "name": "서울역"},
+
+        # 광주
+        "광주 첨단": {"x": "126.8489", "y": "35.2210", "name": "광주 첨단지구"},
+        "첨단": {"x": "126.8489", "y": "35.2210", "name": "광주 첨단지구"},
+        "광주 상무": {"x": "126.8595", "y": "35.1527", "name": "광주 상무지구"},
+        "광주": {"x": "126.8526", "y": "35.1595", "name": "광주광역시"},
+
+        # 부산
+        "서면": {"x": "129.0596", "y": "35.1578", "name": "서면역"},
+        "해운대": {"x": "129.1604", "y": "35.1631", "name": "해운대역"},
+        "부산": {"x": "129.0756", "y": "35.1796", "name": "부산역"},
+
+        # 대구
+        "동성로": {"x": "128.5968", "y": "35.8686", "name": "동성로"},
+        "대구": {"x": "128.6014", "y": "35.8714", "name": "대구역"},
+
+        # 대전
+        "둔산": {"x": "127.3845", "y": "36.3550", "name": "둔산동"},
+        "대전": {"x": "127.4339", "y": "36.3326", "name": "대전역"},
+
+        # 인천
+        "부평": {"x": "126.7235", "y": "37.4908", "name": "부평역"},
+        "송도": {"x": "126.6568", "y": "37.3863", "name": "송도역"},
+        "인천": {"x": "126.7052", "y": "37.4563", "name": "인천역"},
+
+        # 경기
+        "판교": {"x": "127.1114", "y": "37.3948", "name": "판교역"},
+        "분당": {"x": "127.1284", "y": "37.3780", "name": "서현역"},
+        "수원": {"x": "127.0012", "y": "37.2660", "name": "수원역"},
+        "일산": {"x": "126.7698", "y": "37.6558", "name": "일산역"},
+
+        # 제주
+        "제주": {"x": "126.5312", "y": "33.4996", "name": "제주시청"},
+        "서귀포": {"x": "126.5102", "y": "33.2531", "name": "서귀포시청"},
+})
+
+# 기본 위치 응답은 내용이 불변이므로 임포트 시 한 번만 만든다.
+# (지오코딩 캐시와 마찬가지로 호출자에게 공유 dict를 그대로 돌려준다.
+#  MappingProxyType은 orjson이 직렬화하지 못해 쓰지 않는다.)
+_DEFAULT_LOCATION_RESULT = {
+    "success": True,
+    "x": DEFAULT_LOCATION["x"],
+    "y": DEFAULT_LOCATION["y"],
+    "place_name": DEFAULT_LOCATION["name"],
+    "address": "서울특별시 중구 세종대로 110",
+}
+
+
+def _build_category_url(code, x, y, radius, page, size, sort) -> str:
+    """카테고리 검색 요청 URL을 통째로 조립
+
+    params= 로 넘기면 httpx가 호출마다 QueryParams 객체를 만들어
+    다시 인코딩하므로, 값이 전부 숫자/고정 코드인 이 요청은 urlencode
+    한 번으로 완성된 URL을 만들어 그대로 GET 합니다.
+    """
+    qs = urlencode(
+        {
+            "category_group_code": code,
+            "x": x,
+            "y": y,
+            "radius": radius if radius < 20000 else 20000,
+            "page": page,
+            "size": size,
+            "sort": sort,
+        }
+    )
+    return f"{KAKAO_CATEGORY_SEARCH_URL}?{qs}"
+
+
+def _loads(content: bytes) -> dict:
+    """응답 본문 파싱 (orjson이 있으면 C 파서 사용)"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@lru_cache(maxsize=1024)
+def _quote_name(name: str) -> str:
+    """장소명 URL 인코딩 결과 캐시
+
+    병원/약국 이름은 소수 인기 장소에 몰려 같은 문자열이 반복 인코딩되므로
+    퍼센트 인코딩을 캐시해 카드 루프의 문자열 처리 비용을 줄입니다.
+    영숫자 ASCII는 인코딩 결과가 원문과 같으므로 quote 자체를 건너뜁니다.
+    """
+    if name.isascii() and name.isalnum():
+        return name
+    return quote(name)
+
+
+def _parse_place(raw_data: dict, _get=dict.get) -> dict:
+    """카카오 장소 레코드를 정제된 형식으로 변환
+
+    페이지당 15건씩 도는 핫 루프라 바운드 메서드 대신 모듈 수준
+    자유 함수로 두고, dict.get도 기본 인자로 바인딩해 조회 비용을
+    줄입니다.
+    """
+    return {
+        "id": _get(raw_data, "id", ""),
+        "name": _get(raw_data, "place_name", ""),
+        "category": _get(raw_data, "category_name", ""),
+        "phone": _get(raw_data, "phone", ""),
+        "address": _get(raw_data, "address_name", ""),
+        "road_address": _get(raw_data, "road_address_name", ""),
+        "coordinates": {
+            "x": _get(raw_data, "x", ""),
+            "y": _get(raw_data, "y", ""),
+        },
+        "distance": _get(raw_data, "distance", ""),
+        "kakao_map_url": _get(raw_data, "place_url", ""),
+    }
+
+
 class KakaoLocalAPIClient:
     """카카오 로컬 API 클라이언트
 
     병원/약국 검색 및 위치 기반 서비스 제공
     """
 
+    # 지오코딩 캐시 설정 (지명→좌표는 사실상 불변이라 넉넉한 TTL)
+    _GEOCODE_TTL = 24 * 3600
+    _GEOCODE_CACHE_MAX = 2048
+
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or KAKAO_REST_API_KEY
         self.headers = {"Authorization": f"KakaoAK {self.api_key}"}
+        self._client: Optional[httpx.AsyncClient] = None
+        # 지오코딩 결과 캐시 (성공 결과만, key: 정규화한 지명)
+        self._geocode_cache: dict = {}
+        self._geocode_inflight: dict = {}
+        # 검색 호출 동시 중복 제거용 (key: 검색 종류+인자 튜플)
+        self._inflight: dict = {}
+
+    def _client_get(self) -> httpx.AsyncClient:
+        """공유 AsyncClient 반환 (최초 호출 시 생성)
+
+        호출마다 새 클라이언트를 만들면 TCP/TLS 핸드셰이크를 반복하므로
+        keep-alive 커넥션 풀 하나를 인스턴스 수명 동안 재사용합니다.
+        """
+        client = self._client
+        if client is None or client.is_closed:
+            client = self._client = httpx.AsyncClient(
+                # 단일 30초 타임아웃은 느린 응답 하나가 30초를 통째로
+                # 붙드는 것을 허용한다. 연결/읽기/쓰기를 나눠 p99를 묶는다.
+                timeout=httpx.Timeout(connect=5.0, read=10.0, write=10.0, pool=5.0),
+                # 인증 헤더는 클라이언트에 한 번만 싣는다 (호출마다 병합 방지)
+                headers=self.headers,
+                # 같은 호스트로 가는 동시 요청(gather)이 한 TLS 커넥션의
+                # 스트림으로 다중화되도록 HTTP/2 사용
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=300,
+                ),
+            )
+        return client
+
+    async def aclose(self) -> None:
+        """공유 HTTP 클라이언트 종료 (서버 종료 시 호출)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+    async def _request_with_retry(self, url: str, params=None, retries: int = 1):
+        """일시적 연결 장애에 한해 한 번 재시도하는 GET
+
+        연결 타임아웃이나 keep-alive 커넥션이 서버 쪽에서 끊긴 경우
+        (RemoteProtocolError)는 짧은 백오프 후 재시도하면 대부분
+        회복됩니다. 그 외 오류는 즉시 전파합니다.
+        """
+        client = self._client_get()
+        for attempt in range(retries + 1):
+            try:
+                if params is None:
+                    return await client.get(url)
+                return await client.get(url, params=params)
+            except (httpx.ConnectTimeout, httpx.RemoteProtocolError):
+                if attempt >= retries:
+                    raise
+                await asyncio.sleep(0.1 * 2**attempt)
+
+    async def _single_flight(self, key: tuple, run):
+        """같은 key의 동시 호출을 업스트림 요청 하나로 합친다
+
+        버스트 트래픽(동일 검색어 재시도, 새로고침)에서 외부 API 호출
+        수를 동시성 배수만큼 줄입니다. run은 인자 없는 코루틴 팩토리.
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            return await future
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await run()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            del self._inflight[key]
 
     async def get_coordinates_from_place(self, place_name: str) -> dict:
         """
         장소명/주소를 좌표로 변환 (다양한 검색 전략 적용)
 
+        같은 지명("강남역", "홍대")이 반복 조회되므로 성공 결과를
+        24시간 캐시하고, 동시 캐시 미스는 한 번의 API 호출로 합칩니다.
+
         Args:
             place_name: 장소명 또는 주소 (예: "홍대", "강남역", "광주 첨단", "서울시 강남구")
 
         Returns:
             좌표 정보 딕셔너리
         """
+        key = place_name.strip().lower()
+        now = time.monotonic()
+        entry = self._geocode_cache.get(key)
+        if entry and now - entry[0] < self._GEOCODE_TTL:
+            return entry[1]
+
+        future = self._geocode_inflight.get(key)
+        if future is not None:
+            return await future
+
+        future = asyncio.get_running_loop().create_future()
+        self._geocode_inflight[key] = future
+        try:
+            result = await self._geocode(place_name)
+            if result.get("success"):
+                if len(self._geocode_cache) >= self._GEOCODE_CACHE_MAX:
+                    oldest = min(
+                        self._geocode_cache,
+                        key=lambda k: self._geocode_cache[k][0],
+                    )
+                    del self._geocode_cache[oldest]
+                self._geocode_cache[key] = (now, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            del self._geocode_inflight[key]
+
+    async def _geocode(self, place_name: str) -> dict:
+        """캐시를 거치지 않는 실제 좌표 변환"""
         # 검색어 전처리
         normalized_name = self._normalize_place_name(place_name)
         search_queries = self._generate_search_queries(normalized_name)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # 1단계: 다양한 검색어로 키워드 검색 시도
-                for query in search_queries:
-                    response = await client.get(
+            client = self._client_get()
+            # 키워드/주소 검색을 전 쿼리에 대해 한꺼번에 발사한다.
+            # 기존에는 키워드 실패 후에야 주소 검색을 시작해 불행 경로가
+            # RTT를 두 배로 치렀다. HTTP/2 한 커넥션에서 다중화되며,
+            # 결과 선택은 기존 우선순위(키워드 > 주소, 쿼리 순서)를 따른다.
+            responses = await asyncio.gather(
+                *[
+                    client.get(
                         KAKAO_KEYWORD_SEARCH_URL,
                         params={"query": query, "size": 5},
-                        headers=self.headers,
                     )
-                    response.raise_for_status()
-                    data = response.json()
+                    for query in search_queries
+                ],
+                *[
+                    client.get(
+                        KAKAO_ADDRESS_SEARCH_URL,
+                        params={"query": query},
+                    )
+                    for query in search_queries
+                ],
+                return_exceptions=True,
+            )
+            n = len(search_queries)
+            keyword_responses = responses[:n]
+            address_responses = responses[n:]
+
+            # 1단계: 키워드 검색 결과를 쿼리 우선순위대로 확인
+            for query, response in zip(search_queries, keyword_responses):
+                if isinstance(response, BaseException):
+                    raise response
+                response.raise_for_status()
+                data = _loads(response.content)
+
+                documents = data.get("documents", [])
+                if documents:
+                    # 가장 적합한 결과 선택 (지역/장소 우선)
+                    place = self._select_best_place(documents, normalized_name)
+                    return {
+                        "success": True,
+                        "x": place.get("x"),
+                        "y": place.get("y"),
+                        "place_name": place.get("place_name", place_name),
+                        "address": place.get("address_name", ""),
+                        "search_query_used": query,
+                    }
+
+            # 2단계: 주소 검색 결과 확인
+            for query, response in zip(search_queries, address_responses):
+                if isinstance(response, BaseException):
+                    raise response
+                response.raise_for_status()
+                data = _loads(response.content)
+
+                documents = data.get("documents", [])
+                if documents:
+                    addr = documents[0]
+                    # address 응답 구조가 다름
+                    x = addr.get("x") or addr.get("address", {}).get("x") or addr.get("road_address", {}).get("x")
+                    y = addr.get("y") or addr.get("address", {}).get("y") or addr.get("road_address", {}).get("y")
 
-                    documents = data.get("documents", [])
-                    if documents:
-                        # 가장 적합한 결과 선택 (지역/장소 우선)
-                        place = self._select_best_place(documents, normalized_name)
+                    if x and y:
                         return {
                             "success": True,
-                            "x": place.get("x"),
-                            "y": place.get("y"),
-                            "place_name": place.get("place_name", place_name),
-                            "address": place.get("address_name", ""),
+                            "x": x,
+                            "y": y,
+                            "place_name": place_name,
+                            "address": addr.get("address_name", ""),
                             "search_query_used": query,
                         }
 
-                # 2단계: 주소 검색 시도
-                for query in search_queries:
-                    response = await client.get(
-                        KAKAO_ADDRESS_SEARCH_URL,
-                        params={"query": query},
-                        headers=self.headers,
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-
-                    documents = data.get("documents", [])
-                    if documents:
-                        addr = documents[0]
-                        # address 응답 구조가 다름
-                        x = addr.get("x") or addr.get("address", {}).get("x") or addr.get("road_address", {}).get("x")
-                        y = addr.get("y") or addr.get("address", {}).get("y") or addr.get("road_address", {}).get("y")
-
-                        if x and y:
-                            return {
-                                "success": True,
-                                "x": x,
-                                "y": y,
-                                "place_name": place_name,
-                                "address": addr.get("address_name", ""),
-                                "search_query_used": query,
-                            }
-
-                # 3단계: 지역명 매핑 시도
-                mapped_location = self._get_region_coordinates(normalized_name)
-                if mapped_location:
-                    return mapped_location
-
-                return {
-                    "success": False,
-                    "error": f"'{place_name}'의 위치를 찾을 수 없습니다.",
-                    "tried_queries": search_queries,
-                    "suggestion": "더 구체적인 장소명을 입력해주세요. (예: '홍대입구역', '광주광역시 첨단동')",
-                }
-
-        except Exception as e:
+            # 3단계: 지역명 매핑 시도
+            mapped_location = self._get_region_coordinates(normalized_name)
+            if mapped_location:
+                return mapped_location
+
+            return {
+                "success": False,
+                "error": f"'{place_name}'의 위치를 찾을 수 없습니다.",
+                "tried_queries": search_queries,
+                "suggestion": "더 구체적인 장소명을 입력해주세요. (예: '홍대입구역', '광주광역시 첨단동')",
+            }
+
+        except httpx.HTTPStatusError as e:
+            return {
+                "success": False,
+                "error": f"좌표 변환 오류: HTTP {e.response.status_code}",
+            }
+        except (httpx.RequestError, ValueError) as e:
             return {
                 "success": False,
                 "error": f"좌표 변환 오류: {str(e)}",
             }
 
     def _normalize_place_name(self, place_name: str) -> str:
-        """장소명 정규화"""
-        # 공백 정리
-        normalized = " ".join(place_name.split())
-
-        # 일반적인 표현 변환
-        replacements = {
-            "근처": "",
-            "주변": "",
-            "부근": "",
-            "쪽": "",
-            "에서": "",
-            "동네": "",
-        }
-        for old, new in replacements.items():
-            normalized = normalized.replace(old, new)
+        """장소명 정규화 (위치 표현 제거 + 공백 정리)"""
+        return _normalize_place_name(place_name)
 
-        return normalized.strip()
-
-    def _generate_search_queries(self, place_name: str) -> list:
+    def _generate_search_queries(self, place_name: str) -> tuple:
         """다양한 검색 쿼리 생성"""
-        queries = [place_name]
-
-        # "지역명 동이름" 패턴 처리 (예: "서울 역삼동", "광주 봉선동")
-        parts = place_name.split()
-        if len(parts) >= 2:
-            # 시/도 + 동/구 패턴
-            city_aliases = {
-                "서울": "서울특별시", "부산": "부산광역시", "대구": "대구광역시",
-                "인천": "인천광역시", "광주": "광주광역시", "대전": "대전광역시",
-                "울산": "울산광역시", "세종": "세종특별자치시", "경기": "경기도",
-                "강원": "강원도", "충북": "충청북도", "충남": "충청남도",
-                "전북": "전라북도", "전남": "전라남도", "경북": "경상북도",
-                "경남": "경상남도", "제주": "제주특별자치도",
-            }
-            city = parts[0]
-            rest = " ".join(parts[1:])
-
-            # 도시명 확장
-            if city in city_aliases:
-                queries.append(f"{city_aliases[city]} {rest}")
-
-            # 동 이름이면 그대로 검색 가능하도록
-            if rest.endswith("동") or rest.endswith("구") or rest.endswith("읍") or rest.endswith("면"):
-                queries.append(rest)  # 동 이름만으로도 검색
-                queries.append(f"{city} {rest}")
-                queries.append(f"{city_aliases.get(city, city)} {rest}")
-
-        # 지역 매핑 (세부 지역명)
-        region_mappings = {
-            # 광주
-            "광주 첨단": ["광주광역시 첨단동", "광주 첨단지구", "첨단역"],
-            "첨단": ["광주광역시 첨단동", "광주 첨단지구", "첨단역"],
-            "광주 상무": ["광주광역시 상무지구", "상무역", "광주 상무동"],
-            "광주 충장로": ["광주광역시 충장로", "충장로역"],
-            "광주 금남로": ["광주광역시 금남로", "금남로역"],
-            "광주 봉선동": ["광주광역시 남구 봉선동", "봉선동"],
-            "광주 월산동": ["광주광역시 남구 월산동", "월산동"],
-            "광주 치평동": ["광주광역시 서구 치평동", "치평동"],
-            "광주 농성동": ["광주광역시 서구 농성동", "농성동"],
-            "광주 화정동": ["광주광역시 서구 화정동", "화정동"],
-            "광주 풍암동": ["광주광역시 서구 풍암동", "풍암동"],
-            "광주 수완동": ["광주광역시 광산구 수완동", "수완동", "수완지구"],
-            "광주 신창동": ["광주광역시 광산구 신창동", "신창동"],
-            "광주 운남동": ["광주광역시 광산구 운남동", "운남동"],
-            "광주 송정동": ["광주광역시 광산구 송정동", "광주송정역"],
-            "광주 용봉동": ["광주광역시 북구 용봉동", "용봉동"],
-            "광주 문흥동": ["광주광역시 북구 문흥동", "문흥동"],
-            "광주 두암동": ["광주광역시 북구 두암동", "두암동"],
-            "광주 동명동": ["광주광역시 동구 동명동", "동명동"],
-            "광주 계림동": ["광주광역시 동구 계림동", "계림동"],
-            "광주 학동": ["광주광역시 동구 학동", "학동"],
-
-            # 서울 - 동 단위 추가
-            "서울 역삼동": ["서울특별시 강남구 역삼동", "역삼역", "역삼동"],
-            "서울 삼성동": ["서울특별시 강남구 삼성동", "삼성역", "삼성동"],
-            "서울 논현동": ["서울특별시 강남구 논현동", "논현역", "논현동"],
-            "서울 청담동": ["서울특별시 강남구 청담동", "청담역", "청담동"],
-            "서울 신사동": ["서울특별시 강남구 신사동", "신사역", "신사동", "가로수길"],
-            "서울 압구정동": ["서울특별시 강남구 압구정동", "압구정역", "압구정동"],
-            "서울 서초동": ["서울특별시 서초구 서초동", "서초역", "서초동"],
-            "서울 방배동": ["서울특별시 서초구 방배동", "방배역", "방배동"],
-            "서울 잠원동": ["서울특별시 서초구 잠원동", "잠원역", "잠원동"],
-            "서울 반포동": ["서울특별시 서초구 반포동", "반포역", "반포동"],
-            "서울 서교동": ["서울특별시 마포구 서교동", "홍대입구역", "서교동"],
-            "서울 합정동": ["서울특별시 마포구 합정동", "합정역", "합정동"],
-            "서울 망원동": ["서울특별시 마포구 망원동", "망원역", "망원동"],
-            "서울 연남동": ["서울특별시 마포구 연남동", "연남동", "연트럴파크"],
-            "서울 상수동": ["서울특별시 마포구 상수동", "상수역", "상수동"],
-            "서울 성수동": ["서울특별시 성동구 성수동", "성수역", "성수동"],
-            "서울 왕십리동": ["서울특별시 성동구 왕십리동", "왕십리역", "왕십리동"],
-            "서울 행당동": ["서울특별시 성동구 행당동", "행당역", "행당동"],
-            "서울 이태원동": ["서울특별시 용산구 이태원동", "이태원역", "이태원동"],
-            "서울 한남동": ["서울특별시 용산구 한남동", "한남동"],
-            "서울 용산동": ["서울특별시 용산구 용산동", "용산역", "용산동"],
-
-            # 서울 - 기존 매핑
-            "홍대": ["홍대입구역", "홍익대학교", "마포구 서교동"],
-            "홍대입구": ["홍대입구역", "마포구 서교동"],
-            "강남": ["강남역", "강남구청", "서울 강남구"],
-            "강남역": ["강남역", "서울 강남구 역삼동"],
-            "신촌": ["신촌역", "연세대학교", "서대문구 신촌동"],
-            "건대": ["건대입구역", "건국대학교", "광진구 화양동"],
-            "혜화": ["혜화역", "대학로", "종로구 혜화동"],
-            "이태원": ["이태원역", "용산구 이태원동"],
-            "명동": ["명동역", "중구 명동"],
-            "종로": ["종로역", "종로구", "서울 종로"],
-            "신림": ["신림역", "관악구 신림동"],
-            "사당": ["사당역", "동작구 사당동"],
-            "잠실": ["잠실역", "송파구 잠실동"],
-            "여의도": ["여의도역", "영등포구 여의도동"],
-            "영등포": ["영등포역", "영등포구"],
-            "왕십리": ["왕십리역", "성동구 왕십리동"],
-            "동대문": ["동대문역", "동대문구"],
-            "서울역": ["서울역", "중구 남대문로"],
-            "용산": ["용산역", "용산구"],
-
-            # 경기
-            "판교": ["판교역", "성남시 분당구 판교동"],
-            "분당": ["분당구", "성남시 분당구", "서현역"],
-            "수원": ["수원역", "수원시청", "경기도 수원시"],
-            "일산": ["일산역", "고양시 일산", "일산동구"],
-            "부천": ["부천역", "부천시청", "경기도 부천시"],
-            "안양": ["안양역", "안양시청", "경기도 안양시"],
-            "의정부": ["의정부역", "의정부시청"],
-            "평택": ["평택역", "평택시청"],
-
-            # 부산 - 동 단위 추가
-            "부산 서면": ["부산광역시 부산진구 서면", "서면역"],
-            "부산 해운대동": ["부산광역시 해운대구 해운대동", "해운대역"],
-            "부산 광안동": ["부산광역시 수영구 광안동", "광안리"],
-            "부산 남천동": ["부산광역시 수영구 남천동", "남천역"],
-            "부산 전포동": ["부산광역시 부산진구 전포동", "전포역", "전포카페거리"],
-            "서면": ["서면역", "부산 부산진구 서면"],
-            "해운대": ["해운대역", "부산 해운대구"],
-            "광안리": ["광안리해수욕장", "부산 수영구 광안리"],
-            "부산역": ["부산역", "부산 동구"],
-            "센텀시티": ["센텀시티역", "부산 해운대구 우동"],
-            "남포동": ["남포역", "부산 중구 남포동"],
-
-            # 대구
-            "동성로": ["동성로", "대구 중구 동성로"],
-            "대구역": ["대구역", "대구 북구"],
-            "수성구": ["수성구청역", "대구 수성구"],
-            "대구 수성동": ["대구광역시 수성구 수성동", "수성동"],
-            "대구 범어동": ["대구광역시 수성구 범어동", "범어역", "범어동"],
-            "대구 동성로": ["대구광역시 중구 동성로", "동성로"],
-
-            # 대전
-            "둔산": ["둔산동", "대전 서구 둔산동"],
-            "대전역": ["대전역", "대전 동구"],
-            "유성": ["유성구", "대전 유성구"],
-            "대전 둔산동": ["대전광역시 서구 둔산동", "둔산동"],
-            "대전 유성동": ["대전광역시 유성구 유성동", "유성온천역"],
-
-            # 인천
-            "부평": ["부평역", "인천 부평구"],
-            "송도": ["송도역", "인천 연수구 송도동"],
-            "인천역": ["인천역", "인천 중구"],
-            "인천 송도동": ["인천광역시 연수구 송도동", "송도"],
-            "인천 부평동": ["인천광역시 부평구 부평동", "부평역"],
-
-            # 제주
-            "제주시": ["제주시청", "제주특별자치도 제주시"],
-            "서귀포": ["서귀포시청", "제주특별자치도 서귀포시"],
-            "애월": ["애월읍", "제주시 애월읍"],
-            "제주 노형동": ["제주특별자치도 제주시 노형동", "노형동"],
-            "제주 연동": ["제주특별자치도 제주시 연동", "연동", "제주 신시가지"],
-        }
-
-        # 매핑된 쿼리 추가
-        for key, values in region_mappings.items():
-            if key in place_name or place_name in key:
-                queries.extend(values)
-                break
-
-        # 역 추가 (역이 없으면)
-        if "역" not in place_name and len(place_name) <= 4:
-            queries.append(f"{place_name}역")
-
-        # 시/구/동 추가
-        if not any(suffix in place_name for suffix in ["시", "구", "동", "읍", "면", "리"]):
-            queries.append(f"{place_name}동")
-            queries.append(f"{place_name}구")
-
-        # 중복 제거하면서 순서 유지
-        seen = set()
-        unique_queries = []
-        for q in queries:
-            if q not in seen:
-                seen.add(q)
-                unique_queries.append(q)
-
-        return unique_queries
+        return _generate_search_queries(place_name)
 
     def _select_best_place(self, documents: list, original_query: str) -> dict:
         """검색 결과에서 가장 적합한 장소 선택"""
@@ -321,76 +614,28 @@ class KakaoLocalAPIClient:
 
     def _get_region_coordinates(self, place_name: str) -> Optional[dict]:
         """주요 지역의 기본 좌표 반환 (폴백용)"""
-        # 광역시/도 및 주요 지역 좌표
-        region_coords = {
-            # 서울 주요 지역
-            "홍대": {"x": "126.9236", "y": "37.5563", "name": "홍대입구역"},
-            "강남": {"x": "127.0276", "y": "37.4979", "name": "강남역"},
-            "신촌": {"x": "126.9368", "y": "37.5550", "name": "신촌역"},
-            "건대": {"x": "127.0702", "y": "37.5403", "name": "건대입구역"},
-            "잠실": {"x": "127.1001", "y": "37.5133", "name": "잠실역"},
-            "여의도": {"x": "126.9245", "y": "37.5217", "name": "여의도역"},
-            "명동": {"x": "126.9857", "y": "37.5636", "name": "명동역"},
-            "종로": {"x": "126.9832", "y": "37.5700", "name": "종로역"},
-            "서울역": {"x": "126.9725", "y": "37.5547", "name": "서울역"},
-
-            # 광주
-            "광주 첨단": {"x": "126.8489", "y": "35.2210", "name": "광주 첨단지구"},
-            "첨단": {"x": "126.8489", "y": "35.2210", "name": "광주 첨단지구"},
-            "광주 상무": {"x": "126.8595", "y": "35.1527", "name": "광주 상무지구"},
-            "광주": {"x": "126.8526", "y": "35.1595", "name": "광주광역시"},
-
-            # 부산
-            "서면": {"x": "129.0596", "y": "35.1578", "name": "서면역"},
-            "해운대": {"x": "129.1604", "y": "35.1631", "name": "해운대역"},
-            "부산": {"x": "129.0756", "y": "35.1796", "name": "부산역"},
-
-            # 대구
-            "동성로": {"x": "128.5968", "y": "35.8686", "name": "동성로"},
-            "대구": {"x": "128.6014", "y": "35.8714", "name": "대구역"},
-
-            # 대전
-            "둔산": {"x": "127.3845", "y": "36.3550", "name": "둔산동"},
-            "대전": {"x": "127.4339", "y": "36.3326", "name": "대전역"},
-
-            # 인천
-            "부평": {"x": "126.7235", "y": "37.4908", "name": "부평역"},
-            "송도": {"x": "126.6568", "y": "37.3863", "name": "송도역"},
-            "인천": {"x": "126.7052", "y": "37.4563", "name": "인천역"},
-
-            # 경기
-            "판교": {"x": "127.1114", "y": "37.3948", "name": "판교역"},
-            "분당": {"x": "127.1284", "y": "37.3780", "name": "서현역"},
-            "수원": {"x": "127.0012", "y": "37.2660", "name": "수원역"},
-            "일산": {"x": "126.7698", "y": "37.6558", "name": "일산역"},
-
-            # 제주
-            "제주": {"x": "126.5312", "y": "33.4996", "name": "제주시청"},
-            "서귀포": {"x": "126.5102", "y": "33.2531", "name": "서귀포시청"},
-        }
 
-        for key, coords in region_coords.items():
-            if key in place_name or place_name in key:
-                return {
-                    "success": True,
-                    "x": coords["x"],
-                    "y": coords["y"],
-                    "place_name": coords["name"],
-                    "address": "",
-                    "source": "region_mapping",
-                }
+        coords = _REGION_COORDS.get(place_name)
+        if coords is None:
+            for key, mapped in _REGION_COORDS.items():
+                if key in place_name or place_name in key:
+                    coords = mapped
+                    break
+        if coords:
+            return {
+                "success": True,
+                "x": coords["x"],
+                "y": coords["y"],
+                "place_name": coords["name"],
+                "address": "",
+                "source": "region_mapping",
+            }
 
         return None
 
     def get_default_location(self) -> dict:
         """기본 위치(서울 시청) 반환"""
-        return {
-            "success": True,
-            "x": DEFAULT_LOCATION["x"],
-            "y": DEFAULT_LOCATION["y"],
-            "place_name": DEFAULT_LOCATION["name"],
-            "address": "서울특별시 중구 세종대로 110",
-        }
+        return _DEFAULT_LOCATION_RESULT
 
     async def search_keyword(
         self,
@@ -401,9 +646,10 @@ class KakaoLocalAPIClient:
         page: int = 1,
         size: int = 15,
         sort: str = "accuracy",
+        category_group_code: Optional[str] = None,
     ) -> dict:
         """
-        키워드로 장소 검색
+        키워드로 장소 검색 (동일 인자의 동시 호출은 한 요청으로 합침)
 
         Args:
             query: 검색 키워드 (예: "아토피 피부과", "강남 내과")
@@ -413,16 +659,33 @@ class KakaoLocalAPIClient:
             page: 페이지 번호 (1-45)
             size: 한 페이지 결과 수 (1-15)
             sort: 정렬 기준 (accuracy: 정확도순, distance: 거리순)
+            category_group_code: 카카오 카테고리 코드로 결과 제한 (예: "HP8")
 
         Returns:
             검색 결과 딕셔너리
         """
+        key = ("kw", query, x, y, radius, page, size, sort, category_group_code)
+        return await self._single_flight(
+            key,
+            lambda: self._search_keyword(
+                query, x, y, radius, page, size, sort, category_group_code
+            ),
+        )
+
+    async def _search_keyword(
+        self, query, x, y, radius, page, size, sort, category_group_code=None
+    ) -> dict:
+        """단건 키워드 검색 (single-flight 내부용)"""
         params = {
             "query": query,
             "page": page,
             "size": size,
             "sort": sort,
         }
+        # 카테고리 코드를 넘기면 카카오 쪽에서 걸러 주므로
+        # 불필요한 레코드가 응답에 실려 오지 않는다.
+        if category_group_code:
+            params["category_group_code"] = category_group_code
 
         # 위치 기반 검색
         if x and y:
@@ -431,24 +694,22 @@ class KakaoLocalAPIClient:
             params["radius"] = min(radius, 20000)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    KAKAO_KEYWORD_SEARCH_URL,
-                    params=params,
-                    headers=self.headers,
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self._request_with_retry(
+                KAKAO_KEYWORD_SEARCH_URL,
+                params=params,
+            )
+            response.raise_for_status()
+            data = _loads(response.content)
 
-                places = data.get("documents", [])
-                meta = data.get("meta", {})
+            places = data.get("documents", [])
+            meta = data.get("meta", {})
 
-                return {
-                    "success": True,
-                    "total_count": meta.get("total_count", 0),
-                    "is_end": meta.get("is_end", True),
-                    "places": [self._parse_place(p) for p in places],
-                }
+            return {
+                "success": True,
+                "total_count": meta.get("total_count", 0),
+                "is_end": meta.get("is_end", True),
+                "places": list(map(_parse_place, places)),
+            }
 
         except httpx.HTTPStatusError as e:
             return {
@@ -462,10 +723,12 @@ class KakaoLocalAPIClient:
                 "error": f"요청 오류: {str(e)}",
                 "places": [],
             }
-        except Exception as e:
+        except ValueError:
+            # orjson/json 모두 디코드 실패를 ValueError 계열로 던진다.
+            # 프로그래밍 오류는 삼키지 않고 그대로 전파시킨다.
             return {
                 "success": False,
-                "error": f"알 수 없는 오류: {str(e)}",
+                "error": "응답 파싱 오류",
                 "places": [],
             }
 
@@ -502,36 +765,31 @@ class KakaoLocalAPIClient:
             }
 
         category_code = KAKAO_CATEGORY_CODES.get(category, "HP8")
+        key = ("cat", category_code, x, y, radius, page, size, sort)
+        return await self._single_flight(
+            key,
+            lambda: self._search_category(category_code, x, y, radius, page, size, sort),
+        )
 
-        params = {
-            "category_group_code": category_code,
-            "x": x,
-            "y": y,
-            "radius": min(radius, 20000),
-            "page": page,
-            "size": size,
-            "sort": sort,
-        }
+    async def _search_category(self, code, x, y, radius, page, size, sort) -> dict:
+        """단건 카테고리 검색 (single-flight 내부용, code는 카카오 카테고리 코드)"""
+
+        url = _build_category_url(code, x, y, radius, page, size, sort)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    KAKAO_CATEGORY_SEARCH_URL,
-                    params=params,
-                    headers=self.headers,
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self._request_with_retry(url)
+            response.raise_for_status()
+            data = _loads(response.content)
 
-                places = data.get("documents", [])
-                meta = data.get("meta", {})
+            places = data.get("documents", [])
+            meta = data.get("meta", {})
 
-                return {
-                    "success": True,
-                    "total_count": meta.get("total_count", 0),
-                    "is_end": meta.get("is_end", True),
-                    "places": [self._parse_place(p) for p in places],
-                }
+            return {
+                "success": True,
+                "total_count": meta.get("total_count", 0),
+                "is_end": meta.get("is_end", True),
+                "places": list(map(_parse_place, places)),
+            }
 
         except httpx.HTTPStatusError as e:
             return {
@@ -545,13 +803,27 @@ class KakaoLocalAPIClient:
                 "error": f"요청 오류: {str(e)}",
                 "places": [],
             }
-        except Exception as e:
+        except ValueError:
+            # orjson/json 모두 디코드 실패를 ValueError 계열로 던진다.
+            # 프로그래밍 오류는 삼키지 않고 그대로 전파시킨다.
             return {
                 "success": False,
-                "error": f"알 수 없는 오류: {str(e)}",
+                "error": "응답 파싱 오류",
                 "places": [],
             }
 
+    async def _nearby_category(self, code, x, y, radius, size=15) -> dict:
+        """거리순 카테고리 검색 특화 경로
+
+        주변 병원/약국 조회는 카테고리 코드·정렬이 고정이므로 이름→코드
+        변환과 좌표 검증을 건너뛰고 바로 single-flight로 들어갑니다.
+        """
+        key = ("cat", code, x, y, radius, 1, size, "distance")
+        return await self._single_flight(
+            key,
+            lambda: self._search_category(code, x, y, radius, 1, size, "distance"),
+        )
+
     async def search_hospitals_by_specialty(
         self,
         specialty: str,
@@ -573,13 +845,9 @@ class KakaoLocalAPIClient:
         Returns:
             전문 병원 검색 결과
         """
-        # 검색 쿼리 구성
-        query_parts = [specialty]
-        if region:
-            query_parts.append(region)
-        query_parts.append("병원")
-
-        query = " ".join(query_parts)
+        # 검색 쿼리 구성 (카테고리 필터가 병원/의원을 보장하므로
+        # "병원" 토큰을 덧붙이지 않아도 된다)
+        query = f"{specialty} {region}" if region else specialty
 
         result = await self.search_keyword(
             query=query,
@@ -588,20 +856,19 @@ class KakaoLocalAPIClient:
             radius=radius,
             size=15,
             sort="accuracy",
+            category_group_code=_HOSPITAL_CODE,
         )
 
         if result["success"]:
-            # 병원 카테고리만 필터링
-            hospitals = [
-                p for p in result["places"]
-                if "병원" in p.get("category", "") or "의원" in p.get("category", "")
-            ]
+            # 카카오가 HP8(병원)으로 걸러서 반환하므로 파이썬 쪽
+            # 카테고리 부분 문자열 검사가 필요 없다.
+            hospitals = result["places"]
 
             return {
                 "success": True,
                 "specialty": specialty,
                 "region": region,
-                "total_count": len(hospitals),
+                "total_count": result.get("total_count", len(hospitals)),
                 "hospitals": hospitals,
             }
 
@@ -639,34 +906,39 @@ class KakaoLocalAPIClient:
                 f"{department} 클리닉",     # "피부과 클리닉"
             ]
 
-            for query in search_queries:
-                result = await self.search_keyword(
-                    query=query,
-                    x=x,
-                    y=y,
-                    radius=radius,
-                    size=15,
-                    sort="distance",
-                )
-                if result["success"]:
-                    for place in result.get("places", []):
-                        # 중복 제거 (ID 기준)
-                        if not any(h.get("id") == place.get("id") for h in all_hospitals):
-                            all_hospitals.append(place)
+            # 네 검색어는 서로 독립이므로 한꺼번에 발사한다
+            results = await asyncio.gather(
+                *[
+                    self.search_keyword(
+                        query=query,
+                        x=x,
+                        y=y,
+                        radius=radius,
+                        size=15,
+                        sort="distance",
+                    )
+                    for query in search_queries
+                ],
+                return_exceptions=True,
+            )
+
+            seen_ids: set = set()
+            for result in results:
+                if isinstance(result, BaseException) or not result["success"]:
+                    continue
+                for place in result.get("places", []):
+                    # 중복 제거 (ID 기준, set으로 O(1) 확인)
+                    pid = place.get("id")
+                    if pid and pid not in seen_ids:
+                        seen_ids.add(pid)
+                        all_hospitals.append(place)
 
             # 거리순 정렬
             all_hospitals.sort(key=lambda h: float(h.get("distance") or "999999"))
 
         else:
             # 진료과목이 없으면 카테고리 검색 (모든 병원/의원)
-            result = await self.search_category(
-                category="병원",
-                x=x,
-                y=y,
-                radius=radius,
-                size=15,
-                sort="distance",
-            )
+            result = await self._nearby_category(_HOSPITAL_CODE, x, y, radius)
             if result["success"]:
                 all_hospitals = result.get("places", [])
 
@@ -698,13 +970,7 @@ class KakaoLocalAPIClient:
         Returns:
             주변 약국 목록
         """
-        result = await self.search_category(
-            category="약국",
-            x=x,
-            y=y,
-            radius=radius,
-            sort="distance",
-        )
+        result = await self._nearby_category(_PHARMACY_CODE, x, y, radius)
 
         if result["success"]:
             return {
@@ -716,26 +982,70 @@ class KakaoLocalAPIClient:
 
         return result
 
-    def _parse_place(self, raw_data: dict) -> dict:
-        """카카오 API 응답 데이터를 정제된 형식으로 변환"""
+    async def find_medical_nearby(
+        self,
+        place_name: str,
+        radius_hospital: int = 5000,
+        radius_pharmacy: int = 2000,
+        department: Optional[str] = None,
+    ) -> dict:
+        """
+        지명 기준 주변 병원+약국 통합 검색
+
+        지오코딩 한 번 후 병원/약국 검색을 asyncio.gather로 동시에
+        실행합니다 (공유 HTTP/2 커넥션에서 다중화). 순차 호출 대비
+        느린 쪽 RTT 하나로 전체가 끝납니다.
+
+        Args:
+            place_name: 기준 지명 (예: "강남역", "홍대")
+            radius_hospital: 병원 검색 반경 (미터)
+            radius_pharmacy: 약국 검색 반경 (미터)
+            department: 진료과목 (선택)
+
+        Returns:
+            병원/약국 통합 검색 결과
+        """
+        location = await self.get_coordinates_from_place(place_name)
+        if not location.get("success"):
+            return {
+                "success": False,
+                "error": location.get("error", f"'{place_name}'의 위치를 찾을 수 없습니다."),
+                "tried_queries": location.get("tried_queries", []),
+                "suggestion": location.get("suggestion", ""),
+                "hospitals": [],
+                "pharmacies": [],
+            }
+
+        x = location["x"]
+        y = location["y"]
+        hospital_result, pharmacy_result = await asyncio.gather(
+            self.get_nearby_hospitals(
+                x=x, y=y, radius=radius_hospital, department=department,
+            ),
+            self.get_nearby_pharmacies(x=x, y=y, radius=radius_pharmacy),
+            return_exceptions=True,
+        )
+        if isinstance(hospital_result, BaseException):
+            hospital_result = {"success": False}
+        if isinstance(pharmacy_result, BaseException):
+            pharmacy_result = {"success": False}
+
         return {
-            "id": raw_data.get("id", ""),
-            "name": raw_data.get("place_name", ""),
-            "category": raw_data.get("category_name", ""),
-            "phone": raw_data.get("phone", ""),
-            "address": raw_data.get("address_name", ""),
-            "road_address": raw_data.get("road_address_name", ""),
-            "coordinates": {
-                "x": raw_data.get("x", ""),
-                "y": raw_data.get("y", ""),
-            },
-            "distance": raw_data.get("distance", ""),
-            "kakao_map_url": raw_data.get("place_url", ""),
+            "success": True,
+            "place_name": location.get("place_name", place_name),
+            "address": location.get("address", ""),
+            "location": {"x": x, "y": y},
+            "hospitals": hospital_result.get("hospitals", []) if hospital_result["success"] else [],
+            "pharmacies": pharmacy_result.get("pharmacies", []) if pharmacy_result["success"] else [],
         }
 
+    def _parse_place(self, raw_data: dict) -> dict:
+        """카카오 API 응답 데이터를 정제된 형식으로 변환"""
+        return _parse_place(raw_data)
+
     def generate_map_url(self, place_name: str, x: str, y: str) -> str:
         """카카오맵 URL 생성"""
-        encoded_name = quote(place_name)
+        encoded_name = _quote_name(place_name)
         return f"https://map.kakao.com/link/map/{encoded_name},{y},{x}"
 
     def generate_directions_url(
@@ -747,11 +1057,46 @@ class KakaoLocalAPIClient:
         origin_y: Optional[str] = None,
     ) -> str:
         """카카오맵 길찾기 URL 생성"""
-        encoded_name = quote(dest_name)
+        encoded_name = _quote_name(dest_name)
         if origin_x and origin_y:
             return f"https://map.kakao.com/link/to/{encoded_name},{dest_y},{dest_x}/from/{origin_y},{origin_x}"
         return f"https://map.kakao.com/link/to/{encoded_name},{dest_y},{dest_x}"
 
+    def make_directions_builder(self, origin_x: str, origin_y: str):
+        """출발지를 고정한 길찾기 URL 생성 함수 반환
+
+        병원 목록처럼 같은 출발지로 여러 URL을 만들 때
+        출발지 부분을 매번 다시 조립하지 않도록 합니다.
+        """
+        suffix = f"/from/{origin_y},{origin_x}" if origin_x and origin_y else ""
+
+        def build(dest_name: str, dest_x: str, dest_y: str) -> str:
+            return f"https://map.kakao.com/link/to/{_quote_name(dest_name)},{dest_y},{dest_x}{suffix}"
+
+        return build
+
 
 # 싱글톤 인스턴스
-kakao_client = KakaoLocalAPIClient()
+# 싱글톤 인스턴스 (최초 접근 시 생성)
+_kakao_client: Optional[KakaoLocalAPIClient] = None
+
+
+def get_kakao_client() -> KakaoLocalAPIClient:
+    """카카오 클라이언트 싱글톤 반환 (최초 호출 시 생성)
+
+    임포트 시점에 인스턴스를 만들면 카카오를 쓰지 않는 임포트
+    (테스트 수집 등)도 키 조회와 헤더 구성을 치른다. 공유
+    AsyncClient는 _client_get()이 첫 await 안에서 만들므로 실행 중인
+    이벤트 루프에 올바르게 묶인다.
+    """
+    global _kakao_client
+    if _kakao_client is None:
+        _kakao_client = KakaoLocalAPIClient()
+    return _kakao_client
+
+
+def __getattr__(name: str):
+    # 기존 `from .kakao_api import kakao_client` 임포트 호환 (PEP 562)
+    if name == "kakao_client":
+        return get_kakao_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
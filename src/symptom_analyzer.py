@@ -1,5 +1,7 @@
 """증상 분석 및 진료과목 추천 모듈"""
+import heapq
 import re
+from collections import defaultdict
 from typing import List, Dict, Tuple, Set, Optional
 from .config import (
     SYMPTOM_TO_DEPARTMENT,
@@ -11,6 +13,23 @@ from .config import (
     SYMPTOM_TO_SPECIALTY,
 )
 
+# 진료과목 설명 (호출마다 dict 리터럴을 만들지 않도록 모듈 상수로 유지)
+_DEPARTMENT_DESCRIPTIONS = {
+    "피부과": "피부 질환(아토피, 건선, 여드름, 습진 등)을 전문으로 진료합니다.",
+    "내과": "감기, 소화기 질환, 만성질환(당뇨, 고혈압) 등 내장 기관 질환을 진료합니다.",
+    "정형외과": "뼈, 관절, 근육, 인대 등 근골격계 질환을 진료합니다.",
+    "신경외과": "디스크, 척추 질환, 뇌 질환 등을 수술적으로 치료합니다.",
+    "이비인후과": "귀, 코, 목 관련 질환을 전문으로 진료합니다.",
+    "안과": "눈과 시력 관련 질환을 진료합니다.",
+    "신경과": "두통, 어지럼증, 뇌졸중 등 신경계 질환을 진료합니다.",
+    "정신건강의학과": "우울증, 불안, 불면증 등 정신건강 관련 질환을 진료합니다.",
+    "비뇨의학과": "방광, 신장, 전립선 등 비뇨기계 질환을 진료합니다.",
+    "산부인과": "여성 생식기 질환 및 임신 관련 진료를 합니다.",
+    "소아청소년과": "영유아 및 청소년의 질환을 전문으로 진료합니다.",
+    "외과": "수술이 필요한 다양한 질환을 치료합니다.",
+    "재활의학과": "손상 후 재활치료 및 만성 통증 관리를 합니다.",
+}
+
 # 응급 증상 키워드 (119 안내 필요)
 EMERGENCY_SYMPTOMS = {
     # 뇌졸중 증상 (FAST)
@@ -31,6 +50,19 @@ EMERGENCY_SYMPTOMS = {
     "경련": ["경련", "발작", "전신경련", "간질발작"],
 }
 
+# 응급 키워드 역색인: 키워드 → 해당하는 응급 유형 목록
+# ("호흡곤란"처럼 여러 유형에 속한 키워드도 모두 감지)
+_EMERGENCY_KEYWORD_TYPES: Dict[str, List[str]] = {}
+for _etype, _keywords in EMERGENCY_SYMPTOMS.items():
+    for _kw in _keywords:
+        _EMERGENCY_KEYWORD_TYPES.setdefault(_kw, []).append(_etype)
+
+# 전체 응급 키워드를 한 번의 선형 탐색으로 찾는 사전 컴파일 패턴
+# (호출마다 카테고리×키워드 이중 루프를 도는 대신 C 수준 스캔 한 번)
+_EMERGENCY_RE = re.compile(
+    "|".join(sorted(map(re.escape, _EMERGENCY_KEYWORD_TYPES), key=len, reverse=True))
+)
+
 # 응급 상황 안내 메시지
 EMERGENCY_GUIDANCE = {
     "immediate_action": "🚨 응급 상황으로 판단됩니다! 즉시 119에 전화하세요.",
@@ -43,6 +75,21 @@ EMERGENCY_GUIDANCE = {
 class SymptomAnalyzer:
     """증상을 분석하여 의심 질병과 진료과목을 추천하는 클래스"""
 
+    # 싱글톤이라 메모리 이득은 작지만, 오타 속성 대입을 막고
+    # 속성 접근을 고정 오프셋 조회로 만들기 위해 슬롯을 선언한다.
+    __slots__ = (
+        "symptom_mapping",
+        "disease_keywords",
+        "symptom_to_disease",
+        "single_symptom_to_disease",
+        "emergency_symptoms",
+        "stopwords",
+        "_specialty_pat_cache",
+        "_normalized_symptoms",
+        "_symptom_trigrams",
+        "_symptom_related_keywords",
+    )
+
     def __init__(self):
         self.symptom_mapping = SYMPTOM_TO_DEPARTMENT
         self.disease_keywords = DISEASE_KEYWORDS
@@ -51,6 +98,62 @@ class SymptomAnalyzer:
         self.emergency_symptoms = EMERGENCY_SYMPTOMS
         # 불용어 (매칭에서 제외할 단어들)
         self.stopwords = {'이', '가', '을', '를', '은', '는', '에', '의', '로', '으로', '와', '과', '도', '만', '좀', '너무', '많이', '조금', '약간', '계속', '자꾸', '요즘', '오늘', '어제', '최근'}
+        # 전문 분야 키워드 목록별 컴파일된 패턴 캐시
+        self._specialty_pat_cache: Dict[tuple, re.Pattern] = {}
+
+        # 증상 키 정규화는 입력과 무관하므로 매 호출 대신 여기서 한 번만.
+        # (정규화 키, 원본 키, 진료과 목록) 튜플을 매칭 루프가 그대로 쓴다.
+        self._normalized_symptoms = tuple(
+            (self._normalize_text(symptom), symptom, departments)
+            for symptom, departments in self.symptom_mapping.items()
+        )
+
+        # 증상 키워드별 3-그램 집합 (역방향 퍼지 매칭용).
+        # "입력의 3글자 이상 부분 문자열이 증상 키워드에 포함된다"는
+        # "두 문자열이 길이 3의 공통 부분 문자열을 가진다"와 동치이므로,
+        # 증상마다 입력의 모든 부분 문자열을 훑는 대신 3-그램 집합의
+        # 교집합 유무 한 번으로 판정한다.
+        self._symptom_trigrams: Dict[str, frozenset] = {}
+        for symptom in self.symptom_mapping:
+            normalized = self._normalize_text(symptom)
+            self._symptom_trigrams[symptom] = frozenset(
+                normalized[i:i + 3] for i in range(len(normalized) - 2)
+            )
+
+        # 증상 → 관련 질환 키워드. 질환명과의 부분 일치 비교는 입력과
+        # 무관하므로 호출마다 이중 루프를 돌지 않고 미리 합쳐 둔다.
+        self._symptom_related_keywords: Dict[str, frozenset] = {}
+        for symptom in self.symptom_mapping:
+            keywords = set()
+            for disease, disease_kws in self.disease_keywords.items():
+                if symptom in disease or disease in symptom:
+                    keywords.update(disease_kws)
+            if keywords:
+                self._symptom_related_keywords[symptom] = frozenset(keywords)
+
+    def _keyword_matcher(self, keywords: tuple) -> tuple:
+        """키워드 목록 → (룩어헤드 스캔 패턴, 대안별 포함 키워드 집합)
+
+        일반 교대 패턴은 위치마다 가장 긴 대안 하나만 보고하므로 긴
+        키워드 안에 같은 위치에서 시작하는 짧은 키워드("아토피전문" 속
+        "아토피")가 가려져 점수를 잃는다. 룩어헤드 캡처로 모든 시작
+        위치를 훑고, 매칭된 대안의 접두사인 키워드를 대안 쪽 집합에
+        흡수시켜 키워드별 부분 문자열 검사와 동일한 결과를 만든다.
+        (server.py의 INTENT_SCAN_RE와 같은 방식, 목록별로 캐시)
+        """
+        matcher = self._specialty_pat_cache.get(keywords)
+        if matcher is None:
+            lowered = sorted({k.lower() for k in keywords}, key=len, reverse=True)
+            pattern = re.compile(
+                "(?=({}))".format("|".join(map(re.escape, lowered)))
+            )
+            # 같은 위치에서 시작해 매칭될 수 있는 키워드 = 대안의 접두사
+            implied = {
+                alt: frozenset(k for k in lowered if alt.startswith(k))
+                for alt in lowered
+            }
+            matcher = self._specialty_pat_cache[keywords] = (pattern, implied)
+        return matcher
 
     def check_emergency(self, user_input: str) -> Dict:
         """
@@ -64,16 +167,17 @@ class SymptomAnalyzer:
         """
         normalized_input = self._normalize_text(user_input)
         detected_emergencies = []
+        seen_types = set()
 
-        for emergency_type, keywords in self.emergency_symptoms.items():
-            for keyword in keywords:
-                keyword_normalized = self._normalize_text(keyword)
-                if keyword_normalized in normalized_input:
+        for match in _EMERGENCY_RE.finditer(normalized_input):
+            keyword = match.group()
+            for emergency_type in _EMERGENCY_KEYWORD_TYPES[keyword]:
+                if emergency_type not in seen_types:  # 같은 카테고리 중복 방지
+                    seen_types.add(emergency_type)
                     detected_emergencies.append({
                         "type": emergency_type,
                         "matched_keyword": keyword,
                     })
-                    break  # 같은 카테고리 중복 방지
 
         if detected_emergencies:
             return {
@@ -257,24 +361,26 @@ class SymptomAnalyzer:
         # 부분 문자열 추출 (퍼지 매칭용)
         input_substrings = self._extract_symptom_keywords(user_input)
 
+        # 역방향 매칭용 입력 3-그램 집합
+        input_trigrams = {
+            normalized_input[i:i + 3] for i in range(len(normalized_input) - 2)
+        }
+
         # 매칭된 증상들
         matched_symptoms = []
         matched_symptom_keys = set()  # 중복 방지용
-        # 추천 진료과목 (점수 기반)
-        department_scores: Dict[str, float] = {}
+        # 추천 진료과목 (점수 기반, defaultdict로 이중 해싱 없이 누적)
+        department_scores: Dict[str, float] = defaultdict(float)
 
         # 증상 매칭 - 3가지 방식 시도
-        for symptom, departments in self.symptom_mapping.items():
-            symptom_normalized = self._normalize_text(symptom)
-
+        for symptom_normalized, symptom, departments in self._normalized_symptoms:
             # 1. 정확한 포함 매칭 (기존 방식)
             exact_match = symptom_normalized in normalized_input
 
             # 2. 역방향 매칭 (사용자 입력의 일부가 증상 키워드에 포함)
-            reverse_match = any(
-                sub in symptom_normalized
-                for sub in input_substrings
-                if len(sub) >= 3  # 최소 3글자 이상
+            # 3글자 이상 공통 부분 문자열 존재 여부 == 3-그램 공유 여부
+            reverse_match = not self._symptom_trigrams[symptom].isdisjoint(
+                input_trigrams
             )
 
             # 3. 증상 키워드가 입력에 포함 (정규화된 상태)
@@ -300,7 +406,7 @@ class SymptomAnalyzer:
                         # 첫 번째 진료과목에 더 높은 점수 부여
                         base_score = 1.0 / (i + 1)
                         score = base_score * match_score
-                        department_scores[dept] = department_scores.get(dept, 0) + score
+                        department_scores[dept] += score
 
         # 점수 기준 정렬
         sorted_departments = sorted(
@@ -312,12 +418,10 @@ class SymptomAnalyzer:
         # 상위 3개 진료과목 추출
         recommended_departments = [dept for dept, _ in sorted_departments[:3]]
 
-        # 관련 질환 키워드 추출
+        # 관련 질환 키워드 추출 (증상별 사전 계산 테이블 조회)
         related_keywords = set()
         for symptom in matched_symptoms:
-            for disease, keywords in self.disease_keywords.items():
-                if symptom in disease or disease in symptom:
-                    related_keywords.update(keywords)
+            related_keywords.update(self._symptom_related_keywords.get(symptom, ()))
 
         return {
             "matched_symptoms": matched_symptoms,
@@ -363,22 +467,7 @@ class SymptomAnalyzer:
 
     def get_department_description(self, department: str) -> str:
         """진료과목 설명 반환"""
-        descriptions = {
-            "피부과": "피부 질환(아토피, 건선, 여드름, 습진 등)을 전문으로 진료합니다.",
-            "내과": "감기, 소화기 질환, 만성질환(당뇨, 고혈압) 등 내장 기관 질환을 진료합니다.",
-            "정형외과": "뼈, 관절, 근육, 인대 등 근골격계 질환을 진료합니다.",
-            "신경외과": "디스크, 척추 질환, 뇌 질환 등을 수술적으로 치료합니다.",
-            "이비인후과": "귀, 코, 목 관련 질환을 전문으로 진료합니다.",
-            "안과": "눈과 시력 관련 질환을 진료합니다.",
-            "신경과": "두통, 어지럼증, 뇌졸중 등 신경계 질환을 진료합니다.",
-            "정신건강의학과": "우울증, 불안, 불면증 등 정신건강 관련 질환을 진료합니다.",
-            "비뇨의학과": "방광, 신장, 전립선 등 비뇨기계 질환을 진료합니다.",
-            "산부인과": "여성 생식기 질환 및 임신 관련 진료를 합니다.",
-            "소아청소년과": "영유아 및 청소년의 질환을 전문으로 진료합니다.",
-            "외과": "수술이 필요한 다양한 질환을 치료합니다.",
-            "재활의학과": "손상 후 재활치료 및 만성 통증 관리를 합니다.",
-        }
-        return descriptions.get(department, f"{department} 관련 질환을 진료합니다.")
+        return _DEPARTMENT_DESCRIPTIONS.get(department, f"{department} 관련 질환을 진료합니다.")
 
     def is_valid_department(self, department: str) -> bool:
         """유효한 진료과목인지 확인"""
@@ -463,7 +552,8 @@ class SymptomAnalyzer:
     def rank_hospitals_by_specialty(
         self,
         hospitals: List[Dict],
-        specialty_info: Dict
+        specialty_info: Dict,
+        top_k: Optional[int] = None,
     ) -> List[Dict]:
         """
         전문 분야 키워드를 기반으로 병원을 우선순위로 정렬합니다.
@@ -471,6 +561,7 @@ class SymptomAnalyzer:
         Args:
             hospitals: 병원 목록
             specialty_info: get_specialty_search_keywords의 반환값
+            top_k: 상위 몇 개만 필요한지 (지정 시 전체 정렬 생략)
 
         Returns:
             우선순위로 정렬된 병원 목록
@@ -478,8 +569,21 @@ class SymptomAnalyzer:
         if not specialty_info.get("has_specialty") or not hospitals:
             return hospitals
 
-        priority_keywords = specialty_info.get("priority_keywords", [])
-        specialty_keywords = specialty_info.get("specialty_keywords", [])
+        priority_keywords = tuple(specialty_info.get("priority_keywords", []))
+        specialty_keywords = tuple(specialty_info.get("specialty_keywords", []))
+        # 키워드별 `in` 검사 대신 룩어헤드 스캔 한 번으로 존재 집합을 구한다
+        priority_matcher = self._keyword_matcher(priority_keywords) if priority_keywords else None
+        specialty_matcher = self._keyword_matcher(specialty_keywords) if specialty_keywords else None
+        priority_lower = tuple(k.lower() for k in priority_keywords)
+        specialty_lower = tuple(k.lower() for k in specialty_keywords)
+
+        def _present_keywords(matcher: tuple, text: str) -> set:
+            """스캔 한 번으로 text에 부분 문자열로 존재하는 키워드 집합"""
+            pattern, implied = matcher
+            hits = set()
+            for match in pattern.finditer(text):
+                hits |= implied[match.group(1)]
+            return hits
 
         def calculate_score(hospital: Dict) -> int:
             """병원의 전문 분야 매칭 점수 계산"""
@@ -489,15 +593,15 @@ class SymptomAnalyzer:
 
             combined_text = f"{hospital_name} {hospital_category}"
 
-            # priority_keywords 매칭 (높은 점수)
-            for keyword in priority_keywords:
-                if keyword.lower() in combined_text:
-                    score += 100
+            # priority_keywords 매칭 (높은 점수) - 존재하는 키워드마다 가산
+            if priority_matcher is not None:
+                hits = _present_keywords(priority_matcher, combined_text)
+                score += 100 * sum(1 for k in priority_lower if k in hits)
 
             # specialty_keywords 매칭 (중간 점수)
-            for keyword in specialty_keywords:
-                if keyword.lower() in combined_text:
-                    score += 50
+            if specialty_matcher is not None:
+                hits = _present_keywords(specialty_matcher, combined_text)
+                score += 50 * sum(1 for k in specialty_lower if k in hits)
 
             # 전문/클리닉 키워드가 있으면 추가 점수
             if "전문" in combined_text:
@@ -518,6 +622,12 @@ class SymptomAnalyzer:
             hospital_copy["_is_specialty_match"] = score > 0
             scored_hospitals.append(hospital_copy)
 
+        # 상위 top_k개만 필요하면 전체 정렬 대신 O(N log K) 힙 선택
+        if top_k is not None and top_k < len(scored_hospitals):
+            return heapq.nlargest(
+                top_k, scored_hospitals, key=lambda h: h["_specialty_score"]
+            )
+
         # 점수 기준 내림차순 정렬
         scored_hospitals.sort(key=lambda h: h["_specialty_score"], reverse=True)
 
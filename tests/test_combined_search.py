@@ -0,0 +1,160 @@
+"""지명 기반 병원+약국 통합 검색 테스트"""
+import asyncio
+import sys
+import os
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.kakao_api import KakaoLocalAPIClient
+
+server = pytest.importorskip("server")
+
+
+class TestFindMedicalNearby:
+    """KakaoLocalAPIClient.find_medical_nearby 테스트"""
+
+    def _client(self, monkeypatch, geocode, hospitals, pharmacies):
+        """외부 호출부를 가짜로 바꾼 클라이언트 생성"""
+        client = KakaoLocalAPIClient(api_key="test-key")
+
+        async def fake_geocode(place_name):
+            return geocode
+
+        async def fake_hospitals(x, y, radius, department=None, **kwargs):
+            if isinstance(hospitals, Exception):
+                raise hospitals
+            return hospitals
+
+        async def fake_pharmacies(x, y, radius, **kwargs):
+            if isinstance(pharmacies, Exception):
+                raise pharmacies
+            return pharmacies
+
+        monkeypatch.setattr(client, "get_coordinates_from_place", fake_geocode)
+        monkeypatch.setattr(client, "get_nearby_hospitals", fake_hospitals)
+        monkeypatch.setattr(client, "get_nearby_pharmacies", fake_pharmacies)
+        return client
+
+    def test_combined_success(self, monkeypatch):
+        """지오코딩 후 병원/약국 결과를 하나로 합쳐 반환"""
+        client = self._client(
+            monkeypatch,
+            geocode={
+                "success": True,
+                "x": "127.0276",
+                "y": "37.4979",
+                "place_name": "강남역",
+                "address": "서울 강남구 역삼동",
+            },
+            hospitals={"success": True, "hospitals": [{"name": "강남의원"}]},
+            pharmacies={"success": True, "pharmacies": [{"name": "강남약국"}]},
+        )
+
+        result = asyncio.run(client.find_medical_nearby("강남역"))
+
+        assert result["success"] is True
+        assert result["place_name"] == "강남역"
+        assert result["address"] == "서울 강남구 역삼동"
+        assert result["location"] == {"x": "127.0276", "y": "37.4979"}
+        assert result["hospitals"] == [{"name": "강남의원"}]
+        assert result["pharmacies"] == [{"name": "강남약국"}]
+
+    def test_geocode_failure_carries_details(self, monkeypatch):
+        """지오코딩 실패 시 시도 쿼리와 안내 문구를 그대로 전달"""
+        client = self._client(
+            monkeypatch,
+            geocode={
+                "success": False,
+                "error": "'없는곳'의 위치를 찾을 수 없습니다.",
+                "tried_queries": ["없는곳", "없는곳역"],
+                "suggestion": "더 구체적인 장소명을 입력해주세요.",
+            },
+            hospitals={"success": True, "hospitals": []},
+            pharmacies={"success": True, "pharmacies": []},
+        )
+
+        result = asyncio.run(client.find_medical_nearby("없는곳"))
+
+        assert result["success"] is False
+        assert "없는곳" in result["error"]
+        assert result["tried_queries"] == ["없는곳", "없는곳역"]
+        assert result["suggestion"] == "더 구체적인 장소명을 입력해주세요."
+        assert result["hospitals"] == []
+        assert result["pharmacies"] == []
+
+    def test_partial_failure_keeps_other_side(self, monkeypatch):
+        """한쪽 검색이 실패해도 나머지 결과는 반환"""
+        client = self._client(
+            monkeypatch,
+            geocode={"success": True, "x": "127.0", "y": "37.5", "place_name": "강남역"},
+            hospitals=RuntimeError("병원 검색 실패"),
+            pharmacies={"success": True, "pharmacies": [{"name": "강남약국"}]},
+        )
+
+        result = asyncio.run(client.find_medical_nearby("강남역"))
+
+        assert result["success"] is True
+        assert result["hospitals"] == []
+        assert result["pharmacies"] == [{"name": "강남약국"}]
+
+
+class TestPlaceCombinedTool:
+    """search_nearby_with_pharmacy_by_place 도구가 통합 경로를 쓰는지 테스트"""
+
+    def test_tool_routes_through_combined_search(self, monkeypatch):
+        """도구가 find_medical_nearby를 호출하고 응답을 조립"""
+        calls = {}
+
+        async def fake_find(place_name, radius_hospital, radius_pharmacy, department=None):
+            calls["args"] = (place_name, radius_hospital, radius_pharmacy, department)
+            return {
+                "success": True,
+                "place_name": "강남역",
+                "address": "서울 강남구 역삼동",
+                "location": {"x": "127.0276", "y": "37.4979"},
+                "hospitals": [
+                    {"name": "강남의원", "coordinates": {"x": "127.03", "y": "37.50"}},
+                ],
+                "pharmacies": [{"name": "강남약국", "coordinates": {}}],
+            }
+
+        monkeypatch.setattr(server.kakao_client, "find_medical_nearby", fake_find)
+
+        result = asyncio.run(
+            server.search_nearby_with_pharmacy_by_place(place="강남역", radius=30000)
+        )
+
+        # 반경은 20000으로 클램프, 약국 반경은 2000으로 제한
+        assert calls["args"] == ("강남역", 20000, 2000, None)
+        assert result["success"] is True
+        assert result["search_location"]["resolved_name"] == "강남역"
+        assert result["hospitals"]["count"] == 1
+        # 좌표가 있는 항목에만 길찾기 URL 추가
+        assert "directions_url" in result["hospitals"]["list"][0]
+        assert "directions_url" not in result["pharmacies"]["list"][0]
+
+    def test_tool_geocode_failure(self, monkeypatch):
+        """지오코딩 실패 시 오류 응답에 시도 쿼리와 예시 포함"""
+
+        async def fake_find(place_name, radius_hospital, radius_pharmacy, department=None):
+            return {
+                "success": False,
+                "error": "'없는곳'의 위치를 찾을 수 없습니다.",
+                "tried_queries": ["없는곳"],
+                "suggestion": "",
+                "hospitals": [],
+                "pharmacies": [],
+            }
+
+        monkeypatch.setattr(server.kakao_client, "find_medical_nearby", fake_find)
+
+        result = asyncio.run(server.search_nearby_with_pharmacy_by_place(place="없는곳"))
+
+        assert result["success"] is False
+        assert result["tried_queries"] == ["없는곳"]
+        # 빈 안내 문구는 기본 문구로 대체
+        assert result["suggestion"] == "더 구체적인 장소명을 입력해주세요."
+        assert "examples" in result
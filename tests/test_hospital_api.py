@@ -0,0 +1,58 @@
+"""병원 정보 API 응답 파싱 테스트"""
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.hospital_api import hospital_client
+
+
+class TestParseHospital:
+    """_parse_hospital 희소 필드 변환 테스트"""
+
+    RAW = {
+        "yadmNm": "서울튼튼병원",
+        "addr": "서울특별시 강남구 역삼동 123",
+        "telno": "",  # 빈 값은 결과에서 빠져야 함
+        "clCdNm": "병원",
+        "XPos": "127.0276",
+        "YPos": "37.4979",
+        "drTotCnt": 12,
+    }
+
+    def test_empty_fields_omitted(self):
+        """값이 없는 필드는 결과 dict에 포함하지 않음"""
+        parsed = hospital_client._parse_hospital(self.RAW)
+
+        assert parsed["name"] == "서울튼튼병원"
+        assert parsed["address"] == "서울특별시 강남구 역삼동 123"
+        assert parsed["hospital_type"] == "병원"
+        assert parsed["doctors_count"] == 12
+        # 빈 문자열 전화번호와 응답에 없던 필드는 생략
+        assert "phone" not in parsed
+        assert "department" not in parsed
+        assert "sido" not in parsed
+
+    def test_include_urls_true_adds_map_url(self):
+        """좌표와 이름이 있으면 카카오맵 URL 포함"""
+        parsed = hospital_client._parse_hospital(self.RAW, include_urls=True)
+
+        assert parsed["coordinates"] == {"lat": "37.4979", "lng": "127.0276"}
+        assert "서울튼튼병원" in parsed["kakao_map_url"] or "%" in parsed["kakao_map_url"]
+
+    def test_include_urls_false_skips_map_url(self):
+        """include_urls=False면 URL 생성 자체를 건너뜀"""
+        parsed = hospital_client._parse_hospital(self.RAW, include_urls=False)
+
+        assert "kakao_map_url" not in parsed
+        # 나머지 필드는 동일하게 유지
+        assert parsed["coordinates"] == {"lat": "37.4979", "lng": "127.0276"}
+
+    def test_no_coordinates_no_map_url(self):
+        """좌표가 없으면 include_urls=True여도 URL 없음"""
+        raw = {"yadmNm": "좌표없는의원", "addr": "어딘가"}
+        parsed = hospital_client._parse_hospital(raw, include_urls=True)
+
+        assert "coordinates" not in parsed
+        assert "kakao_map_url" not in parsed
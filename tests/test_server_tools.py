@@ -0,0 +1,132 @@
+"""batch 도구 및 세션 캐시 관리 테스트"""
+import asyncio
+import sys
+import os
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+server = pytest.importorskip("server")
+
+
+class TestBatchTool:
+    """batch 도구 테스트"""
+
+    def test_empty_requests_rejected(self):
+        """빈 요청 목록은 오류"""
+        result = asyncio.run(server.batch(requests=[]))
+        assert result["success"] is False
+
+    def test_max_requests_enforced(self):
+        """최대 요청 수 초과 시 전체 거부"""
+        too_many = [
+            {"tool": "get_available_departments", "args": {}}
+        ] * (server.BATCH_MAX_REQUESTS + 1)
+
+        result = asyncio.run(server.batch(requests=too_many))
+
+        assert result["success"] is False
+        assert str(server.BATCH_MAX_REQUESTS) in result["error"]
+
+    def test_unknown_tool_isolated(self):
+        """알 수 없는 도구는 해당 항목만 실패하고 나머지는 실행"""
+        result = asyncio.run(server.batch(requests=[
+            {"tool": "없는도구", "args": {}},
+            {"tool": "get_available_departments", "args": {}},
+        ]))
+
+        assert result["success"] is True
+        assert result["count"] == 2
+        assert result["results"][0]["success"] is False
+        assert "없는도구" in result["results"][0]["error"]
+        assert "available_tools" in result["results"][0]
+        # 정상 항목은 도구 본래 응답 그대로
+        assert "all_departments" in result["results"][1]
+
+    def test_item_timeout(self, monkeypatch):
+        """항목별 제한 시간 초과 시 해당 항목만 시간 초과 오류"""
+
+        async def slow_tool():
+            await asyncio.sleep(1.0)
+            return {"success": True}
+
+        monkeypatch.setitem(server.BATCH_TOOL_REGISTRY, "slow_tool", slow_tool)
+        monkeypatch.setattr(server, "BATCH_ITEM_TIMEOUT_SECONDS", 0.01)
+
+        result = asyncio.run(server.batch(requests=[
+            {"tool": "slow_tool", "args": {}},
+            {"tool": "get_available_departments", "args": {}},
+        ]))
+
+        assert result["success"] is True
+        assert result["results"][0]["success"] is False
+        assert "시간 초과" in result["results"][0]["error"]
+        assert "all_departments" in result["results"][1]
+
+    def test_bad_args_isolated(self):
+        """잘못된 인자는 해당 항목만 인자 오류로 보고"""
+        result = asyncio.run(server.batch(requests=[
+            {"tool": "get_available_departments", "args": {"없는인자": 1}},
+        ]))
+
+        assert result["results"][0]["success"] is False
+        assert "인자 오류" in result["results"][0]["error"]
+
+
+class TestSessionCacheEviction:
+    """세션 캐시 만료/상한 정리 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, monkeypatch):
+        """테스트별로 캐시 구조를 격리"""
+        monkeypatch.setattr(server, "search_session_cache", {})
+        monkeypatch.setattr(server, "_session_heap", [])
+        monkeypatch.setattr(server, "_session_last_seen", {})
+
+    def test_expired_session_evicted(self):
+        """만료 시간이 지난 세션은 다음 접근 때 정리"""
+        now = 1_000_000.0
+        server.get_session("늙은사용자")
+        server._touch_session("늙은사용자", now)
+
+        server.get_session("새사용자")
+        server._touch_session("새사용자", now + server.CACHE_EXPIRY_SECONDS + 1)
+
+        assert "늙은사용자" not in server.search_session_cache
+        assert "새사용자" in server.search_session_cache
+
+    def test_cache_cap_evicts_oldest(self, monkeypatch):
+        """상한 초과 시 만료 전이라도 가장 오래된 세션부터 제거"""
+        monkeypatch.setattr(server, "SESSION_CACHE_MAX", 3)
+        now = 1_000_000.0
+
+        for i in range(4):
+            server.get_session(f"사용자{i}")
+            server._touch_session(f"사용자{i}", now + i)
+
+        assert len(server.search_session_cache) == 3
+        assert "사용자0" not in server.search_session_cache
+        assert "사용자3" in server.search_session_cache
+
+    def test_stale_heap_entry_does_not_evict_live_session(self, monkeypatch):
+        """힙에 남은 옛 접근 기록은 재접근한 세션을 지우지 못함"""
+        monkeypatch.setattr(server, "SESSION_CACHE_MAX", 3)
+        now = 1_000_000.0
+
+        # 사용자0이 가장 먼저 접근했지만 나중에 다시 접근 (힙에 옛 항목이 남음)
+        server.get_session("사용자0")
+        server._touch_session("사용자0", now)
+        for i in range(1, 3):
+            server.get_session(f"사용자{i}")
+            server._touch_session(f"사용자{i}", now + i)
+        server._touch_session("사용자0", now + 10)
+
+        # 상한을 넘기면 실제로 가장 오래된 사용자1이 밀려나야 함
+        server.get_session("사용자3")
+        server._touch_session("사용자3", now + 11)
+
+        assert "사용자0" in server.search_session_cache
+        assert "사용자1" not in server.search_session_cache
+        assert len(server.search_session_cache) == 3
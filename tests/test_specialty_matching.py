@@ -222,6 +222,27 @@ class TestHospitalRanking:
         assert ranked[0]["name"] == "병원1"
         assert ranked[1]["name"] == "병원2"
 
+    def test_overlapping_keywords_each_scored(self):
+        """겹치는 키워드는 각각 점수에 반영 (긴 키워드가 짧은 키워드를 가리지 않음)"""
+        hospitals = [
+            {"name": "서울아토피전문피부과의원", "category_name": "피부과"},
+            {"name": "강남피부과", "category_name": "피부과"},
+        ]
+        # "아토피"는 "아토피전문"에, "피부"는 "피부과"에 포함되는 겹침 구성
+        specialty_info = {
+            "has_specialty": True,
+            "priority_keywords": ["아토피", "아토피전문", "피부과"],
+            "specialty_keywords": ["피부"],
+        }
+
+        ranked = symptom_analyzer.rank_hospitals_by_specialty(hospitals, specialty_info)
+        scores = {h["name"]: h["_specialty_score"] for h in ranked}
+
+        # 아토피(100) + 아토피전문(100) + 피부과(100) + 피부(50) + 전문(30)
+        assert scores["서울아토피전문피부과의원"] == 380
+        # 피부과(100) + 피부(50)
+        assert scores["강남피부과"] == 150
+
     def test_specialty_score_calculation(self):
         """전문 분야 점수 계산"""
         hospitals = [